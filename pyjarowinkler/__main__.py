@@ -0,0 +1,11 @@
+"""Entry point of `python -m pyjarowinkler`."""
+
+import sys
+from typing import Final
+
+from pyjarowinkler.cli import main
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,693 @@
+"""
+Table of ambiguous or similar unicode glyphs, imported by `pyjarowinkler.glyph` the first time it is used.
+
+Each run holds its first code point and the replacement of each consecutive code point from there, one character each when
+the run is a string.
+
+Some code points map to an empty string intentionally — these are invisible or
+formatting characters (zero-width joiners, decorative underscores, etc.) that
+have no meaningful ASCII equivalent and should be dropped during normalization.
+"""
+
+from typing import Final
+
+from pyjarowinkler.glyph import GlyphMap
+
+AMBIGUOUS: Final[GlyphMap] = GlyphMap(
+    (
+        (0xA0, " "),
+        (0xB4, "`\u03bc"),
+        (0xB8, ","),
+        (0xC0, "AAAAAA"),
+        (0xC7, "CEEEEIIII"),
+        (0xD1, "NOOOOOxOUUUUY"),
+        (0xE0, "aaaaaa"),
+        (0xE7, "ceeeeiiii"),
+        (0xF1, "nooooo"),
+        (0xF8, "ouuuuy"),
+        (0xFF, "y"),
+        (0x131, "i"),
+        (0x17F, "f"),
+        (0x184, "b"),
+        (0x18D, "g"),
+        (0x1A6, "R2"),
+        (0x1B7, "3"),
+        (0x1BC, "5s"),
+        (0x1C0, "I"),
+        (0x1C3, "!"),
+        (0x21C, "3"),
+        (0x222, "88"),
+        (0x241, "?"),
+        (0x251, "a"),
+        (0x261, "g"),
+        (0x263, "y"),
+        (0x269, "ii"),
+        (0x26F, "w"),
+        (0x28B, "u"),
+        (0x28F, "y"),
+        (0x294, "?"),
+        (0x2B9, "`"),
+        (0x2BB, "````"),
+        (0x2C2, "<>^"),
+        (0x2C6, "^"),
+        (0x2C8, "`"),
+        (0x2CA, "``"),
+        (0x2D0, ":"),
+        (0x2D7, "-"),
+        (0x2DB, "i~"),
+        (0x2F4, "`"),
+        (0x2F8, ":"),
+        (0x374, "`"),
+        (0x37A, "i"),
+        (0x37E, ";J"),
+        (0x384, "`"),
+        (0x391, "AB"),
+        (0x395, "EZH"),
+        (0x399, "IK"),
+        (0x39C, "MN"),
+        (0x39F, "O"),
+        (0x3A1, "P"),
+        (0x3A4, "TY"),
+        (0x3A7, "X"),
+        (0x3B1, "a"),
+        (0x3B3, "y"),
+        (0x3B9, "i"),
+        (0x3BD, "v"),
+        (0x3BF, "o"),
+        (0x3C1, "p"),
+        (0x3C3, "o"),
+        (0x3C5, "u"),
+        (0x3D2, "Y"),
+        (0x3DC, "F"),
+        (0x3E8, "2"),
+        (0x3F1, "pcj"),
+        (0x3F9, "CM"),
+        (0x405, "SI"),
+        (0x408, "J"),
+        (0x410, "A"),
+        (0x412, "B"),
+        (0x415, "E"),
+        (0x417, "3"),
+        (0x41A, "K"),
+        (0x41C, "MHO"),
+        (0x420, "PCTY"),
+        (0x425, "X"),
+        (0x42C, "b"),
+        (0x430, "a6"),
+        (0x433, "r"),
+        (0x435, "e"),
+        (0x43E, "o"),
+        (0x440, "pc"),
+        (0x443, "y"),
+        (0x445, "x"),
+        (0x455, "si"),
+        (0x458, "j"),
+        (0x461, "w"),
+        (0x474, "Vv"),
+        (0x4AE, "Yy"),
+        (0x4BB, "h"),
+        (0x4BD, "e"),
+        (0x4C0, "I"),
+        (0x4CF, "i"),
+        (0x4E0, "3"),
+        (0x501, "d"),
+        (0x50C, "G"),
+        (0x51B, "qWw"),
+        (0x54D, "U"),
+        (0x54F, "S"),
+        (0x555, "O"),
+        (0x55A, "`"),
+        (0x55D, "`"),
+        (0x561, "w"),
+        (0x563, "q"),
+        (0x566, "q"),
+        (0x570, "h"),
+        (0x578, "n"),
+        (0x57C, "nu"),
+        (0x581, "g"),
+        (0x584, "fo"),
+        (0x589, ":"),
+        (0x5C0, "l"),
+        (0x5C3, ":"),
+        (0x5D5, "l"),
+        (0x5D8, "v`"),
+        (0x5DF, "l"),
+        (0x5E1, "o"),
+        (0x5F3, "`"),
+        (0x60D, ","),
+        (0x627, "l"),
+        (0x647, "o"),
+        (0x660, ".l"),
+        (0x665, "o"),
+        (0x667, "V"),
+        (0x66B, ","),
+        (0x66D, "*"),
+        (0x6BE, "o"),
+        (0x6C1, "o"),
+        (0x6D4, "-o"),
+        (0x6F0, ".I"),
+        (0x6F5, "o"),
+        (0x6F7, "V"),
+        (0x701, "..::"),
+        (0x7C0, "O"),
+        (0x7CA, "l"),
+        (0x7F4, "``"),
+        (0x7FA, ("",)),
+        (0x903, ":"),
+        (0x966, "o"),
+        (0x97D, "?"),
+        (0x9E6, "O"),
+        (0x9EA, "8"),
+        (0x9ED, "9"),
+        (0xA66, "o9"),
+        (0xA6A, "8"),
+        (0xA83, ":"),
+        (0xAE6, "o"),
+        (0xB03, "8"),
+        (0xB20, "O"),
+        (0xB66, "O"),
+        (0xB68, "9"),
+        (0xBE6, "o"),
+        (0xC02, "o"),
+        (0xC66, "o"),
+        (0xC82, "o"),
+        (0xCE6, "o"),
+        (0xD02, "o"),
+        (0xD20, "o"),
+        (0xD66, "o"),
+        (0xD6D, "9"),
+        (0xD82, "o"),
+        (0xE50, "o"),
+        (0xED0, "o"),
+        (0x101D, "o"),
+        (0x1040, "o"),
+        (0x10E7, "y"),
+        (0x10FF, "o"),
+        (0x1200, "U"),
+        (0x12D0, "O"),
+        (0x13A0, "DRT"),
+        (0x13A5, "i"),
+        (0x13A9, "YAJE"),
+        (0x13AE, "?"),
+        (0x13B3, "W"),
+        (0x13B7, "M"),
+        (0x13BB, "H"),
+        (0x13BD, "Y"),
+        (0x13C0, "G"),
+        (0x13C2, "hZ"),
+        (0x13CE, "4b"),
+        (0x13D2, "R"),
+        (0x13D4, "WS"),
+        (0x13D9, "VS"),
+        (0x13DE, "LC"),
+        (0x13E2, "P"),
+        (0x13E6, "Kd"),
+        (0x13EE, "6"),
+        (0x13F3, "GB"),
+        (0x1400, "="),
+        (0x142F, "V"),
+        (0x1433, ">"),
+        (0x1438, "<"),
+        (0x144A, "`"),
+        (0x144C, "U"),
+        (0x146D, "P"),
+        (0x146F, "d"),
+        (0x1472, "b"),
+        (0x148D, "J"),
+        (0x14AA, "L"),
+        (0x14BF, "2"),
+        (0x1541, "x"),
+        (0x157C, "Hx"),
+        (0x1587, "R"),
+        (0x15AF, "b"),
+        (0x15B4, "F"),
+        (0x15C5, "A"),
+        (0x15DE, "D"),
+        (0x15EA, "D"),
+        (0x15F0, "M"),
+        (0x15F7, "B"),
+        (0x166D, "Xx"),
+        (0x1680, " "),
+        (0x16B2, "<"),
+        (0x16B7, "X"),
+        (0x16C1, "I"),
+        (0x16CC, "`"),
+        (0x16D5, "KM"),
+        (0x16EC, ":+"),
+        (0x1735, "/"),
+        (0x1803, ":"),
+        (0x1809, ":"),
+        (0x1D04, "c"),
+        (0x1D0F, "o"),
+        (0x1D11, "o"),
+        (0x1D1C, "u"),
+        (0x1D20, "vwz"),
+        (0x1D26, "r"),
+        (0x1D83, "g"),
+        (0x1D8C, "y"),
+        (0x1E9D, "f"),
+        (0x1EFF, "y"),
+        (0x1FBD, "`i`~"),
+        (0x1FEF, "`"),
+        (0x1FFD, "``"),
+        (0x2000, "           "),
+        (0x2010, "-----"),
+        (0x2018, '``,`""""'),
+        (0x2024, "."),
+        (0x2026, "."),
+        (0x2028, "  "),
+        (0x202F, " "),
+        (0x2032, "`"),
+        (0x2035, "`"),
+        (0x2039, "<>"),
+        (0x2041, "/"),
+        (0x2043, "-/"),
+        (0x204E, "*"),
+        (0x2053, "~"),
+        (0x205A, ":"),
+        (0x205F, " "),
+        (0x2102, "C"),
+        (0x210A, "gHHHh"),
+        (0x2110, "IILl"),
+        (0x2115, "N"),
+        (0x2119, "PQRRR"),
+        (0x2124, "Z"),
+        (0x2126, "\u03a9"),
+        (0x2128, "Z"),
+        (0x212A, "K\u00c5BCeeEF"),
+        (0x2133, "Mo"),
+        (0x2139, "i"),
+        (0x213D, "y"),
+        (0x2145, "Ddeij"),
+        (0x2160, "I"),
+        (0x2164, "V"),
+        (0x2169, "X"),
+        (0x216C, "LCDMi"),
+        (0x2174, "v"),
+        (0x2179, "x"),
+        (0x217C, "Icd"),
+        (0x2212, "-"),
+        (0x2215, "/\\*"),
+        (0x2223, "I"),
+        (0x2228, "v"),
+        (0x222A, "U"),
+        (0x2236, ":"),
+        (0x223C, "~"),
+        (0x22A4, "T"),
+        (0x22C1, "v"),
+        (0x22C3, "U"),
+        (0x22FF, "E"),
+        (0x2373, "ip"),
+        (0x237A, "a"),
+        (0x23FD, "I"),
+        (0x2571, "/"),
+        (0x2573, "X"),
+        (0x2768, "()"),
+        (0x276E, "<>"),
+        (0x2772, "(){}"),
+        (0x2795, "+-"),
+        (0x27CB, "/"),
+        (0x27CD, "\\"),
+        (0x27D9, "T"),
+        (0x292B, "xx"),
+        (0x29F5, "\\"),
+        (0x29F8, "/\\"),
+        (0x2A2F, "x"),
+        (0x2C85, "r"),
+        (0x2C8E, "H"),
+        (0x2C92, "I"),
+        (0x2C94, "K"),
+        (0x2C98, "M"),
+        (0x2C9A, "N"),
+        (0x2C9E, "Oo"),
+        (0x2CA2, "PpCcT"),
+        (0x2CA8, "Y"),
+        (0x2CAC, "X"),
+        (0x2CBA, "-"),
+        (0x2CC6, "/"),
+        (0x2CCA, "9"),
+        (0x2CCC, "3"),
+        (0x2CD0, "L"),
+        (0x2CD2, "6"),
+        (0x2D38, "VE"),
+        (0x2D4F, "I"),
+        (0x2D51, "!"),
+        (0x2D54, "OQ"),
+        (0x2D5D, "X"),
+        (0x2E40, "="),
+        (0x2F02, "\\/"),
+        (0x3007, "O"),
+        (0x3014, "()"),
+        (0x3033, "/"),
+        (0x30A0, "="),
+        (0x30CE, "/"),
+        (0x31D3, "/\\"),
+        (0x4E36, "\\"),
+        (0x4E3F, "/"),
+        (0xA4D0, "BPdDT"),
+        (0xA4D6, "GK"),
+        (0xA4D9, "JC"),
+        (0xA4DC, "ZF"),
+        (0xA4DF, "MNLSR"),
+        (0xA4E6, "VH"),
+        (0xA4EA, "WXY"),
+        (0xA4EE, "A"),
+        (0xA4F0, "E"),
+        (0xA4F2, "IOU"),
+        (0xA4F8, ".,"),
+        (0xA4FD, ":"),
+        (0xA4FF, "="),
+        (0xA60E, "."),
+        (0xA644, "2"),
+        (0xA647, "i"),
+        (0xA6DF, "V"),
+        (0xA6EB, "?"),
+        (0xA6EF, "2"),
+        (0xA731, "s"),
+        (0xA75A, "2"),
+        (0xA76A, "3"),
+        (0xA76E, "9"),
+        (0xA778, "&"),
+        (0xA789, ":"),
+        (0xA78C, "`"),
+        (0xA798, "Ff"),
+        (0xA79F, "u"),
+        (0xA7AB, "3"),
+        (0xA7B2, "JXB"),
+        (0xAB32, "e"),
+        (0xAB35, "f"),
+        (0xAB3D, "o"),
+        (0xAB47, "rr"),
+        (0xAB4E, "u"),
+        (0xAB52, "u"),
+        (0xAB5A, "y"),
+        (0xAB75, "i"),
+        (0xAB81, "r"),
+        (0xAB83, "w"),
+        (0xAB93, "z"),
+        (0xABA9, "vs"),
+        (0xABAF, "c"),
+        (0xFBA6, "oooooooo"),
+        (0xFD3E, "()"),
+        (0xFE30, ":"),
+        (
+            0xFE4D,
+            (
+                "",
+                "",
+                "",
+            ),
+        ),
+        (0xFE58, "-"),
+        (0xFE68, "\\"),
+        (0xFE8D, "ll"),
+        (0xFEE9, "oooo"),
+        (
+            0xFF01,
+            (
+                "!",
+                '"',
+                "#",
+                "$",
+                "%",
+                "&",
+                "`",
+                "(",
+                ")",
+                "*",
+                "+",
+                ",",
+                "-",
+                ".",
+                "/",
+                "0",
+                "1",
+                "2",
+                "3",
+                "4",
+                "5",
+                "6",
+                "7",
+                "8",
+                "9",
+                ":",
+                ";",
+                "<",
+                "=",
+                ">",
+                "?",
+                "@",
+                "A",
+                "B",
+                "C",
+                "D",
+                "E",
+                "F",
+                "G",
+                "H",
+                "I",
+                "J",
+                "K",
+                "L",
+                "M",
+                "N",
+                "O",
+                "P",
+                "Q",
+                "R",
+                "S",
+                "T",
+                "U",
+                "V",
+                "W",
+                "X",
+                "Y",
+                "Z",
+                "[",
+                "\\",
+                "]",
+                "^",
+                "",
+                "`",
+            ),
+        ),
+        (0xFF41, "abcdefghijklmnopqrstuvwxyz{|}~"),
+        (0xFFE8, "I"),
+        (0x10282, "B"),
+        (0x10286, "EF"),
+        (0x1028A, "|"),
+        (0x10290, "X"),
+        (0x10292, "O"),
+        (0x10295, "PST"),
+        (0x1029B, "+"),
+        (0x102A0, "ABC"),
+        (0x102A5, "F"),
+        (0x102AB, "O"),
+        (0x102B0, "MTY"),
+        (0x102B4, "X"),
+        (0x102CF, "H"),
+        (0x102F5, "Z"),
+        (0x10301, "BC"),
+        (0x10309, "|"),
+        (0x10311, "M"),
+        (0x10315, "T"),
+        (0x10317, "X"),
+        (0x1031A, "8"),
+        (0x1031F, "*l"),
+        (0x10322, "X"),
+        (0x10404, "O"),
+        (0x10415, "C"),
+        (0x1041B, "L"),
+        (0x10420, "S"),
+        (0x1042C, "o"),
+        (0x1043D, "c"),
+        (0x10448, "s"),
+        (0x104B4, "R"),
+        (0x104C2, "O"),
+        (0x104CE, "U"),
+        (0x104D2, "7"),
+        (0x104EA, "o"),
+        (0x104F6, "u"),
+        (0x10513, "N"),
+        (0x10516, "O"),
+        (0x10518, "K"),
+        (0x1051C, "CV"),
+        (0x10525, "FLX"),
+        (0x10A50, "."),
+        (0x114D0, "O"),
+        (0x11706, "v"),
+        (0x1170A, "w"),
+        (0x1170E, "ww"),
+        (0x118A0, "V"),
+        (0x118A2, "FLY"),
+        (0x118A6, "E"),
+        (0x118A9, "Z"),
+        (0x118AC, "9"),
+        (0x118AE, "E4"),
+        (0x118B2, "L"),
+        (0x118B5, "O"),
+        (0x118B8, "U"),
+        (0x118BB, "5T"),
+        (0x118C0, "vsFiz"),
+        (0x118C6, "7"),
+        (0x118C8, "o"),
+        (0x118CA, "3"),
+        (0x118CC, "9"),
+        (0x118D5, "69ou"),
+        (0x118DC, "y"),
+        (0x118E0, "O"),
+        (0x118E5, "ZW"),
+        (0x118E9, "C"),
+        (0x118EC, "X"),
+        (0x118EF, "W"),
+        (0x118F2, "C"),
+        (0x16F08, "V"),
+        (0x16F0A, "T"),
+        (0x16F16, "L"),
+        (0x16F28, "I"),
+        (0x16F35, "R"),
+        (0x16F3A, "S3"),
+        (0x16F3F, ">A"),
+        (0x16F42, "UY"),
+        (0x16F51, "``"),
+        (0x1D114, "{"),
+        (0x1D16D, "."),
+        (0x1D206, "3"),
+        (0x1D20D, "V"),
+        (0x1D20F, "\\"),
+        (0x1D212, "7F"),
+        (0x1D216, "R"),
+        (0x1D22A, "L"),
+        (0x1D236, "<>"),
+        (0x1D23A, "/\\"),
+        (0x1D400, "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyzABCDEFGHIJKL"),
+        (0x1D440, "MNOPQRSTUVWXYZabcdefg"),
+        (0x1D456, "ijkl"),
+        (0x1D45B, "nopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkl"),
+        (0x1D48F, "nopqrstuvwxyzA"),
+        (0x1D49E, "CD"),
+        (0x1D4A2, "G"),
+        (0x1D4A5, "JK"),
+        (0x1D4A9, "NOPQ"),
+        (0x1D4AE, "STUVWXYZabcd"),
+        (0x1D4BB, "f"),
+        (0x1D4BD, "hijkl"),
+        (0x1D4C3, "n"),
+        (0x1D4C5, "pqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkl"),
+        (0x1D4F7, "nopqrstuvwxyzAB"),
+        (0x1D507, "DEFG"),
+        (0x1D50D, "JKLMNOPQ"),
+        (0x1D516, "STUVWXY"),
+        (0x1D51E, "abcdefghijkI"),
+        (0x1D52B, "nopqrstuvwxyzAB"),
+        (0x1D53B, "DEFG"),
+        (0x1D540, "IJKLM"),
+        (0x1D546, "O"),
+        (0x1D54A, "STUVWXY"),
+        (0x1D552, "abcdefghijkI"),
+        (0x1D55F, "nopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkI"),
+        (0x1D593, "nopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkI"),
+        (0x1D5C7, "nopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkI"),
+        (0x1D5FB, "nopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkI"),
+        (0x1D62F, "nopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkI"),
+        (0x1D663, "nopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijkI"),
+        (0x1D697, "nopqrstuvwxyzi"),
+        (0x1D6A8, "AB"),
+        (0x1D6AC, "EZH"),
+        (0x1D6B0, "IK"),
+        (0x1D6B3, "MN"),
+        (0x1D6B6, "O"),
+        (0x1D6B8, "P"),
+        (0x1D6BB, "TY"),
+        (0x1D6BE, "X"),
+        (0x1D6C2, "a"),
+        (0x1D6C4, "y"),
+        (0x1D6CA, "i"),
+        (0x1D6CE, "v"),
+        (0x1D6D0, "o"),
+        (0x1D6D2, "p"),
+        (0x1D6D4, "o"),
+        (0x1D6D6, "u"),
+        (0x1D6E0, "p"),
+        (0x1D6E2, "AB"),
+        (0x1D6E6, "EZH"),
+        (0x1D6EA, "IK"),
+        (0x1D6ED, "MN"),
+        (0x1D6F0, "O"),
+        (0x1D6F2, "P"),
+        (0x1D6F5, "TY"),
+        (0x1D6F8, "X"),
+        (0x1D6FC, "a"),
+        (0x1D6FE, "y"),
+        (0x1D704, "i"),
+        (0x1D708, "v"),
+        (0x1D70A, "o"),
+        (0x1D70C, "p"),
+        (0x1D70E, "o"),
+        (0x1D710, "u"),
+        (0x1D71A, "p"),
+        (0x1D71C, "AB"),
+        (0x1D720, "EZH"),
+        (0x1D724, "IK"),
+        (0x1D727, "MN"),
+        (0x1D72A, "O"),
+        (0x1D72C, "P"),
+        (0x1D72F, "TY"),
+        (0x1D732, "X"),
+        (0x1D736, "a"),
+        (0x1D738, "y"),
+        (0x1D73E, "i"),
+        (0x1D742, "v"),
+        (0x1D744, "o"),
+        (0x1D746, "p"),
+        (0x1D748, "o"),
+        (0x1D74A, "u"),
+        (0x1D754, "p"),
+        (0x1D756, "AB"),
+        (0x1D75A, "EZH"),
+        (0x1D75E, "IK"),
+        (0x1D761, "MN"),
+        (0x1D764, "O"),
+        (0x1D766, "P"),
+        (0x1D769, "TY"),
+        (0x1D76C, "X"),
+        (0x1D770, "a"),
+        (0x1D772, "y"),
+        (0x1D778, "i"),
+        (0x1D77C, "v"),
+        (0x1D77E, "o"),
+        (0x1D780, "p"),
+        (0x1D782, "o"),
+        (0x1D784, "u"),
+        (0x1D78E, "p"),
+        (0x1D790, "AB"),
+        (0x1D794, "EZH"),
+        (0x1D798, "IK"),
+        (0x1D79B, "MN"),
+        (0x1D79E, "O"),
+        (0x1D7A0, "P"),
+        (0x1D7A3, "TY"),
+        (0x1D7A6, "X"),
+        (0x1D7AA, "a"),
+        (0x1D7AC, "y"),
+        (0x1D7B2, "i"),
+        (0x1D7B6, "v"),
+        (0x1D7B8, "o"),
+        (0x1D7BA, "p"),
+        (0x1D7BC, "o"),
+        (0x1D7BE, "u"),
+        (0x1D7C8, "p"),
+        (0x1D7CA, "F"),
+        (0x1D7CE, "OI23456789OI23456789OI23456789OI23456789OI23456789"),
+        (0x1E8C7, "l"),
+        (0x1E8CB, "8"),
+        (0x1EE00, "l"),
+        (0x1EE24, "o"),
+        (0x1EE64, "o"),
+        (0x1EE80, "l"),
+        (0x1EE84, "o"),
+        (0x1F74C, "C"),
+        (0x1F768, "T"),
+        (0x1FBF0, "OI23456789"),
+    )
+)
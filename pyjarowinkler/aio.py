@@ -0,0 +1,305 @@
+"""Batch scoring coroutines handing control back to the event loop between chunks of candidates."""
+
+import asyncio
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+from typing import Final
+
+from pyjarowinkler import JaroDistanceError
+from pyjarowinkler.comparative import Comparative
+from pyjarowinkler.distance import (
+    __DEFAULT_DECIMALS__,
+    __DEFAULT_SCALING__,
+    __MAX_SCALING__,
+    Match,
+    _TopK,
+    _extract,
+    _score_chunk,
+)
+from pyjarowinkler.parallel import _chunks
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+__DEFAULT_CHUNK_SIZE__: Final[int] = 1024
+
+
+def _score_slice(
+    candidates: Sequence[str],
+    query: str,
+    scaling: float,
+    decimals: int,
+    distance: bool,
+    norm_case: bool,
+    norm_utf8: bool,
+    norm_ambiguous: bool,
+) -> list[float]:
+    sanitized: list[str] = [
+        Comparative._sanitize(candidate, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
+        for candidate in candidates
+    ]
+    return _score_chunk(sanitized, query, scaling, decimals, distance)
+
+
+def _extract_slice(
+    choices: Sequence[str],
+    start: int,
+    query: str,
+    k: int,
+    cutoff: float,
+    scaling: float,
+    norm_case: bool,
+    norm_utf8: bool,
+    norm_ambiguous: bool,
+) -> list[tuple[float, int, str]]:
+    best: _TopK = _TopK(k, cutoff)
+    _extract(best, query, choices, start, scaling, norm_case, norm_utf8, norm_ambiguous)
+    return [(score, -position, choice) for score, position, choice in best.retained]
+
+
+async def _score_many(
+    query: str,
+    candidates: Iterable[str],
+    scaling: float,
+    decimals: int,
+    norm_case: bool,
+    norm_utf8: bool,
+    norm_ambiguous: bool,
+    distance: bool,
+    chunk_size: int,
+    executor: Executor | None,
+) -> list[float]:
+    try:
+        query = Comparative._sanitize(query, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        scores: list[float] = []
+        for chunk in _chunks(candidates, chunk_size):
+            arguments: tuple = (chunk, query, scaling, decimals, distance, norm_case, norm_utf8, norm_ambiguous)
+            if executor is None:
+                scores.extend(_score_slice(*arguments))
+                await asyncio.sleep(0)
+
+            else:
+                scores.extend(await loop.run_in_executor(executor, _score_slice, *arguments))
+
+        return scores
+
+    except ValueError as e:
+        raise JaroDistanceError from e
+
+
+async def get_jaro_similarity_many(
+    query: str,
+    candidates: Iterable[str],
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    chunk_size: int = __DEFAULT_CHUNK_SIZE__,
+    executor: Executor | None = None,
+) -> list[float]:
+    """
+    Return the Jaro similarity of one string against many, yielding to the event loop after each chunk of candidates.
+
+    Args:
+        query (str): String to calculate Jaro similarity for.
+        candidates (Iterable[str]): Strings to calculate Jaro similarity with.
+        decimals (int, optional): Number of decimals to allow in result, defaults to 2.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        chunk_size (int, optional): Number of candidates scored between two yields, defaults to 1024.
+        executor (Executor, optional): Executor scoring the chunks off the event loop, defaults to scoring them on it.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings or if chunk size is invalid.
+
+    Returns:
+        list[float]: Similarity between the query and each candidate, in candidate order.
+
+    """
+    return await _score_many(query, candidates, 0.0, decimals, norm_case, norm_utf8, norm_ambiguous, False, chunk_size, executor)
+
+
+async def get_jaro_distance_many(
+    query: str,
+    candidates: Iterable[str],
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    chunk_size: int = __DEFAULT_CHUNK_SIZE__,
+    executor: Executor | None = None,
+) -> list[float]:
+    """
+    Return the Jaro distance (`1 - jaro_similarity`) of one string against many, yielding to the event loop after each chunk.
+
+    Args:
+        query (str): String to calculate Jaro distance for.
+        candidates (Iterable[str]): Strings to calculate Jaro distance with.
+        decimals (int, optional): Number of decimals to allow in result, defaults to 2.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        chunk_size (int, optional): Number of candidates scored between two yields, defaults to 1024.
+        executor (Executor, optional): Executor scoring the chunks off the event loop, defaults to scoring them on it.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings or if chunk size is invalid.
+
+    Returns:
+        list[float]: Distance between the query and each candidate, in candidate order.
+
+    """
+    return await _score_many(query, candidates, 0.0, decimals, norm_case, norm_utf8, norm_ambiguous, True, chunk_size, executor)
+
+
+async def get_jaro_winkler_similarity_many(
+    query: str,
+    candidates: Iterable[str],
+    scaling: float = __DEFAULT_SCALING__,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    chunk_size: int = __DEFAULT_CHUNK_SIZE__,
+    executor: Executor | None = None,
+) -> list[float]:
+    """
+    Return the Jaro Winkler similarity of one string against many, yielding to the event loop after each chunk of candidates.
+
+    Args:
+        query (str): String to calculate similarity for.
+        candidates (Iterable[str]): Strings to calculate similarity with.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1.
+        decimals (int, optional): Number of decimals to allow in result.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        chunk_size (int, optional): Number of candidates scored between two yields, defaults to 1024.
+        executor (Executor, optional): Executor scoring the chunks off the event loop, defaults to scoring them on it.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings, if scaling is invalid or if chunk size is invalid.
+
+    Returns:
+        list[float]: Jaro Winkler similarity score of each candidate, in candidate order.
+
+    """
+    if scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    return await _score_many(
+        query, candidates, scaling, decimals, norm_case, norm_utf8, norm_ambiguous, False, chunk_size, executor
+    )
+
+
+async def get_jaro_winkler_distance_many(
+    query: str,
+    candidates: Iterable[str],
+    scaling: float = __DEFAULT_SCALING__,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    chunk_size: int = __DEFAULT_CHUNK_SIZE__,
+    executor: Executor | None = None,
+) -> list[float]:
+    """
+    Return the Jaro Winkler distance (`1 - jaro_winkler_similarity`) of one string against many, yielding between chunks.
+
+    Args:
+        query (str): String to calculate distance for.
+        candidates (Iterable[str]): Strings to calculate distance with.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1.
+        decimals (int, optional): Number of decimals to allow in result.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        chunk_size (int, optional): Number of candidates scored between two yields, defaults to 1024.
+        executor (Executor, optional): Executor scoring the chunks off the event loop, defaults to scoring them on it.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings, if scaling is invalid or if chunk size is invalid.
+
+    Returns:
+        list[float]: Jaro Winkler distance score of each candidate, in candidate order.
+
+    """
+    if scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    return await _score_many(
+        query, candidates, scaling, decimals, norm_case, norm_utf8, norm_ambiguous, True, chunk_size, executor
+    )
+
+
+async def extract_best(
+    query: str,
+    choices: Iterable[str],
+    k: int = 5,
+    scaling: float = __DEFAULT_SCALING__,
+    min_score: float = 0.0,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    chunk_size: int = __DEFAULT_CHUNK_SIZE__,
+    executor: Executor | None = None,
+) -> list[Match]:
+    """
+    Return the `k` choices most similar to the query, yielding to the event loop after each chunk of choices.
+
+    The worst of the current best `k` is handed to every chunk as a cutoff, so choices which cannot beat it are given up on
+    early, as with the synchronous `extract_best`.
+
+    Args:
+        query (str): String to find the closest choices for.
+        choices (Iterable[str]): Strings to pick the closest from.
+        k (int, optional): Maximum number of choices to return, defaults to 5.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1.
+        min_score (float, optional): Least Jaro Winkler similarity for a choice to be returned, compared before rounding.
+        decimals (int, optional): Number of decimals to allow in result.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        chunk_size (int, optional): Number of choices scored between two yields, defaults to 1024.
+        executor (Executor, optional): Executor scoring the chunks off the event loop, defaults to scoring them on it.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings, if scaling is invalid or if chunk size is invalid.
+
+    Returns:
+        list[Match]: Best choices ordered by decreasing score, ties kept in choice order.
+
+    """
+    if scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    if k < 1:
+        return []
+
+    try:
+        query = Comparative._sanitize(query, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        best: _TopK = _TopK(k, min_score)
+        start: int = 0
+        for chunk in _chunks(choices, chunk_size):
+            arguments: tuple = (chunk, start, query, k, best.cutoff, scaling, norm_case, norm_utf8, norm_ambiguous)
+            if executor is None:
+                retained: list[tuple[float, int, str]] = _extract_slice(*arguments)
+                await asyncio.sleep(0)
+
+            else:
+                retained = await loop.run_in_executor(executor, _extract_slice, *arguments)
+
+            for score, position, choice in retained:
+                best.push(score, position, choice)
+            start += len(chunk)
+
+        return best.matches(decimals)
+
+    except ValueError as e:
+        raise JaroDistanceError from e
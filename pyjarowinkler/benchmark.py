@@ -0,0 +1,356 @@
+"""Benchmark suite of the scoring functions over generated datasets, reported as JSON and compared against a baseline."""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from collections.abc import Callable, Iterator, Sequence
+from functools import partial
+from itertools import product
+from pathlib import Path
+from typing import Final, NamedTuple, cast
+
+from pyjarowinkler import distance, vectorized
+from pyjarowinkler.corpus import Corpus
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+__ALPHABETS__: Final[dict[str, str]] = {
+    "ascii": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -'",
+    # Latin letters with diacritics, Cyrillic and Greek lookalikes and fullwidth letters, so that every normalization has
+    # something to do, along with plain letters.
+    "unicode": "abcdefghijklmnopqrstuvwxyz "
+    + "".join(map(chr, range(0xC0, 0x100)))
+    + "".join(map(chr, range(0x410, 0x450)))
+    + "".join(map(chr, range(0x391, 0x3AA)))
+    + "".join(map(chr, range(0xFF21, 0xFF3B))),
+}
+__DEFAULT_DURATION__: Final[float] = 0.05
+__DEFAULT_REPEAT__: Final[int] = 5
+__DEFAULT_SEED__: Final[int] = 20150101
+__DEFAULT_TOLERANCE__: Final[float] = 0.2
+__IMPORTS__: Final[tuple[str, ...]] = ("pyjarowinkler.distance", "pyjarowinkler.cli")
+__LENGTHS__: Final[dict[str, tuple[int, int]]] = {"short": (4, 8), "medium": (16, 32), "long": (80, 160)}
+__PAIRS__: Final[int] = 100
+
+
+class Case(NamedTuple):
+    """
+    Entry point called with one of the datasets, or import of a module.
+
+    Attributes:
+        name (str): Unique name of the case, as `kind/length/alphabet/flags` or `import/module`.
+        function (Callable[[], object]): Call timed by the benchmark.
+        operations (int): Comparisons performed by each call, `1` for imports.
+        timed (bool): Function times itself and returns the seconds it measured, for costs the time of the whole call would
+            drown out.
+
+    """
+
+    name: str
+    function: Callable[[], object]
+    operations: int
+    timed: bool = False
+
+
+class Result(NamedTuple):
+    """
+    Timing of a case, the fastest of the repeats.
+
+    Attributes:
+        name (str): Name of the case.
+        operations (int): Comparisons performed by each call.
+        calls (int): Calls per repeat.
+        ops_per_sec (float): Comparisons per second.
+        ns_per_op (float): Nanoseconds per comparison.
+
+    """
+
+    name: str
+    operations: int
+    calls: int
+    ops_per_sec: float
+    ns_per_op: float
+
+
+class Regression(NamedTuple):
+    """
+    Case slower than its baseline by more than the tolerance.
+
+    Attributes:
+        name (str): Name of the case.
+        baseline (float): Comparisons per second of the baseline.
+        current (float): Comparisons per second of the current run.
+        change (float): Relative change of the comparisons per second, negative when slower.
+
+    """
+
+    name: str
+    baseline: float
+    current: float
+    change: float
+
+
+def get_dataset(length: str, alphabet: str, pairs: int = __PAIRS__, seed: int = __DEFAULT_SEED__) -> list[tuple[str, str]]:
+    """
+    Return pairs of similar strings, the second being the first with a few typos.
+
+    Args:
+        length (str): One of `short`, `medium` or `long`.
+        alphabet (str): Either `ascii` or `unicode`.
+        pairs (int, optional): Number of pairs, defaults to 100.
+        seed (int, optional): Seed of the generator, the same seed always yields the same pairs.
+
+    Raises:
+        KeyError: If length or alphabet is unknown.
+
+    Returns:
+        list[tuple[str, str]]: Pairs of strings.
+
+    """
+    generator: random.Random = random.Random(f"{seed}/{length}/{alphabet}")
+    shortest, longest = __LENGTHS__[length]
+    characters: str = __ALPHABETS__[alphabet]
+    dataset: list[tuple[str, str]] = []
+    for _ in range(pairs):
+        first: str = "".join(generator.choices(characters, k=generator.randint(shortest, longest)))
+        second: list[str] = list(first)
+        for _ in range(generator.randint(0, max(1, len(first) // 8))):
+            position: int = generator.randrange(len(second))
+            typo: int = generator.randrange(3)
+            if typo == 0:
+                second[position] = generator.choice(characters)
+            elif typo == 1 and position + 1 < len(second):
+                second[position], second[position + 1] = second[position + 1], second[position]
+            else:
+                del second[position]
+        dataset.append((first, "".join(second)))
+    return dataset
+
+
+def _flags_name(flags: Sequence[bool]) -> str:
+    return "+".join(name for name, flag in zip(("case", "utf8", "ambiguous"), flags, strict=True) if flag) or "none"
+
+
+def _score_pairs(dataset: Sequence[tuple[str, str]], norm_case: bool, norm_utf8: bool, norm_ambiguous: bool) -> None:
+    for first, second in dataset:
+        distance.get_jaro_winkler_similarity(
+            first, second, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous
+        )
+
+
+def _search(corpus: Corpus, queries: Sequence[str], threshold: float) -> None:
+    for query in queries:
+        corpus.search(query, threshold)
+
+
+def _top_k(corpus: Corpus, queries: Sequence[str], k: int) -> None:
+    for query in queries:
+        corpus.top_k(query, k)
+
+
+def _import(module: str) -> float:
+    # Lines read `import time: self [us] | cumulative | name`, names of nested imports being indented further. The module and
+    # its parent packages, imported at the top level, add up to the cost of the import without the interpreter's startup.
+    stderr: str = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    ).stderr
+    parts: list[str] = module.split(".")
+    names: set[str] = {" " + ".".join(parts[:length]) for length in range(1, len(parts) + 1)}
+    return sum(int(line.split("|")[1]) for line in stderr.splitlines() if line.split("|")[-1] in names) / 1e6
+
+
+def get_cases() -> Iterator[Case]:
+    """
+    Yield every benchmark case.
+
+    Pair cases score each pair of a dataset with every combination of the normalization flags. Batch cases score the first
+    strings of the pairs, one or ten of them, against all the second ones through each batch and search entry point. Import
+    cases import a module in a new interpreter, as reported by `-X importtime`, so the startup of the interpreter is left out.
+
+    Returns:
+        Iterator[Case]: Cases, in a stable order.
+
+    """
+    for length, alphabet in product(__LENGTHS__, __ALPHABETS__):
+        dataset: list[tuple[str, str]] = get_dataset(length, alphabet)
+        for flags in product((False, True), repeat=3):
+            yield Case(f"pair/{length}/{alphabet}/{_flags_name(flags)}", partial(_score_pairs, dataset, *flags), len(dataset))
+
+        queries: list[str] = [first for first, _ in dataset][:10]
+        choices: list[str] = [second for _, second in dataset]
+        corpus: Corpus = Corpus(choices)
+        name: str = f"{length}/{alphabet}"
+        yield Case(f"many/{name}", partial(distance.get_jaro_winkler_similarity_many, queries[0], choices), len(choices))
+        yield Case(f"cdist/{name}", partial(distance.cdist, queries, choices), len(queries) * len(choices))
+        yield Case(f"extract/{name}", partial(distance.extract_best, queries[0], choices, k=5), len(choices))
+        yield Case(f"search/{name}", partial(_search, corpus, queries, 0.8), len(queries) * len(choices))
+        yield Case(f"top_k/{name}", partial(_top_k, corpus, queries, 5), len(queries) * len(choices))
+
+    for module in __IMPORTS__:
+        yield Case(f"import/{module}", partial(_import, module), 1, timed=True)
+
+
+def measure(case: Case, repeat: int = __DEFAULT_REPEAT__, duration: float = __DEFAULT_DURATION__) -> Result:
+    """
+    Time a case, calling it enough times per repeat to last at least the duration.
+
+    Cases timing themselves are called once per repeat instead.
+
+    Args:
+        case (Case): Case to time.
+        repeat (int, optional): Number of timings, the fastest is kept, defaults to 5.
+        duration (float, optional): Least seconds each timing lasts, defaults to 0.05.
+
+    Returns:
+        Result: Timing of the case.
+
+    """
+    if case.timed:
+        seconds: float = min(cast(float, case.function()) for _ in range(repeat))
+        return Result(case.name, case.operations, 1, case.operations / seconds, seconds / case.operations * 1e9)
+
+    timer: timeit.Timer = timeit.Timer(case.function)
+    calls: int = 1
+    while timer.timeit(calls) < duration:
+        calls *= 2
+
+    seconds = min(timer.repeat(repeat, calls)) / calls
+    return Result(case.name, case.operations, calls, case.operations / seconds, seconds / case.operations * 1e9)
+
+
+def get_report(results: Sequence[Result], repeat: int, duration: float) -> dict:
+    """
+    Return the machine-readable report of a run, along with what it ran on.
+
+    Args:
+        results (Sequence[Result]): Timing of each case.
+        repeat (int): Number of timings of each case.
+        duration (float): Least seconds of each timing.
+
+    Returns:
+        dict: Report, serializable as JSON.
+
+    """
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "numpy": vectorized.is_available(),
+        },
+        "settings": {"repeat": repeat, "duration": duration},
+        "results": {
+            result.name: {
+                "operations": result.operations,
+                "calls": result.calls,
+                "ops_per_sec": result.ops_per_sec,
+                "ns_per_op": result.ns_per_op,
+            }
+            for result in results
+        },
+    }
+
+
+def compare(results: Sequence[Result], baseline: dict, tolerance: float = __DEFAULT_TOLERANCE__) -> list[Regression]:
+    """
+    Return the cases slower than in a baseline report by more than the tolerance.
+
+    Cases missing from the baseline are not compared.
+
+    Args:
+        results (Sequence[Result]): Timing of each case.
+        baseline (dict): Report of an earlier run.
+        tolerance (float, optional): Largest relative loss of comparisons per second accepted, defaults to 0.2.
+
+    Returns:
+        list[Regression]: Slower cases, in result order.
+
+    """
+    regressions: list[Regression] = []
+    for result in results:
+        if result.name not in baseline["results"]:
+            continue
+
+        expected: float = baseline["results"][result.name]["ops_per_sec"]
+        change: float = result.ops_per_sec / expected - 1
+        if change < -tolerance:
+            regressions.append(Regression(result.name, expected, result.ops_per_sec, change))
+    return regressions
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m pyjarowinkler.benchmark", description="Time the scoring functions over generated datasets."
+    )
+    parser.add_argument("--filter", default="", help="only run the cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=__DEFAULT_REPEAT__, help="timings of each case, the fastest is kept")
+    parser.add_argument("--duration", type=float, default=__DEFAULT_DURATION__, help="least seconds of each timing")
+    parser.add_argument("--output", help="file the JSON report is written to")
+    parser.add_argument("--baseline", help="JSON report of an earlier run to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=__DEFAULT_TOLERANCE__, help="largest relative loss of ops/sec against the baseline"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the benchmark suite, printing the timing of each case to stdout.
+
+    Args:
+        argv (Sequence[str], optional): Command line arguments, defaults to those of the process.
+
+    Returns:
+        int: Exit status, `0` on success and `1` when a case regressed against the baseline.
+
+    """
+    parser: argparse.ArgumentParser = _get_parser()
+    arguments: argparse.Namespace = parser.parse_args(argv)
+    if arguments.repeat < 1:
+        parser.error("argument --repeat: must be at least 1")
+
+    if arguments.duration <= 0:
+        parser.error("argument --duration: must be positive")
+
+    if arguments.tolerance < 0:
+        parser.error("argument --tolerance: must be at least 0")
+
+    try:
+        baseline: dict | None = None
+        if arguments.baseline is not None:
+            baseline = json.loads(Path(arguments.baseline).read_text())
+
+        results: list[Result] = []
+        for case in get_cases():
+            if arguments.filter in case.name:
+                results.append(measure(case, arguments.repeat, arguments.duration))
+                change: str = ""
+                if baseline is not None and case.name in baseline["results"]:
+                    change = f" {results[-1].ops_per_sec / baseline['results'][case.name]['ops_per_sec'] - 1:+8.1%}"
+                print(f"{case.name:<36} {results[-1].ops_per_sec:>14,.0f} ops/s {results[-1].ns_per_op:>12,.1f} ns/op{change}")
+
+        if arguments.output is not None:
+            report: dict = get_report(results, arguments.repeat, arguments.duration)
+            Path(arguments.output).write_text(json.dumps(report, indent=2) + "\n")
+
+        regressions: list[Regression] = [] if baseline is None else compare(results, baseline, arguments.tolerance)
+
+    except (ValueError, KeyError, OSError, subprocess.CalledProcessError) as e:
+        parser.exit(1, f"{parser.prog}: error: {str(e) or e.__cause__}\n")
+
+    for regression in regressions:
+        print(
+            f"{regression.name} regressed {regression.change:.1%}: {regression.current:,.0f} ops/s, "
+            f"baseline {regression.baseline:,.0f} ops/s",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
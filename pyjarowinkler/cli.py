@@ -0,0 +1,285 @@
+"""Command line scoring of string pairs and matching of queries against references, streamed from CSV, TSV or JSONL."""
+
+import argparse
+import csv
+import json
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Final, TypeVar
+
+from pyjarowinkler.corpus import Corpus
+from pyjarowinkler.distance import __DEFAULT_DECIMALS__, __DEFAULT_SCALING__, __MAX_SCALING__, Match, get_jaro_winkler_similarity
+from pyjarowinkler.parallel import __CHUNKS_PER_WORKER__, __MIN_CHUNK_COMPARISONS__, _chunks, _split
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+# Records read ahead per worker, enough for a few chunks of pairs each while keeping memory bounded.
+__BATCH_SIZE__: Final[int] = __CHUNKS_PER_WORKER__ * __MIN_CHUNK_COMPARISONS__
+__DELIMITERS__: Final[dict[str, str]] = {"csv": ",", "tsv": "\t"}
+__FORMATS__: Final[dict[str, str]] = {".csv": "csv", ".tsv": "tsv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+# Corpus of the references, built by the main process and memory-mapped by the workers from the index it saved.
+_corpus: Corpus | None = None
+
+
+def _get_format(path: str, format: str | None) -> str:
+    if format is not None:
+        return format
+
+    return __FORMATS__.get(Path(path).suffix.lower(), "csv")
+
+
+def _read(stream: IO[str], format: str) -> Iterator[dict[str, str]]:
+    if format in __DELIMITERS__:
+        yield from csv.DictReader(stream, delimiter=__DELIMITERS__[format])
+        return
+
+    for line in stream:
+        if line.strip():
+            record: object = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("JSONL lines must hold objects.")
+            yield record
+
+
+def _open(path: str, stack: ExitStack) -> IO[str]:
+    if path == "-":
+        return sys.stdin
+
+    return stack.enter_context(open(path, newline="", encoding="utf-8"))
+
+
+def _get_field(record: dict[str, str], name: str | None, index: int = 0) -> str:
+    if name is None:
+        fields: list[str] = list(record)
+        if index >= len(fields):
+            raise ValueError(f"Records need at least {index + 1} fields.")
+        name = fields[index]
+
+    if name not in record:
+        raise ValueError(f"Field {name!r} is missing.")
+
+    return record[name]
+
+
+def _write(records: Iterable[dict[str, object]], stream: IO[str], format: str) -> None:
+    if format not in __DELIMITERS__:
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return
+
+    writer: csv.DictWriter | None = None
+    for record in records:
+        if writer is None:
+            writer = csv.DictWriter(stream, list(record), delimiter=__DELIMITERS__[format], lineterminator="\n")
+            writer.writeheader()
+        writer.writerow(record)
+
+
+def _map(
+    function: Callable[[Sequence[_Item]], list[_Result]],
+    items: Sequence[_Item],
+    comparisons: int,
+    workers: int,
+    executor: "Executor | None",
+) -> list[_Result]:
+    chunks: list[Sequence[_Item]] = _split(items, comparisons, workers)
+    if executor is None or len(chunks) == 1:
+        return function(items)
+
+    return [result for chunk in executor.map(function, chunks) for result in chunk]
+
+
+def _score_pairs(
+    pairs: Sequence[tuple[str, str]],
+    scaling: float,
+    decimals: int,
+    norm_case: bool,
+    norm_utf8: bool,
+    norm_ambiguous: bool,
+    threshold: float,
+) -> list[float | None]:
+    return [
+        get_jaro_winkler_similarity(
+            first,
+            second,
+            scaling=scaling,
+            decimals=decimals,
+            norm_case=norm_case,
+            norm_utf8=norm_utf8,
+            norm_ambiguous=norm_ambiguous,
+            min_similarity=threshold,
+        )
+        for first, second in pairs
+    ]
+
+
+def _set_corpus(corpus: Corpus) -> None:
+    global _corpus  # noqa: PLW0603
+    _corpus = corpus
+
+
+def _load_corpus(path: str) -> None:
+    _set_corpus(Corpus.load(path, mmap=True))
+
+
+def _match_queries(queries: Sequence[str], limit: int, threshold: float) -> list[list[Match]]:
+    if _corpus is None:
+        raise ValueError("References are not loaded.")
+
+    if limit == 0:
+        return [_corpus.search(query, threshold) for query in queries]
+
+    return [_corpus.top_k(query, limit, threshold) for query in queries]
+
+
+def _pairs(arguments: argparse.Namespace, stack: ExitStack, executor: "Executor | None") -> Iterator[dict[str, object]]:
+    first, second = arguments.columns or (None, None)
+    score: Callable[[Sequence[tuple[str, str]]], list[float | None]] = partial(
+        _score_pairs,
+        scaling=arguments.scaling,
+        decimals=arguments.decimals,
+        norm_case=arguments.norm_case,
+        norm_utf8=arguments.norm_utf8,
+        norm_ambiguous=arguments.norm_ambiguous,
+        threshold=arguments.threshold,
+    )
+    records: Iterator[dict[str, str]] = _read(_open(arguments.input, stack), _get_format(arguments.input, arguments.format))
+    for batch in _chunks(records, arguments.workers * __BATCH_SIZE__):
+        pairs: list[tuple[str, str]] = [(_get_field(record, first, 0), _get_field(record, second, 1)) for record in batch]
+        for record, similarity in zip(batch, _map(score, pairs, 1, arguments.workers, executor), strict=True):
+            if similarity is not None:
+                yield {**record, "score": similarity}
+
+
+def _match(arguments: argparse.Namespace, stack: ExitStack, executor: "Executor | None") -> Iterator[dict[str, object]]:
+    match: Callable[[Sequence[str]], list[list[Match]]] = partial(
+        _match_queries, limit=arguments.limit, threshold=arguments.threshold
+    )
+    records: Iterator[dict[str, str]] = _read(_open(arguments.queries, stack), _get_format(arguments.queries, arguments.format))
+    comparisons: int = 0 if _corpus is None else len(_corpus)
+    for batch in _chunks(records, arguments.workers * __BATCH_SIZE__):
+        queries: list[str] = [_get_field(record, arguments.column) for record in batch]
+        for record, matches in zip(batch, _map(match, queries, comparisons, arguments.workers, executor), strict=True):
+            for found in matches:
+                yield {**record, "reference": found.choice, "reference_position": found.position, "score": found.score}
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m pyjarowinkler", description="Jaro Winkler similarity of string pairs or of queries against references."
+    )
+    options: argparse.ArgumentParser = argparse.ArgumentParser(add_help=False)
+    options.add_argument(
+        "--format", choices=["csv", "tsv", "jsonl"], help="format of the input records, guessed from the extension"
+    )
+    options.add_argument(
+        "--output-format", choices=["csv", "tsv", "jsonl"], help="format of the results, defaults to the input's"
+    )
+    options.add_argument("--scaling", type=float, default=__DEFAULT_SCALING__, help="scaling factor of the prefix")
+    options.add_argument("--decimals", type=int, default=__DEFAULT_DECIMALS__, help="number of decimals of the scores")
+    options.add_argument("--norm-case", action="store_true", help="compare strings casefolded")
+    options.add_argument("--norm-utf8", action="store_true", help="compare strings normalized using NFC form")
+    options.add_argument("--norm-ambiguous", action="store_true", help="compare strings with ambiguous glyphs normalized")
+    options.add_argument("--threshold", type=float, default=0.0, help="least similarity of the results, before rounding")
+    options.add_argument("--workers", type=int, default=1, help="number of processes scoring the records")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    pairs: argparse.ArgumentParser = commands.add_parser("pairs", parents=[options], help="score the two fields of every record")
+    pairs.add_argument("input", nargs="?", default="-", help="records holding the pairs, defaults to stdin")
+    pairs.add_argument(
+        "--columns", nargs=2, metavar=("FIRST", "SECOND"), help="fields holding the pair, defaults to the first two"
+    )
+
+    match: argparse.ArgumentParser = commands.add_parser(
+        "match", parents=[options], help="find the most similar references of every query"
+    )
+    match.add_argument("queries", help="records holding the queries, - for stdin")
+    match.add_argument("references", help="records holding the references")
+    match.add_argument("--column", help="field holding the query, defaults to the first")
+    match.add_argument("--reference-column", help="field holding the reference, defaults to the first")
+    match.add_argument(
+        "--reference-format", choices=["csv", "tsv", "jsonl"], help="format of the references, guessed from their extension"
+    )
+    match.add_argument("--limit", type=int, default=1, help="matches per query, 0 for every match above the threshold")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command line interface, streaming the results to stdout.
+
+    Args:
+        argv (Sequence[str], optional): Command line arguments, defaults to those of the process.
+
+    Returns:
+        int: Exit status, `0` on success.
+
+    """
+    parser: argparse.ArgumentParser = _get_parser()
+    arguments: argparse.Namespace = parser.parse_args(argv)
+    if arguments.scaling > __MAX_SCALING__ or arguments.scaling < 0:
+        parser.error("argument --scaling: must be between 0.0 and 0.25")
+
+    if arguments.workers < 1:
+        parser.error("argument --workers: must be at least 1")
+
+    if arguments.command == "match" and arguments.limit < 0:
+        parser.error("argument --limit: must be at least 0")
+
+    try:
+        with ExitStack() as stack:
+            initializer: Callable[..., None] | None = None
+            initargs: tuple = ()
+            if arguments.command == "match":
+                # References are streamed into the corpus, which workers then share through a saved index instead of each
+                # receiving and indexing its own copy.
+                references: Iterator[dict[str, str]] = _read(
+                    _open(arguments.references, stack), _get_format(arguments.references, arguments.reference_format)
+                )
+                corpus: Corpus = Corpus(
+                    (_get_field(record, arguments.reference_column) for record in references),
+                    arguments.scaling,
+                    arguments.decimals,
+                    arguments.norm_case,
+                    arguments.norm_utf8,
+                    arguments.norm_ambiguous,
+                )
+                _set_corpus(corpus)
+                if arguments.workers > 1:
+                    path: Path = Path(stack.enter_context(tempfile.TemporaryDirectory())) / "references.idx"
+                    corpus.save(path)
+                    initializer = _load_corpus
+                    initargs = (str(path),)
+
+            executor: Executor | None = None
+            if arguments.workers > 1:
+                # Importing the process pool imports all of multiprocessing, single process runs are spared it.
+                from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+                executor = stack.enter_context(ProcessPoolExecutor(arguments.workers, initializer=initializer, initargs=initargs))
+
+            results: Iterator[dict[str, object]] = (_match if arguments.command == "match" else _pairs)(
+                arguments, stack, executor
+            )
+            _write(
+                results,
+                sys.stdout,
+                arguments.output_format
+                or _get_format(arguments.queries if arguments.command == "match" else arguments.input, arguments.format),
+            )
+
+    except (ValueError, OSError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e.__cause__ or e}\n")
+
+    return 0
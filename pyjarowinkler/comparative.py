@@ -1,9 +1,184 @@
 """Utilities for preparing and sanitizing string pairs for Jaro-Winkler distance calculations."""
 
-from typing import Final
-from unicodedata import normalize
+import sys
+from collections import OrderedDict
+from threading import Lock
+from typing import ClassVar, Final, NamedTuple
+from unicodedata import is_normalized, normalize
 
-from .glyph import AMBIGUOUS
+from . import glyph
+
+
+class CacheInfo(NamedTuple):
+    """
+    Counters of a SanitizeCache.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to sanitize the string.
+        evictions (int): Entries dropped to stay within maxsize.
+        maxsize (int): Maximum number of entries.
+        currsize (int): Current number of entries.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _get_casefolds() -> dict[int, str]:
+    # Every code point of a plane is decoded from its UTF-32-LE code units: low byte, high byte, plane then zero. Blocks left
+    # as they are by casefold are skipped whole, the others are split until single code points are compared.
+    casefolds: dict[int, str] = {}
+    units: bytearray = bytearray(4 * 0x10000)
+    units[0::4] = bytes(range(256)) * 256
+    units[1::4] = b"".join(bytes((high,)) * 256 for high in range(256))
+    for plane in range(sys.maxunicode // 0x10000 + 1):
+        units[2::4] = bytes((plane,)) * 0x10000
+        blocks: list[tuple[int, str]] = [(plane * 0x10000, units.decode("utf-32-le", "surrogatepass"))]
+        while blocks:
+            start, block = blocks.pop()
+            if block.casefold() == block:
+                continue
+
+            if len(block) == 1:
+                casefolds[start] = block.casefold()
+                continue
+
+            size: int = len(block) // 16 or 1
+            blocks.extend((start + offset, block[offset : offset + size]) for offset in range(0, len(block), size))
+    return casefolds
+
+
+class FoldingTable(dict[int, str]):
+    """
+    Translation table for `str.translate` folding ambiguous glyphs, and optionally case, in a single pass.
+
+    Only code points changed by the folding are kept: the ambiguous glyphs, replaced as the ambiguous glyphs table then
+    casefold would, and the code points whose casefold differs. Every other code point is missing from the table, so
+    `str.translate` leaves it as it is and the table never grows once built.
+
+    Attributes:
+        casefold (bool): Replacements are casefolded.
+
+    """
+
+    def __init__(self, casefold: bool = False) -> None:
+        """
+        Initialize FoldingTable, building every replacement.
+
+        Args:
+            casefold (bool, optional): Casefold the replacements, defaults to False.
+
+        """
+        super().__init__(_get_casefolds() if casefold else ())
+        self.casefold: bool = casefold
+        for code, replacement in glyph.AMBIGUOUS.translation_table().items():
+            self[code] = replacement.casefold() if casefold else replacement
+
+
+class SanitizeCache:
+    """
+    Bounded cache of sanitized strings evicting the least recently used entry first.
+
+    Entries are keyed by `(word, norm_case, norm_utf8, norm_ambiguous)`. Lookups and insertions hold a lock, so a cache can be
+    shared by threads, including on free-threaded interpreters.
+
+    Attributes:
+        maxsize (int): Maximum number of entries.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to sanitize the string.
+        evictions (int): Entries dropped to stay within maxsize.
+
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """
+        Initialize an empty SanitizeCache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries, defaults to 4096.
+
+        Raises:
+            ValueError: If maxsize is lower than 1.
+
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[tuple[str, bool, bool, bool], str] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries.
+
+        Returns:
+            int: Number of cached sanitized strings.
+
+        """
+        return len(self._entries)
+
+    def get(self, key: tuple[str, bool, bool, bool]) -> str | None:
+        """
+        Return the sanitized string cached for key, marking it as the most recently used.
+
+        Args:
+            key (tuple[str, bool, bool, bool]): Word and normalization flags.
+
+        Returns:
+            str | None: Sanitized string, None on a miss.
+
+        """
+        with self._lock:
+            sanitized: str | None = self._entries.get(key)
+            if sanitized is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return sanitized
+
+    def put(self, key: tuple[str, bool, bool, bool], sanitized: str) -> None:
+        """
+        Cache a sanitized string, evicting the least recently used entry when full.
+
+        Args:
+            key (tuple[str, bool, bool, bool]): Word and normalization flags.
+            sanitized (str): Sanitized string.
+
+        """
+        with self._lock:
+            self._entries[key] = sanitized
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the cache counters.
+
+        Returns:
+            CacheInfo: Hits, misses, evictions, maximum and current size.
+
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
 
 
 class Comparative:
@@ -13,11 +188,17 @@ class Comparative:
     Attributes:
         first (str): Sanitized first string (shortest) after normalization.
         second (str): Sanitized second string (longest) after normalization.
+        cache (SanitizeCache | None): Cache of sanitized strings shared by every instance, disabled by default.
+        tables (dict[bool, FoldingTable]): Ambiguous glyphs folding tables, by whether they casefold too, each built the first
+            time it is used.
 
     """
 
     __ASCII_MAX__: Final[int] = 0x80
 
+    cache: ClassVar[SanitizeCache | None] = None
+    tables: ClassVar[dict[bool, FoldingTable]] = {}
+
     def __init__(self, first: str, second: str, norm_case: bool = False, norm_utf8: bool = False, norm_ambiguous: bool = False):
         """
         Initialize Comparative with two input strings, optionally casefolding them if norm_case is True.
@@ -38,9 +219,33 @@ class Comparative:
         if len(self.first) > len(self.second):
             self.first, self.second = self.second, self.first
 
-    def _sanitize(self, word: str, norm_case: bool = False, norm_utf8: bool = False, norm_ambiguous: bool = False) -> str:
+    @classmethod
+    def enable_cache(cls, maxsize: int = 4096) -> SanitizeCache:
         """
-        Sanitize input string.
+        Cache sanitized strings for every later comparison.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries, defaults to 4096.
+
+        Raises:
+            ValueError: If maxsize is lower than 1.
+
+        Returns:
+            SanitizeCache: Newly enabled cache, exposing its counters.
+
+        """
+        cls.cache = SanitizeCache(maxsize)
+        return cls.cache
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        """Stop caching sanitized strings and drop the current cache."""
+        cls.cache = None
+
+    @classmethod
+    def _sanitize(cls, word: str, norm_case: bool = False, norm_utf8: bool = False, norm_ambiguous: bool = False) -> str:
+        """
+        Sanitize input string, through the cache when enabled.
 
         Args:
             word (str): Input string to sanitize.
@@ -55,13 +260,36 @@ class Comparative:
         if not isinstance(word, str):
             raise ValueError("Argument must be a string.")
 
+        cache: SanitizeCache | None = cls.cache
+        if cache is not None:
+            key: tuple[str, bool, bool, bool] = (word, norm_case, norm_utf8, norm_ambiguous)
+            sanitized: str | None = cache.get(key)
+            if sanitized is None:
+                sanitized = cls._transform(word, norm_case, norm_utf8, norm_ambiguous)
+                cache.put(key, sanitized)
+            return sanitized
+
+        return cls._transform(word, norm_case, norm_utf8, norm_ambiguous)
+
+    @staticmethod
+    def _transform(word: str, norm_case: bool, norm_utf8: bool, norm_ambiguous: bool) -> str:
         word = word.strip()
 
-        if norm_utf8:
+        # Code points below `__ASCII_MAX__` are left as they are by NFC and by the ambiguous glyphs table, and casefold to
+        # their lowercase, so ASCII strings skip the Unicode normalizations altogether.
+        if word.isascii():
+            return word.lower() if norm_case else word
+
+        if norm_utf8 and not is_normalized("NFC", word):
             word = normalize("NFC", word)
 
+        # Ambiguous glyphs and case are folded code point by code point, so one table does both in a single pass.
         if norm_ambiguous:
-            word = word.translate(AMBIGUOUS)
+            table: FoldingTable | None = Comparative.tables.get(norm_case)
+            if table is None:
+                # Threads building the same table at once keep whichever is stored first.
+                table = Comparative.tables.setdefault(norm_case, FoldingTable(norm_case))
+            return word.translate(table)
 
         if norm_case:
             word = word.casefold()
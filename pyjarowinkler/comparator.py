@@ -0,0 +1,109 @@
+"""Reusable comparator binding the scaling, rounding and normalization options of Jaro-Winkler calculations."""
+
+from typing import Final
+
+from pyjarowinkler import JaroDistanceError
+from pyjarowinkler.comparative import Comparative
+from pyjarowinkler.distance import __DEFAULT_DECIMALS__, __DEFAULT_SCALING__, __MAX_SCALING__, _score
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class Comparator:
+    """
+    Validate options once and compare any number of string pairs with them.
+
+    Attributes:
+        scaling (float): Scaling factor of the prefix, `0.0` yields plain Jaro scores.
+        decimals (int): Number of decimals to allow in results.
+        norm_case (bool): Strings are converted with casefold.
+        norm_utf8 (bool): Strings are normalized using NFC form.
+        norm_ambiguous (bool): Ambiguous glyphs are normalized.
+
+    """
+
+    def __init__(
+        self,
+        scaling: float = __DEFAULT_SCALING__,
+        decimals: int = __DEFAULT_DECIMALS__,
+        norm_case: bool = False,
+        norm_utf8: bool = False,
+        norm_ambiguous: bool = False,
+    ) -> None:
+        """
+        Initialize Comparator, validating the scaling factor.
+
+        Args:
+            scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+                defaults to 0.1.
+            decimals (int, optional): Number of decimals to allow in result.
+            norm_case (bool, optional): Convert string to uppercase characters.
+            norm_utf8 (bool, optional): If True, both strings are normalized from C (NFC).
+            norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+
+        Raises:
+            JaroDistanceError: If scaling is invalid.
+
+        """
+        if scaling > __MAX_SCALING__ or scaling < 0:
+            raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+        self.scaling: Final[float] = scaling
+        self.decimals: Final[int] = decimals
+        self.norm_case: Final[bool] = norm_case
+        self.norm_utf8: Final[bool] = norm_utf8
+        self.norm_ambiguous: Final[bool] = norm_ambiguous
+
+    def similarity(self, first: str, second: str) -> float:
+        """
+        Return the Jaro Winkler similarity of two strings.
+
+        Args:
+            first (str): String to calculate similarity for.
+            second (str): String to calculate similarity with.
+
+        Raises:
+            JaroDistanceError: If provided arguments aren't strings.
+
+        Returns:
+            float: Jaro Winkler similarity score.
+
+        """
+        try:
+            return _score(
+                Comparative._sanitize(first, self.norm_case, self.norm_utf8, self.norm_ambiguous),
+                Comparative._sanitize(second, self.norm_case, self.norm_utf8, self.norm_ambiguous),
+                self.scaling,
+                self.decimals,
+                False,
+            )
+
+        except ValueError as e:
+            raise JaroDistanceError from e
+
+    def distance(self, first: str, second: str) -> float:
+        """
+        Return the Jaro Winkler distance (`1 - jaro_winkler_similarity`) of two strings.
+
+        Args:
+            first (str): String to calculate distance for.
+            second (str): String to calculate distance with.
+
+        Raises:
+            JaroDistanceError: If provided arguments aren't strings.
+
+        Returns:
+            float: Jaro Winkler distance score.
+
+        """
+        try:
+            return _score(
+                Comparative._sanitize(first, self.norm_case, self.norm_utf8, self.norm_ambiguous),
+                Comparative._sanitize(second, self.norm_case, self.norm_utf8, self.norm_ambiguous),
+                self.scaling,
+                self.decimals,
+                True,
+            )
+
+        except ValueError as e:
+            raise JaroDistanceError from e
@@ -0,0 +1,445 @@
+"""Collection of reference strings sanitized once and searched repeatedly with the Jaro Winkler similarity."""
+
+import json
+import mmap
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import cached_property
+from os import PathLike
+from typing import IO, Final
+
+from pyjarowinkler import JaroDistanceError
+from pyjarowinkler.comparative import Comparative
+from pyjarowinkler.distance import (
+    __DEFAULT_DECIMALS__,
+    __DEFAULT_SCALING__,
+    __EPSILON__,
+    __MAX_PREFIX_LENGTH__,
+    __MAX_SCALING__,
+    Match,
+    _Above,
+    _TopK,
+    _get_cutoff,
+    _get_upper_bound,
+    _order,
+    _similarity,
+)
+from pyjarowinkler.packed import PackedStrings, _Buffer
+from pyjarowinkler.prefilter import MaskPrefilter, Prefilter
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+__INDEX_ALIGNMENT__: Final[int] = 8
+__INDEX_MAGIC__: Final[bytes] = b"PYJWIDX\x00"
+__INDEX_VERSION__: Final[int] = 1
+
+
+class PrefixNode:
+    """
+    Node of a prefix trie over the first four characters of sanitized strings, all the Winkler prefix looks at.
+
+    Attributes:
+        children (dict[str, PrefixNode]): Nodes one character deeper, by character.
+        buckets (dict[int, array | memoryview]): Positions of every string below this node, grouped by length.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty PrefixNode."""
+        self.children: dict[str, PrefixNode] = {}
+        self.buckets: dict[int, _Buffer] = {}
+
+    def add(self, prefix: str, length: int, position: int) -> None:
+        """
+        Record a string below this node and along the path of its prefix.
+
+        Args:
+            prefix (str): Characters of the string left to walk down.
+            length (int): Length of the string.
+            position (int): Position of the string.
+
+        Raises:
+            TypeError: If the node was loaded from an index.
+
+        """
+        nodes: list[PrefixNode] = [self]
+        for character in prefix:
+            nodes.append(nodes[-1].children.setdefault(character, PrefixNode()))
+
+        for node in nodes:
+            positions: _Buffer = node.buckets.setdefault(length, array("I"))
+            if not isinstance(positions, array):
+                raise TypeError("Prefix nodes loaded from an index are read-only.")
+            positions.append(position)
+
+
+class Corpus:
+    """
+    Reference strings sanitized once so that queries only pay for their own sanitization and the comparisons.
+
+    Attributes:
+        references (PackedStrings): Reference strings as they were provided, the sanitized ones when sanitizing changed none.
+        sanitized (PackedStrings): Sanitized reference strings, packed as code points.
+        lengths (array | memoryview): Length of each sanitized reference.
+        prefilter (Prefilter | None): Bound on the matches of a query and a reference, used to reject references early.
+        signatures (Sequence): Prefilter signature of each sanitized reference.
+        trie (PrefixNode): Positions of the references grouped by prefix, then by sanitized length.
+        scaling (float): Scaling factor of the prefix, `0.0` yields plain Jaro scores.
+        decimals (int): Number of decimals to allow in results.
+        norm_case (bool): Strings are converted with casefold.
+        norm_utf8 (bool): Strings are normalized using NFC form.
+        norm_ambiguous (bool): Ambiguous glyphs are normalized.
+
+    """
+
+    def __init__(
+        self,
+        references: Iterable[str],
+        scaling: float = __DEFAULT_SCALING__,
+        decimals: int = __DEFAULT_DECIMALS__,
+        norm_case: bool = False,
+        norm_utf8: bool = False,
+        norm_ambiguous: bool = False,
+        prefilter: Prefilter | None = None,
+    ) -> None:
+        """
+        Initialize Corpus, sanitizing every reference string.
+
+        Args:
+            references (Iterable[str]): Strings searched by later queries.
+            scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+                defaults to 0.1.
+            decimals (int, optional): Number of decimals to allow in result.
+            norm_case (bool, optional): Convert string to uppercase characters.
+            norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+            norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+            prefilter (Prefilter, optional): Bound on the matches of a query and a reference, defaults to a MaskPrefilter.
+
+        Raises:
+            JaroDistanceError: If references aren't strings or if scaling is invalid.
+
+        """
+        if scaling > __MAX_SCALING__ or scaling < 0:
+            raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+        self.scaling: Final[float] = scaling
+        self.decimals: Final[int] = decimals
+        self.norm_case: Final[bool] = norm_case
+        self.norm_utf8: Final[bool] = norm_utf8
+        self.norm_ambiguous: Final[bool] = norm_ambiguous
+
+        self.sanitized: PackedStrings = PackedStrings()
+        self.trie: PrefixNode = PrefixNode()
+        # Originals are only packed apart from the first one sanitizing changed, the earlier ones being their own sanitized.
+        originals: PackedStrings | None = None
+        try:
+            for position, word in enumerate(references):
+                sanitized: str = Comparative._sanitize(word, norm_case, norm_utf8, norm_ambiguous)
+                if originals is None and sanitized != word:
+                    originals = PackedStrings(self.sanitized)
+                if originals is not None:
+                    originals.append(word)
+                self.sanitized.append(sanitized)
+                self.trie.add(sanitized[:__MAX_PREFIX_LENGTH__], len(sanitized), position)
+
+        except ValueError as e:
+            raise JaroDistanceError from e
+
+        self.references: PackedStrings = self.sanitized if originals is None else originals
+        self.lengths: _Buffer = self.sanitized.lengths
+        self.prefilter: Final[Prefilter] = MaskPrefilter() if prefilter is None else prefilter
+        self.signatures: Sequence = self.prefilter.signatures(self.sanitized)
+
+    def __len__(self) -> int:
+        """
+        Return the number of reference strings.
+
+        Returns:
+            int: Number of reference strings.
+
+        """
+        return len(self.references)
+
+    def save(self, path: "str | PathLike[str]") -> None:
+        """
+        Write the sanitized references and their index to a file, to be reopened with `load` without sanitizing them again.
+
+        Code points, offsets and lengths of the references, the prefix trie and the prefilter signatures, when they are an
+        array, are written as they are laid out in memory after a small JSON header, each aligned to 8 bytes.
+
+        Args:
+            path (str | PathLike): File to write the index to.
+
+        """
+        sections: dict[str, _Buffer] = {
+            "codes": self.sanitized.codes,
+            "offsets": self.sanitized.offsets,
+            "lengths": self.sanitized.lengths,
+        }
+        if self.references is not self.sanitized:
+            sections["reference_codes"] = self.references.codes
+            sections["reference_offsets"] = self.references.offsets
+            sections["reference_lengths"] = self.references.lengths
+
+        if isinstance(self.signatures, array | memoryview):
+            sections["signatures"] = self.signatures
+
+        sections["nodes"], sections["buckets"], sections["positions"] = _flatten(self.trie)
+
+        layout: dict[str, tuple[str, int, int]] = {}
+        offset: int = 0
+        for name, section in sections.items():
+            size: int = len(section) * section.itemsize
+            layout[name] = (section.typecode if isinstance(section, array) else section.format, offset, size)
+            offset = _align(offset + size)
+
+        header: bytes = json.dumps(
+            {
+                "version": __INDEX_VERSION__,
+                "byteorder": sys.byteorder,
+                "scaling": self.scaling,
+                "decimals": self.decimals,
+                "norm_case": self.norm_case,
+                "norm_utf8": self.norm_utf8,
+                "norm_ambiguous": self.norm_ambiguous,
+                "prefilter": type(self.prefilter).__name__,
+                "sections": layout,
+            }
+        ).encode()
+        with open(path, "wb") as stream:
+            stream.write(__INDEX_MAGIC__)
+            stream.write(len(header).to_bytes(8, "little"))
+            stream.write(header)
+            _pad(stream, len(__INDEX_MAGIC__) + 8 + len(header))
+            for section in sections.values():
+                stream.write(section)
+                _pad(stream, len(section) * section.itemsize)
+
+    @classmethod
+    def load(cls, path: "str | PathLike[str]", mmap: bool = True, prefilter: Prefilter | None = None) -> "Corpus":
+        """
+        Return the Corpus saved to a file with `save`, without sanitizing or indexing its references again.
+
+        When memory-mapped, references and their index are read straight from the file's pages as they are needed, so
+        loading is near-instant whatever the size of the corpus and processes loading the same file share its pages.
+
+        Args:
+            path (str | PathLike): File the index was saved to.
+            mmap (bool, optional): Map the file into memory instead of reading it whole, defaults to True.
+            prefilter (Prefilter, optional): Bound on the matches of a query and a reference, defaults to a MaskPrefilter.
+                Saved signatures are only reused by a prefilter of the same class, they are computed again otherwise.
+
+        Raises:
+            JaroDistanceError: If the file isn't an index saved on a machine of the same byte order.
+
+        Returns:
+            Corpus: Corpus with the settings it was saved with.
+
+        """
+        try:
+            buffer: memoryview = _read_index(path, mmap)
+            if buffer[: len(__INDEX_MAGIC__)] != __INDEX_MAGIC__:
+                raise ValueError("Provided file isn't a corpus index.")
+
+            start: int = len(__INDEX_MAGIC__) + 8
+            length: int = int.from_bytes(buffer[len(__INDEX_MAGIC__) : start], "little")
+            header: dict = json.loads(bytes(buffer[start : start + length]))
+            if header["version"] != __INDEX_VERSION__:
+                raise ValueError("Provided corpus index version is unsupported.")
+
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError("Provided corpus index was saved with another byte order.")
+
+            start = _align(start + length)
+            sections: dict[str, memoryview] = {}
+            for name, (format, offset, size) in header["sections"].items():
+                section: memoryview = buffer[start + offset : start + offset + size]
+                if len(section) != size:
+                    raise ValueError("Provided corpus index is truncated.")
+                sections[name] = section.cast(format)
+
+            corpus: Corpus = cls(
+                (),
+                header["scaling"],
+                header["decimals"],
+                header["norm_case"],
+                header["norm_utf8"],
+                header["norm_ambiguous"],
+                prefilter,
+            )
+            corpus.sanitized = PackedStrings.from_buffers(sections["codes"], sections["offsets"], sections["lengths"])
+            corpus.references = corpus.sanitized
+            if "reference_codes" in sections:
+                corpus.references = PackedStrings.from_buffers(
+                    sections["reference_codes"], sections["reference_offsets"], sections["reference_lengths"]
+                )
+
+            corpus.lengths = corpus.sanitized.lengths
+            if "signatures" in sections and header["prefilter"] == type(corpus.prefilter).__name__:
+                corpus.signatures = sections["signatures"]
+            else:
+                corpus.signatures = corpus.prefilter.signatures(corpus.sanitized)
+
+            corpus.trie = _MappedNode(sections["nodes"], sections["buckets"], sections["positions"], 0)
+
+        except (ValueError, KeyError) as e:
+            raise JaroDistanceError from e
+
+        return corpus
+
+    def search(self, query: str, threshold: float) -> list[Match]:
+        """
+        Return every reference at least as similar to the query as the threshold.
+
+        Args:
+            query (str): String to find the closest references for.
+            threshold (float): Least Jaro Winkler similarity for a reference to be returned, compared before rounding.
+
+        Raises:
+            JaroDistanceError: If query isn't a string.
+
+        Returns:
+            list[Match]: Matching references ordered by decreasing score, ties kept in corpus order.
+
+        """
+        found: _Above = _Above(threshold)
+        self._scan(query, found)
+        return self._resolve(found)
+
+    def top_k(self, query: str, k: int = 5, min_score: float = 0.0) -> list[Match]:
+        """
+        Return the `k` references most similar to the query.
+
+        Args:
+            query (str): String to find the closest references for.
+            k (int, optional): Maximum number of references to return, defaults to 5.
+            min_score (float, optional): Least Jaro Winkler similarity for a reference to be returned, compared before rounding.
+
+        Raises:
+            JaroDistanceError: If query isn't a string.
+
+        Returns:
+            list[Match]: Best references ordered by decreasing score, ties kept in corpus order.
+
+        """
+        if k < 1:
+            return []
+
+        best: _TopK = _TopK(k, min_score)
+        self._scan(query, best)
+        return self._resolve(best)
+
+    def _resolve(self, found: _Above) -> list[Match]:
+        # References are only decoded for the retained matches, the scan pushes their position alone.
+        return [match._replace(choice=self.references[match.position]) for match in found.matches(self.decimals)]
+
+    def _scan(self, query: str, found: _Above) -> None:
+        try:
+            query = Comparative._sanitize(query, self.norm_case, self.norm_utf8, self.norm_ambiguous)
+
+        except ValueError as e:
+            raise JaroDistanceError from e
+
+        prepared: object = self.prefilter.prepare(query)
+        prefix: str = query[:__MAX_PREFIX_LENGTH__]
+        codes: memoryview = memoryview(array("I", map(ord, query)))
+        packed: _Buffer = self.sanitized.codes
+        offsets: _Buffer = self.sanitized.offsets
+        flags: bytearray = bytearray()
+        # `path[n]` holds the references sharing the query's first `n` characters. Those not sharing the next one as well
+        # share a prefix of exactly `n`, so they all get the same boost and a bound that only depends on their length.
+        path: list[PrefixNode] = [self.trie]
+        for character in prefix:
+            if character not in path[-1].children:
+                break
+            path.append(path[-1].children[character])
+
+        # Groups that can score the highest come first. Once a group cannot reach the cutoff none of the following can either.
+        bounds: list[tuple[float, int, int]] = sorted(
+            (
+                (_get_upper_bound(min(len(query), length), max(len(query), length), common * self.scaling), common, length)
+                for common, node in enumerate(path)
+                for length in node.buckets
+            ),
+            reverse=True,
+        )
+        for bound, common, length in bounds:
+            if bound < found.cutoff - __EPSILON__:
+                break
+
+            # References of a deeper node are scanned with its own group, they share the query's next character too.
+            deeper: int = codes[common] if common + 1 < len(path) and length > common else -1
+            boost: float = common * self.scaling
+            short_length, long_length = sorted((len(query), length))
+            for position in path[common].buckets[length]:
+                if deeper >= 0 and packed[offsets[position] + common] == deeper:
+                    continue
+
+                cutoff: float = _get_cutoff(found.cutoff, boost)
+                if self.prefilter.rejects(prepared, self.signatures[position], short_length, long_length, cutoff):
+                    continue
+
+                short, long = _order(codes, self.sanitized.view(position))
+                similarity: float = _similarity(short, long, flags, cutoff)
+                found.push(similarity + (boost * (1 - similarity)), position, "")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // __INDEX_ALIGNMENT__) * __INDEX_ALIGNMENT__
+
+
+def _pad(stream: IO[bytes], size: int) -> None:
+    stream.write(bytes(_align(size) - size))
+
+
+def _read_index(path: "str | PathLike[str]", mapped: bool) -> memoryview:
+    with open(path, "rb") as stream:
+        if mapped:
+            return memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ))
+
+        return memoryview(stream.read())
+
+
+def _flatten(trie: PrefixNode) -> tuple[array, array, array]:
+    # Nodes in breadth first order as (character, first child, children, first bucket, buckets), so the children of a node
+    # are contiguous and the root is node 0, then buckets as (length, start, count) into the positions of all buckets.
+    nodes: array = array("I")
+    buckets: array = array("I")
+    positions: array = array("I")
+    queue: list[tuple[int, PrefixNode]] = [(0, trie)]
+    for character, node in queue:
+        nodes.extend((character, len(queue), len(node.children), len(buckets) // 3, len(node.buckets)))
+        for length, bucket in node.buckets.items():
+            buckets.extend((length, len(positions), len(bucket)))
+            positions.extend(bucket)
+        queue.extend((ord(child), descendant) for child, descendant in node.children.items())
+    return nodes, buckets, positions
+
+
+class _MappedNode(PrefixNode):
+    # Node of a trie loaded from an index, reading its children and buckets from the flattened trie the first time they are
+    # used. Queries only walk the few nodes along their prefix, so loading doesn't depend on the size of the trie.
+
+    def __init__(self, nodes: memoryview, buckets: memoryview, positions: memoryview, index: int) -> None:
+        self._nodes: memoryview = nodes
+        self._buckets: memoryview = buckets
+        self._positions: memoryview = positions
+        self._index: int = index
+
+    @cached_property
+    def children(self) -> dict[str, PrefixNode]:  # type: ignore[override]
+        start: int = self._nodes[self._index * 5 + 1]
+        return {
+            chr(self._nodes[child * 5]): _MappedNode(self._nodes, self._buckets, self._positions, child)
+            for child in range(start, start + self._nodes[self._index * 5 + 2])
+        }
+
+    @cached_property
+    def buckets(self) -> dict[int, _Buffer]:  # type: ignore[override]
+        start: int = self._nodes[self._index * 5 + 3]
+        buckets: dict[int, _Buffer] = {}
+        for bucket in range(start, start + self._nodes[self._index * 5 + 4]):
+            length, first, count = self._buckets[bucket * 3 : bucket * 3 + 3]
+            buckets[length] = self._positions[first : first + count]
+        return buckets
@@ -0,0 +1,173 @@
+"""Streaming deduplication of records, grouping each one with the most similar recently seen cluster."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Final, NamedTuple, TypeVar
+
+from pyjarowinkler import JaroDistanceError
+from pyjarowinkler.comparative import Comparative
+from pyjarowinkler.distance import (
+    __DEFAULT_DECIMALS__,
+    __DEFAULT_SCALING__,
+    __EPSILON__,
+    __MAX_PREFIX_LENGTH__,
+    __MAX_SCALING__,
+    Match,
+    _TopK,
+    _get_cutoff,
+    _get_prefix,
+    _get_upper_bound,
+    _order,
+    _similarity,
+)
+from pyjarowinkler.prefilter import MaskPrefilter
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+__DEFAULT_WINDOW__: Final[int] = 10_000
+
+_Record = TypeVar("_Record")
+
+
+class Assignment(NamedTuple):
+    """
+    Cluster a record was assigned to by `dedupe`.
+
+    Attributes:
+        record (Any): Record as it was provided.
+        position (int): Position of the record in the input.
+        cluster (int): Position of the record representing the cluster, the record's own position when it starts one.
+        score (float): Jaro Winkler similarity of the record with the representative of its cluster.
+
+    """
+
+    record: Any
+    position: int
+    cluster: int
+    score: float
+
+
+def dedupe(
+    records: Iterable[_Record],
+    key: Callable[[_Record], str] | None = None,
+    threshold: float = 0.9,
+    window: int = __DEFAULT_WINDOW__,
+    scaling: float = __DEFAULT_SCALING__,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+) -> Iterator[Assignment]:
+    """
+    Lazily assign every record to the cluster whose representative is the most similar, starting a new one when none is.
+
+    Only the sanitized key of the `window` most recently used representatives is kept, so memory stays bounded however many
+    records are consumed. A record whose cluster was evicted from the window starts a new cluster. Representatives are grouped
+    by length, groups too long or too short to reach the threshold are skipped, and a character-class mask rejects most of
+    the others before they are scored.
+
+    Args:
+        records (Iterable): Records to deduplicate, consumed one at a time.
+        key (Callable, optional): Function returning the string compared for a record, defaults to the record itself.
+        threshold (float, optional): Least Jaro Winkler similarity with a representative to join its cluster, compared before
+            rounding, defaults to 0.9.
+        window (int, optional): Maximum number of cluster representatives kept, defaults to 10000.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1.
+        decimals (int, optional): Number of decimals to allow in scores.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+
+    Raises:
+        JaroDistanceError: If scaling or window is invalid, or, while iterating, if a key isn't a string.
+
+    Returns:
+        Iterator[Assignment]: Assignment of each record, in input order.
+
+    """
+    if scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    if window < 1:
+        raise JaroDistanceError("Provided window size is invalid.")
+
+    return _dedupe(
+        records, _identity if key is None else key, threshold, window, scaling, decimals, norm_case, norm_utf8, norm_ambiguous
+    )
+
+
+def _identity(word: str) -> str:
+    return word
+
+
+def _dedupe(
+    records: Iterable[Any],
+    key: Callable[[Any], str],
+    threshold: float,
+    window: int,
+    scaling: float,
+    decimals: int,
+    norm_case: bool,
+    norm_utf8: bool,
+    norm_ambiguous: bool,
+) -> Iterator[Assignment]:
+    # Representatives by cluster, least recently used first, and by length along with their prefilter signature.
+    representatives: OrderedDict[int, str] = OrderedDict()
+    buckets: dict[int, dict[int, tuple[str, int]]] = {}
+    prefilter: MaskPrefilter = MaskPrefilter()
+    flags: bytearray = bytearray()
+    for position, record in enumerate(records):
+        try:
+            word: str = Comparative._sanitize(
+                key(record), norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous
+            )
+
+        except ValueError as e:
+            raise JaroDistanceError from e
+
+        # Groups that can score the highest come first. Once a group cannot reach the cutoff none of the following can either.
+        best: _TopK = _TopK(1, threshold)
+        prepared: tuple[int, dict[int, int]] = prefilter.prepare(word)
+        bounds: list[tuple[float, int]] = sorted(
+            (
+                (
+                    _get_upper_bound(
+                        min(len(word), length),
+                        max(len(word), length),
+                        min(__MAX_PREFIX_LENGTH__, len(word), length) * scaling,
+                    ),
+                    length,
+                )
+                for length in buckets
+            ),
+            reverse=True,
+        )
+        for bound, length in bounds:
+            if bound < best.cutoff - __EPSILON__:
+                break
+
+            for cluster, (representative, signature) in buckets[length].items():
+                short, long = _order(word, representative)
+                boost: float = _get_prefix(short, long) * scaling
+                cutoff: float = _get_cutoff(best.cutoff, boost)
+                if prefilter.rejects(prepared, signature, len(short), len(long), cutoff):
+                    continue
+
+                similarity: float = _similarity(short, long, flags, cutoff)
+                best.push(similarity + (boost * (1 - similarity)), cluster, representative)
+
+        if best.retained:
+            match: Match = best.matches(decimals)[0]
+            representatives.move_to_end(match.position)
+            yield Assignment(record, position, match.position, match.score)
+            continue
+
+        representatives[position] = word
+        buckets.setdefault(len(word), {})[position] = (word, prefilter.signature(word))
+        if len(representatives) > window:
+            evicted, representative = representatives.popitem(last=False)
+            del buckets[len(representative)][evicted]
+            if not buckets[len(representative)]:
+                del buckets[len(representative)]
+        yield Assignment(record, position, position, 1.0)
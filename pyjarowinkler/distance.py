@@ -1,19 +1,93 @@
 """Finds a non-euclidean distance or similarity between two strings."""
 
-from typing import Final
+from array import array
+from collections.abc import Hashable, Iterable, Sequence, Sized
+from heapq import heappush, heapreplace
+from math import ceil
+from typing import Final, NamedTuple, TypeVar, overload
 
-from pyjarowinkler import JaroDistanceError
+from pyjarowinkler import JaroDistanceError, vectorized
 from pyjarowinkler.comparative import Comparative
+from pyjarowinkler.parallel import _map_chunks
 
 __author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
 
 __DEFAULT_DECIMALS__: Final[int] = 2
 __DEFAULT_SCALING__: Final[float] = 0.1
+__EPSILON__: Final[float] = 1e-9
+__MAX_BITPARALLEL_LENGTH__: Final[int] = 64
+__MAX_BLOCK_PAIRS__: Final[int] = 65536
 __MAX_PREFIX_LENGTH__: Final[int] = 4
 __MAX_SCALING__: Final[float] = 0.25
+__MIN_VECTORIZED_PAIRS__: Final[int] = 32
+__METRICS__: Final[dict[str, tuple[bool, bool]]] = {
+    "jaro": (False, False),
+    "jaro_distance": (False, True),
+    "jaro_winkler": (True, False),
+    "jaro_winkler_distance": (True, True),
+}
 
+# Strings are compared as `str`, or as code points read from packed strings.
+_Word = Sequence[Hashable]
+_Ordered = TypeVar("_Ordered", str, memoryview)
 
-def _get_prefix(short: str, long: str) -> int:
+
+class Match(NamedTuple):
+    """
+    A candidate string retained by a search along with its score.
+
+    Attributes:
+        choice (str): Candidate string as it was provided.
+        score (float): Jaro Winkler similarity of the candidate to the query.
+        position (int): Index of the candidate in the provided choices.
+
+    """
+
+    choice: str
+    score: float
+    position: int
+
+
+class _Above:
+    # Retains `(score, -position, choice)` of every choice scoring at least `cutoff`.
+
+    def __init__(self, cutoff: float) -> None:
+        self.cutoff: float = cutoff
+        self.retained: list[tuple[float, int, str]] = []
+
+    def push(self, score: float, position: int, choice: str) -> None:
+        if score >= self.cutoff:
+            self.retained.append((score, -position, choice))
+
+    def matches(self, decimals: int) -> list[Match]:
+        return [
+            Match(choice, round(score, decimals), -position) for score, position, choice in sorted(self.retained, reverse=True)
+        ]
+
+
+class _TopK(_Above):
+    # Min-heap whose root is the worst retained choice, the latest one among equal scores, so choices may be pushed in any
+    # order. Once `k` choices are retained, `cutoff` rises to the score a new choice has to reach.
+
+    def __init__(self, k: int, min_score: float) -> None:
+        super().__init__(min_score)
+        self.k: int = k
+        self.min_score: float = min_score
+
+    def push(self, score: float, position: int, choice: str) -> None:
+        if score < self.cutoff:
+            return
+
+        if len(self.retained) < self.k:
+            heappush(self.retained, (score, -position, choice))
+        elif (score, -position) > self.retained[0][:2]:
+            heapreplace(self.retained, (score, -position, choice))
+
+        if len(self.retained) == self.k:
+            self.cutoff = max(self.min_score, self.retained[0][0])
+
+
+def _get_prefix(short: _Word, long: _Word) -> int:
     prefix: int = 0
     for left, right in zip(short[:__MAX_PREFIX_LENGTH__], long[:__MAX_PREFIX_LENGTH__], strict=False):
         if left != right:
@@ -22,55 +96,161 @@ def _get_prefix(short: str, long: str) -> int:
     return prefix
 
 
-def _get_limit(long: list[str]) -> int:
+def _get_limit(long: Sized) -> int:
     return max(0, len(long) // 2 - 1)
 
 
-def _clean(assigned: list[str]) -> None:
-    assigned[:] = [x for x in assigned if x]
+def _get_required_matches(short: int, long: int, cutoff: float) -> int:
+    # Even with no transpositions, Jaro similarity is at most `(m / short + m / long + 1) / 3`, a pair with fewer than this
+    # many matches `m` cannot reach `cutoff`.
+    return ceil((3 * cutoff - 1) * short * long / (short + long) - __EPSILON__)
+
 
+def _get_upper_bound(short: int, long: int, boost: float) -> float:
+    # Best Jaro Winkler similarity strings of these lengths can reach once the Winkler `boost` (prefix times scaling) is
+    # applied: every character of the shortest matches, in order.
+    if short == 0:
+        return 1.0 if long == 0 else 0.0
 
-def _get_transpositions(first: list[str], second: list[str]) -> int:
-    return sum(left != right for left, right in zip(first, second, strict=True)) // 2
+    similarity: float = (2 + short / long) / 3
+    return similarity + (boost * (1 - similarity))
 
 
-def _get_matches_and_transpositions(short: list[str], long: list[str]) -> tuple[int, int]:
-    assigned_short: list[str] = [""] * len(short)
-    assigned_long: list[str] = [""] * len(long)
+def _get_cutoff(threshold: float, boost: float) -> float:
+    # Jaro similarity needed to reach `threshold` once the Winkler `boost` (prefix times scaling) is applied.
+    return (threshold - boost) / (1 - boost) if boost < 1 else 0.0
 
+
+def _get_matches_and_transpositions(short: str, long: str, flags: bytearray | None = None, required: int = 0) -> tuple[int, int]:
+    # `flags[:len(long)]` marks consumed indexes of `long` and `flags[len(long):]` matched indexes of `short`. A provided
+    # buffer must be zeroed, it is grown when too small and handed back zeroed so it can be reused for the next pair.
+    # Scanning stops with no match as soon as `required` matches are out of reach.
+    size: int = len(long)
+    if flags is None:
+        flags = bytearray(size + len(short))
+    elif len(flags) < size + len(short):
+        flags.extend(bytes(size + len(short) - len(flags)))
+
+    # Windows only slide right, so consumed occurrences of a character always precede its unconsumed ones in the window
+    # and the search can resume right after the last one consumed.
+    cursors: dict[str, int] = {}
     limit: int = _get_limit(long)
+    misses: int = len(short) - required
+    matches: int = 0
     for position, character in enumerate(short):
-        left: int = max(0, position - limit)
-        right: int = min(len(long), position + limit + 1)
+        left: int = max(0, position - limit, cursors.get(character, 0))
+        index: int = long.find(character, left, position + limit + 1)
+        if index >= 0:
+            cursors[character] = index + 1
+            flags[index] = flags[size + position] = 1
+            matches += 1
+            continue
 
-        try:
-            index: int = long.index(character, left, right)
-            assigned_short[position] = assigned_long[index] = character
-            long[index] = ""
+        misses -= 1
+        if misses < 0:
+            flags[: size + len(short)] = bytes(size + len(short))
+            return 0, 0
 
-        except ValueError:
-            continue
+    transpositions: int = 0
+    short_index: int = size
+    long_index: int = 0
+    for _ in range(matches):
+        short_index = flags.find(1, short_index)
+        long_index = flags.find(1, long_index, size)
+        flags[short_index] = flags[long_index] = 0
+        if short[short_index - size] != long[long_index]:
+            transpositions += 1
+
+    return matches, transpositions // 2
+
+
+def _get_matches_and_transpositions_bitparallel(short: _Word, long: _Word, required: int = 0) -> tuple[int, int]:
+    # Each bit stands for an index of `long`: `positions[c]` flags the unconsumed indexes of `c`, `consumed` the matched ones.
+    positions: dict[Hashable, int] = {}
+    for index, character in enumerate(long):
+        positions[character] = positions.get(character, 0) | (1 << index)
+
+    limit: int = _get_limit(long)
+    window: int = (1 << (2 * limit + 1)) - 1
+    misses: int = len(short) - required
+    consumed: int = 0
+    assigned: list[Hashable] = []
+    for position, character in enumerate(short):
+        candidates: int = positions.get(character, 0)
+        if candidates:
+            candidates &= window << (position - limit) if position >= limit else window >> (limit - position)
+            if candidates:
+                candidates &= -candidates
+                positions[character] ^= candidates
+                consumed |= candidates
+                assigned.append(character)
+                continue
+
+        misses -= 1
+        if misses < 0:
+            return 0, 0
+
+    transpositions: int = 0
+    for character in assigned:
+        if character != long[(consumed & -consumed).bit_length() - 1]:
+            transpositions += 1
+        consumed &= consumed - 1
 
-    _clean(assigned_short)
-    _clean(assigned_long)
+    return len(assigned), transpositions // 2
 
-    return len(assigned_short), _get_transpositions(assigned_short, assigned_long)
 
+def _order(first: _Ordered, second: _Ordered) -> tuple[_Ordered, _Ordered]:
+    return (second, first) if len(first) > len(second) else (first, second)
 
-def _similarity(short: str, long: str) -> float:
+
+def _similarity(short: _Word, long: _Word, flags: bytearray | None = None, cutoff: float = 0.0) -> float:
+    # With a `cutoff`, pairs that provably score below it are given up on early and reported as `0.0`.
     if short == long:
         return 1.0
 
     if len(short) < 1 or len(long) < 1:
         return 0.0
 
-    matches, transpositions = _get_matches_and_transpositions(list(short), list(long))
+    required: int = _get_required_matches(len(short), len(long), cutoff) if cutoff > 0 else 0
+    if required > len(short):
+        return 0.0
+
+    if isinstance(short, str) and isinstance(long, str) and len(long) > __MAX_BITPARALLEL_LENGTH__:
+        matches, transpositions = _get_matches_and_transpositions(short, long, flags, required)
+    else:
+        matches, transpositions = _get_matches_and_transpositions_bitparallel(short, long, required)
     if matches == 0:
         return 0.0
 
     return (matches / len(short) + matches / len(long) + (matches - transpositions) / matches) / 3
 
 
+@overload
+def get_jaro_similarity(
+    first: str,
+    second: str,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    min_similarity: None = ...,
+) -> float: ...
+
+
+@overload
+def get_jaro_similarity(
+    first: str,
+    second: str,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    min_similarity: float,
+) -> float | None: ...
+
+
 def get_jaro_similarity(
     first: str,
     second: str,
@@ -78,7 +258,9 @@ def get_jaro_similarity(
     norm_case: bool = False,
     norm_utf8: bool = False,
     norm_ambiguous: bool = False,
-) -> float:
+    *,
+    min_similarity: float | None = None,
+) -> float | None:
     """
     Return the Jaro similarity of two strings.
 
@@ -89,22 +271,57 @@ def get_jaro_similarity(
         norm_utf8 (bool, optional): If True, both strings are normalized from C (NFC).
         norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
         decimals (int, optional): Number of decimals to allow in result, defaults to 2.
+        min_similarity (float, optional): Give up on pairs scoring below this similarity, compared before rounding.
 
     Raises:
         JaroDistanceError: If provided arguments aren't strings.
 
     Returns:
-        float: Similarity between the two provided strings.
+        float | None: Similarity between the two provided strings, `None` if below `min_similarity`.
 
     """
     try:
-        comparative: Comparative = Comparative(first, second, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
-        return round(_similarity(comparative.first, comparative.second), decimals)
+        comparative: Comparative = Comparative(
+            first, second, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous
+        )
+        similarity: float = _similarity(
+            comparative.first, comparative.second, cutoff=0.0 if min_similarity is None else min_similarity
+        )
+        if min_similarity is not None and similarity < min_similarity:
+            return None
+
+        return round(similarity, decimals)
 
     except ValueError as e:
         raise JaroDistanceError from e
 
 
+@overload
+def get_jaro_distance(
+    first: str,
+    second: str,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    max_distance: None = ...,
+) -> float: ...
+
+
+@overload
+def get_jaro_distance(
+    first: str,
+    second: str,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    max_distance: float,
+) -> float | None: ...
+
+
 def get_jaro_distance(
     first: str,
     second: str,
@@ -112,7 +329,9 @@ def get_jaro_distance(
     norm_case: bool = False,
     norm_utf8: bool = False,
     norm_ambiguous: bool = False,
-) -> float:
+    *,
+    max_distance: float | None = None,
+) -> float | None:
     """
     Return the Jaro distance (`1 - jaro_similarity`) of two strings.
 
@@ -123,24 +342,59 @@ def get_jaro_distance(
         norm_utf8 (bool, optional): If True, both strings are normalized from C (NFC).
         norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
         decimals (int, optional): Number of decimals to allow in result, defaults to 2.
+        max_distance (float, optional): Give up on pairs scoring above this distance, compared before rounding.
 
     Raises:
         JaroDistanceError: If provided arguments aren't strings.
 
     Returns:
-        float: Distance between the two provided strings.
+        float | None: Distance between the two provided strings, `None` if above `max_distance`.
 
     """
     try:
         comparative: Comparative = Comparative(
             first, second, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous
         )
-        return round(1 - _similarity(comparative.first, comparative.second), decimals)
+        distance: float = 1 - _similarity(
+            comparative.first, comparative.second, cutoff=0.0 if max_distance is None else 1 - max_distance
+        )
+        if max_distance is not None and distance > max_distance:
+            return None
+
+        return round(distance, decimals)
 
     except ValueError as e:
         raise JaroDistanceError from e
 
 
+@overload
+def get_jaro_winkler_similarity(
+    first: str,
+    second: str,
+    scaling: float = ...,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    min_similarity: None = ...,
+) -> float: ...
+
+
+@overload
+def get_jaro_winkler_similarity(
+    first: str,
+    second: str,
+    scaling: float = ...,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    min_similarity: float,
+) -> float | None: ...
+
+
 def get_jaro_winkler_similarity(
     first: str,
     second: str,
@@ -149,7 +403,9 @@ def get_jaro_winkler_similarity(
     norm_case: bool = False,
     norm_utf8: bool = False,
     norm_ambiguous: bool = False,
-) -> float:
+    *,
+    min_similarity: float | None = None,
+) -> float | None:
     """
     Return the Jaro Winkler similarity of two strings.
 
@@ -162,12 +418,13 @@ def get_jaro_winkler_similarity(
         norm_case (bool, optional): Convert string to uppercase characters.
         norm_utf8 (bool, optional): If True, both strings are normalized from C (NFC).
         norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        min_similarity (float, optional): Give up on pairs scoring below this similarity, compared before rounding.
 
     Raises:
         JaroDistanceError: If provided arguments aren't strings.
 
     Returns:
-        float: Jaro Winkler similarity score.
+        float | None: Jaro Winkler similarity score, `None` if below `min_similarity`.
 
     """
     if scaling > __MAX_SCALING__ or scaling < 0:
@@ -177,14 +434,48 @@ def get_jaro_winkler_similarity(
         comparative: Comparative = Comparative(
             first, second, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous
         )
-        similarity: float = _similarity(comparative.first, comparative.second)
+        boost: float = _get_prefix(comparative.first, comparative.second) * scaling
+        similarity: float = _similarity(
+            comparative.first, comparative.second, cutoff=0.0 if min_similarity is None else _get_cutoff(min_similarity, boost)
+        )
+        similarity = similarity + (boost * (1 - similarity))
+        if min_similarity is not None and similarity < min_similarity:
+            return None
 
-        return round(similarity + (_get_prefix(comparative.first, comparative.second) * scaling * (1 - similarity)), decimals)
+        return round(similarity, decimals)
 
     except ValueError as e:
         raise JaroDistanceError from e
 
 
+@overload
+def get_jaro_winkler_distance(
+    first: str,
+    second: str,
+    scaling: float = ...,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    max_distance: None = ...,
+) -> float: ...
+
+
+@overload
+def get_jaro_winkler_distance(
+    first: str,
+    second: str,
+    scaling: float = ...,
+    decimals: int = ...,
+    norm_case: bool = ...,
+    norm_utf8: bool = ...,
+    norm_ambiguous: bool = ...,
+    *,
+    max_distance: float,
+) -> float | None: ...
+
+
 def get_jaro_winkler_distance(
     first: str,
     second: str,
@@ -193,7 +484,9 @@ def get_jaro_winkler_distance(
     norm_case: bool = False,
     norm_utf8: bool = False,
     norm_ambiguous: bool = False,
-) -> float:
+    *,
+    max_distance: float | None = None,
+) -> float | None:
     """
     Return the Jaro Winkler distance (`1 - jaro_winkler_similarity`) of two strings.
 
@@ -206,12 +499,13 @@ def get_jaro_winkler_distance(
         norm_case (bool, optional): Convert string to uppercase characters.
         norm_utf8 (bool, optional): If True, both strings are normalized from C (NFC).
         norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        max_distance (float, optional): Give up on pairs scoring above this distance, compared before rounding.
 
     Raises:
         JaroDistanceError: If provided arguments aren't strings.
 
     Returns:
-        float: Jaro Winkler distance score.
+        float | None: Jaro Winkler distance score, `None` if above `max_distance`.
 
     """
     if scaling > __MAX_SCALING__ or scaling < 0:
@@ -221,12 +515,377 @@ def get_jaro_winkler_distance(
         comparative: Comparative = Comparative(
             first, second, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous
         )
-        similarity: float = _similarity(comparative.first, comparative.second)
+        boost: float = _get_prefix(comparative.first, comparative.second) * scaling
+        similarity: float = _similarity(
+            comparative.first, comparative.second, cutoff=0.0 if max_distance is None else _get_cutoff(1 - max_distance, boost)
+        )
+        distance: float = 1 - (similarity + (boost * (1 - similarity)))
+        if max_distance is not None and distance > max_distance:
+            return None
+
+        return round(distance, decimals)
+
+    except ValueError as e:
+        raise JaroDistanceError from e
+
+
+def _score(first: str, second: str, scaling: float, decimals: int, distance: bool, flags: bytearray | None = None) -> float:
+    short, long = _order(first, second)
+    similarity: float = _similarity(short, long, flags)
+    if scaling:
+        similarity = similarity + (_get_prefix(short, long) * scaling * (1 - similarity))
+
+    return round(1 - similarity if distance else similarity, decimals)
 
-        return round(
-            1 - (similarity + (_get_prefix(comparative.first, comparative.second) * scaling * (1 - similarity))),
-            decimals,
+
+def _score_pairs(pairs: Sequence[tuple[str, str]], scaling: float, decimals: int, distance: bool) -> list[float]:
+    # Pairs are grouped by the lengths of their strings, groups large enough to outweigh the cost of array operations are
+    # scored with the vectorized engine when NumPy can be imported and the others one pair at a time.
+    flags: bytearray = bytearray()
+    if len(pairs) < __MIN_VECTORIZED_PAIRS__ or not vectorized.is_available():
+        return [_score(first, second, scaling, decimals, distance, flags) for first, second in pairs]
+
+    groups: dict[tuple[int, int], list[int]] = {}
+    ordered: list[tuple[str, str]] = [_order(first, second) for first, second in pairs]
+    for index, (short, long) in enumerate(ordered):
+        groups.setdefault((len(short), len(long)), []).append(index)
+
+    scores: list[float] = [0.0] * len(pairs)
+    for (length, _), indexes in groups.items():
+        if length == 0 or len(indexes) < __MIN_VECTORIZED_PAIRS__:
+            for index in indexes:
+                scores[index] = _score(*ordered[index], scaling, decimals, distance, flags)
+            continue
+
+        similarities: list[float] = vectorized.get_jaro_winkler_similarities(
+            [ordered[index][0] for index in indexes], [ordered[index][1] for index in indexes], scaling
+        )
+        for index, similarity in zip(indexes, similarities, strict=True):
+            scores[index] = round(1 - similarity if distance else similarity, decimals)
+
+    return scores
+
+
+def _score_chunk(candidates: Sequence[str], query: str, scaling: float, decimals: int, distance: bool) -> list[float]:
+    return _score_pairs([(query, candidate) for candidate in candidates], scaling, decimals, distance)
+
+
+def _score_many(
+    query: str,
+    candidates: Iterable[str],
+    scaling: float,
+    decimals: int,
+    norm_case: bool,
+    norm_utf8: bool,
+    norm_ambiguous: bool,
+    distance: bool,
+    workers: int,
+    backend: str,
+) -> list[float]:
+    try:
+        query = Comparative._sanitize(query, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
+        sanitized: list[str] = [
+            Comparative._sanitize(candidate, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
+            for candidate in candidates
+        ]
+        chunks: list[list[float]] = _map_chunks(
+            _score_chunk, sanitized, 1, workers, query, scaling, decimals, distance, backend=backend
         )
+        return [score for chunk in chunks for score in chunk]
+
+    except ValueError as e:
+        raise JaroDistanceError from e
+
+
+def _cdist_chunk(rows: Sequence[str], columns: Sequence[str], scaling: float, decimals: int, distance: bool) -> array:
+    # Rows are scored a block at a time to bound the number of pairs held at once.
+    matrix: array = array("d")
+    step: int = max(1, __MAX_BLOCK_PAIRS__ // max(1, len(columns)))
+    for start in range(0, len(rows), step):
+        pairs: list[tuple[str, str]] = [(row, column) for row in rows[start : start + step] for column in columns]
+        matrix.extend(_score_pairs(pairs, scaling, decimals, distance))
+    return matrix
+
+
+def get_jaro_similarity_many(
+    query: str,
+    candidates: Iterable[str],
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    workers: int = 1,
+    backend: str = "process",
+) -> list[float]:
+    """
+    Return the Jaro similarity of one string against many, sanitizing the query only once.
+
+    Args:
+        query (str): String to calculate Jaro similarity for.
+        candidates (Iterable[str]): Strings to calculate Jaro similarity with.
+        decimals (int, optional): Number of decimals to allow in result, defaults to 2.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        workers (int, optional): Number of processes to spread the comparisons over, defaults to 1 (no extra process).
+        backend (str, optional): Run the workers as `process` (default) or as `thread`, sharing the sanitized strings.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings or if workers or backend is invalid.
+
+    Returns:
+        list[float]: Similarity between the query and each candidate, in candidate order.
+
+    """
+    return _score_many(query, candidates, 0.0, decimals, norm_case, norm_utf8, norm_ambiguous, False, workers, backend)
+
+
+def get_jaro_distance_many(
+    query: str,
+    candidates: Iterable[str],
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    workers: int = 1,
+    backend: str = "process",
+) -> list[float]:
+    """
+    Return the Jaro distance (`1 - jaro_similarity`) of one string against many, sanitizing the query only once.
+
+    Args:
+        query (str): String to calculate Jaro distance for.
+        candidates (Iterable[str]): Strings to calculate Jaro distance with.
+        decimals (int, optional): Number of decimals to allow in result, defaults to 2.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        workers (int, optional): Number of processes to spread the comparisons over, defaults to 1 (no extra process).
+        backend (str, optional): Run the workers as `process` (default) or as `thread`, sharing the sanitized strings.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings or if workers or backend is invalid.
+
+    Returns:
+        list[float]: Distance between the query and each candidate, in candidate order.
+
+    """
+    return _score_many(query, candidates, 0.0, decimals, norm_case, norm_utf8, norm_ambiguous, True, workers, backend)
+
+
+def get_jaro_winkler_similarity_many(
+    query: str,
+    candidates: Iterable[str],
+    scaling: float = __DEFAULT_SCALING__,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    workers: int = 1,
+    backend: str = "process",
+) -> list[float]:
+    """
+    Return the Jaro Winkler similarity of one string against many, sanitizing the query only once.
+
+    Args:
+        query (str): String to calculate similarity for.
+        candidates (Iterable[str]): Strings to calculate similarity with.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1.
+        decimals (int, optional): Number of decimals to allow in result.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        workers (int, optional): Number of processes to spread the comparisons over, defaults to 1 (no extra process).
+        backend (str, optional): Run the workers as `process` (default) or as `thread`, sharing the sanitized strings.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings, if scaling is invalid or if workers or backend is invalid.
+
+    Returns:
+        list[float]: Jaro Winkler similarity score of each candidate, in candidate order.
+
+    """
+    if scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    return _score_many(query, candidates, scaling, decimals, norm_case, norm_utf8, norm_ambiguous, False, workers, backend)
+
+
+def get_jaro_winkler_distance_many(
+    query: str,
+    candidates: Iterable[str],
+    scaling: float = __DEFAULT_SCALING__,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    workers: int = 1,
+    backend: str = "process",
+) -> list[float]:
+    """
+    Return the Jaro Winkler distance (`1 - jaro_winkler_similarity`) of one string against many, sanitizing the query only once.
+
+    Args:
+        query (str): String to calculate distance for.
+        candidates (Iterable[str]): Strings to calculate distance with.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1.
+        decimals (int, optional): Number of decimals to allow in result.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        workers (int, optional): Number of processes to spread the comparisons over, defaults to 1 (no extra process).
+        backend (str, optional): Run the workers as `process` (default) or as `thread`, sharing the sanitized strings.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings, if scaling is invalid or if workers or backend is invalid.
+
+    Returns:
+        list[float]: Jaro Winkler distance score of each candidate, in candidate order.
+
+    """
+    if scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    return _score_many(query, candidates, scaling, decimals, norm_case, norm_utf8, norm_ambiguous, True, workers, backend)
+
+
+def cdist(
+    left: Iterable[str],
+    right: Iterable[str],
+    metric: str = "jaro_winkler",
+    scaling: float = __DEFAULT_SCALING__,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+    workers: int = 1,
+    backend: str = "process",
+) -> array:
+    """
+    Return the pairwise scores of two collections of strings as a row-major matrix.
+
+    Each string is sanitized once, then the cell at `i * len(right) + j` holds the score of `left[i]` against `right[j]`.
+
+    Args:
+        left (Iterable[str]): Strings making up the rows of the matrix.
+        right (Iterable[str]): Strings making up the columns of the matrix.
+        metric (str, optional): One of `jaro`, `jaro_distance`, `jaro_winkler` or `jaro_winkler_distance`,
+            defaults to `jaro_winkler`.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1. Ignored by the Jaro metrics.
+        decimals (int, optional): Number of decimals to allow in result.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+        workers (int, optional): Number of processes to spread the comparisons over, defaults to 1 (no extra process).
+        backend (str, optional): Run the workers as `process` (default) or as `thread`, sharing the sanitized strings.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings, if the metric is unknown, if scaling is invalid or if
+            workers or backend is invalid.
+
+    Returns:
+        array: Flat `array("d")` of `len(left) * len(right)` scores.
+
+    """
+    if metric not in __METRICS__:
+        raise JaroDistanceError("Provided metric is invalid.")
+
+    winkler, distance = __METRICS__[metric]
+    if not winkler:
+        scaling = 0.0
+
+    elif scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    try:
+        rows: list[str] = [
+            Comparative._sanitize(word, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous) for word in left
+        ]
+        columns: list[str] = [
+            Comparative._sanitize(word, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous) for word in right
+        ]
+
+        matrix: array = array("d")
+        for chunk in _map_chunks(
+            _cdist_chunk, rows, len(columns), workers, columns, scaling, decimals, distance, backend=backend
+        ):
+            matrix.extend(chunk)
+        return matrix
+
+    except ValueError as e:
+        raise JaroDistanceError from e
+
+
+def _extract(
+    best: _TopK,
+    query: str,
+    choices: Iterable[str],
+    start: int,
+    scaling: float,
+    norm_case: bool,
+    norm_utf8: bool,
+    norm_ambiguous: bool,
+) -> None:
+    flags: bytearray = bytearray()
+    for position, choice in enumerate(choices, start):
+        short, long = _order(
+            query, Comparative._sanitize(choice, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
+        )
+        boost: float = _get_prefix(short, long) * scaling
+        similarity: float = _similarity(short, long, flags, _get_cutoff(best.cutoff, boost))
+        best.push(similarity + (boost * (1 - similarity)), position, choice)
+
+
+def extract_best(
+    query: str,
+    choices: Iterable[str],
+    k: int = 5,
+    scaling: float = __DEFAULT_SCALING__,
+    min_score: float = 0.0,
+    decimals: int = __DEFAULT_DECIMALS__,
+    norm_case: bool = False,
+    norm_utf8: bool = False,
+    norm_ambiguous: bool = False,
+) -> list[Match]:
+    """
+    Return the `k` choices most similar to the query in a single pass.
+
+    Only the current best `k` are kept, the worst of them acting as a cutoff that lets the remaining choices which cannot beat
+    it be given up on early.
+
+    Args:
+        query (str): String to find the closest choices for.
+        choices (Iterable[str]): Strings to pick the closest from.
+        k (int, optional): Maximum number of choices to return, defaults to 5.
+        scaling (float, optional): Scaling factor of the prefix of the compared strings, typically between 0.0 and 0.25,
+            defaults to 0.1.
+        min_score (float, optional): Least Jaro Winkler similarity for a choice to be returned, compared before rounding.
+        decimals (int, optional): Number of decimals to allow in result.
+        norm_case (bool, optional): Convert string to uppercase characters.
+        norm_utf8 (bool, optional): If True, all strings are normalized from C (NFC).
+        norm_ambiguous (bool, optional): Normalize ambiguous glyphs.
+
+    Raises:
+        JaroDistanceError: If provided arguments aren't strings or if scaling is invalid.
+
+    Returns:
+        list[Match]: Best choices ordered by decreasing score, ties kept in choice order.
+
+    """
+    if scaling > __MAX_SCALING__ or scaling < 0:
+        raise JaroDistanceError("Provided value for scaling factor is invalid.")
+
+    if k < 1:
+        return []
+
+    try:
+        query = Comparative._sanitize(query, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous)
+        best: _TopK = _TopK(k, min_score)
+        _extract(best, query, choices, 0, scaling, norm_case, norm_utf8, norm_ambiguous)
+        return best.matches(decimals)
 
     except ValueError as e:
         raise JaroDistanceError from e
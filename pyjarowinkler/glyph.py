@@ -1,1658 +1,121 @@
 """
 Utilities for mapping ambiguous or similar unicode glyph.
 
-Some code points map to an empty string intentionally — these are invisible or
-formatting characters (zero-width joiners, decorative underscores, etc.) that
-have no meaningful ASCII equivalent and should be dropped during normalization.
+`AMBIGUOUS` maps code points to their replacement. The table is only imported the first time it is accessed, so processes
+never normalizing ambiguous glyphs don't pay for it. Imports run once even when threads race for them, and the table is
+only ever read, so it is safe to share between threads.
 """
 
-from typing import Final
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-AMBIGUOUS: Final[dict[int, str]] = {
-    160: " ",
-    180: "`",
-    184: ",",
-    215: "x",
-    305: "i",
-    383: "f",
-    388: "b",
-    397: "g",
-    422: "R",
-    423: "2",
-    439: "3",
-    444: "5",
-    445: "s",
-    448: "I",
-    451: "!",
-    540: "3",
-    546: "8",
-    547: "8",
-    577: "?",
-    593: "a",
-    609: "g",
-    611: "y",
-    617: "i",
-    618: "i",
-    623: "w",
-    651: "u",
-    655: "y",
-    660: "?",
-    697: "`",
-    699: "`",
-    700: "`",
-    701: "`",
-    702: "`",
-    706: "<",
-    707: ">",
-    708: "^",
-    710: "^",
-    712: "`",
-    714: "`",
-    715: "`",
-    720: ":",
-    727: "-",
-    731: "i",
-    732: "~",
-    756: "`",
-    760: ":",
-    884: "`",
-    890: "i",
-    894: ";",
-    895: "J",
-    900: "`",
-    913: "A",
-    914: "B",
-    917: "E",
-    918: "Z",
-    919: "H",
-    921: "I",
-    922: "K",
-    924: "M",
-    925: "N",
-    927: "O",
-    929: "P",
-    932: "T",
-    933: "Y",
-    935: "X",
-    945: "a",
-    947: "y",
-    953: "i",
-    957: "v",
-    959: "o",
-    961: "p",
-    963: "o",
-    965: "u",
-    978: "Y",
-    988: "F",
-    1000: "2",
-    1009: "p",
-    1010: "c",
-    1011: "j",
-    1017: "C",
-    1018: "M",
-    1029: "S",
-    1030: "I",
-    1032: "J",
-    1040: "A",
-    1042: "B",
-    1045: "E",
-    1047: "3",
-    1050: "K",
-    1052: "M",
-    1053: "H",
-    1054: "O",
-    1056: "P",
-    1057: "C",
-    1058: "T",
-    1059: "Y",
-    1061: "X",
-    1068: "b",
-    1072: "a",
-    1073: "6",
-    1075: "r",
-    1077: "e",
-    1086: "o",
-    1088: "p",
-    1089: "c",
-    1091: "y",
-    1093: "x",
-    1109: "s",
-    1110: "i",
-    1112: "j",
-    1121: "w",
-    1140: "V",
-    1141: "v",
-    1198: "Y",
-    1199: "y",
-    1211: "h",
-    1213: "e",
-    1216: "I",
-    1231: "i",
-    1248: "3",
-    1281: "d",
-    1292: "G",
-    1307: "q",
-    1308: "W",
-    1309: "w",
-    1357: "U",
-    1359: "S",
-    1365: "O",
-    1370: "`",
-    1373: "`",
-    1377: "w",
-    1379: "q",
-    1382: "q",
-    1392: "h",
-    1400: "n",
-    1404: "n",
-    1405: "u",
-    1409: "g",
-    1412: "f",
-    1413: "o",
-    1417: ":",
-    1472: "l",
-    1475: ":",
-    1493: "l",
-    1496: "v",
-    1497: "`",
-    1503: "l",
-    1505: "o",
-    1523: "`",
-    1549: ",",
-    1575: "l",
-    1607: "o",
-    1632: ".",
-    1633: "l",
-    1637: "o",
-    1639: "V",
-    1643: ",",
-    1645: "*",
-    1726: "o",
-    1729: "o",
-    1748: "-",
-    1749: "o",
-    1776: ".",
-    1777: "I",
-    1781: "o",
-    1783: "V",
-    1793: ".",
-    1794: ".",
-    1795: ":",
-    1796: ":",
-    1984: "O",
-    1994: "l",
-    2036: "`",
-    2037: "`",
-    2042: "",
-    2307: ":",
-    2406: "o",
-    2429: "?",
-    2534: "O",
-    2538: "8",
-    2541: "9",
-    2662: "o",
-    2663: "9",
-    2666: "8",
-    2691: ":",
-    2790: "o",
-    2819: "8",
-    2848: "O",
-    2918: "O",
-    2920: "9",
-    3046: "o",
-    3074: "o",
-    3174: "o",
-    3202: "o",
-    3302: "o",
-    3330: "o",
-    3360: "o",
-    3430: "o",
-    3437: "9",
-    3458: "o",
-    3664: "o",
-    3792: "o",
-    4125: "o",
-    4160: "o",
-    4327: "y",
-    4351: "o",
-    4608: "U",
-    4816: "O",
-    5024: "D",
-    5025: "R",
-    5026: "T",
-    5029: "i",
-    5033: "Y",
-    5034: "A",
-    5035: "J",
-    5036: "E",
-    5038: "?",
-    5043: "W",
-    5047: "M",
-    5051: "H",
-    5053: "Y",
-    5056: "G",
-    5058: "h",
-    5059: "Z",
-    5070: "4",
-    5071: "b",
-    5074: "R",
-    5076: "W",
-    5077: "S",
-    5081: "V",
-    5082: "S",
-    5086: "L",
-    5087: "C",
-    5090: "P",
-    5094: "K",
-    5095: "d",
-    5102: "6",
-    5107: "G",
-    5108: "B",
-    5120: "=",
-    5167: "V",
-    5171: ">",
-    5176: "<",
-    5194: "`",
-    5196: "U",
-    5229: "P",
-    5231: "d",
-    5234: "b",
-    5261: "J",
-    5290: "L",
-    5311: "2",
-    5441: "x",
-    5500: "H",
-    5501: "x",
-    5511: "R",
-    5551: "b",
-    5556: "F",
-    5573: "A",
-    5598: "D",
-    5610: "D",
-    5616: "M",
-    5623: "B",
-    5741: "X",
-    5742: "x",
-    5760: " ",
-    5810: "<",
-    5815: "X",
-    5825: "I",
-    5836: "`",
-    5845: "K",
-    5846: "M",
-    5868: ":",
-    5869: "+",
-    5941: "/",
-    6147: ":",
-    6153: ":",
-    7428: "c",
-    7439: "o",
-    7441: "o",
-    7452: "u",
-    7456: "v",
-    7457: "w",
-    7458: "z",
-    7462: "r",
-    7555: "g",
-    7564: "y",
-    7837: "f",
-    7935: "y",
-    8125: "`",
-    8126: "i",
-    8127: "`",
-    8128: "~",
-    8175: "`",
-    8189: "`",
-    8190: "`",
-    8192: " ",
-    8193: " ",
-    8194: " ",
-    8195: " ",
-    8196: " ",
-    8197: " ",
-    8198: " ",
-    8199: " ",
-    8200: " ",
-    8201: " ",
-    8202: " ",
-    8208: "-",
-    8209: "-",
-    8210: "-",
-    8211: "-",
-    8216: "`",
-    8217: "`",
-    8218: ",",
-    8219: "`",
-    8228: ".",
-    8232: " ",
-    8233: " ",
-    8239: " ",
-    8242: "`",
-    8245: "`",
-    8249: "<",
-    8250: ">",
-    8257: "/",
-    8259: "-",
-    8260: "/",
-    8270: "*",
-    8275: "~",
-    8282: ":",
-    8287: " ",
-    8450: "C",
-    8458: "g",
-    8459: "H",
-    8460: "H",
-    8461: "H",
-    8462: "h",
-    8464: "I",
-    8465: "I",
-    8466: "L",
-    8467: "l",
-    8469: "N",
-    8473: "P",
-    8474: "Q",
-    8475: "R",
-    8476: "R",
-    8477: "R",
-    8484: "Z",
-    8488: "Z",
-    8490: "K",
-    8492: "B",
-    8493: "C",
-    8494: "e",
-    8495: "e",
-    8496: "E",
-    8497: "F",
-    8499: "M",
-    8500: "o",
-    8505: "i",
-    8509: "y",
-    8517: "D",
-    8518: "d",
-    8519: "e",
-    8520: "i",
-    8521: "j",
-    8544: "I",
-    8548: "V",
-    8553: "X",
-    8556: "L",
-    8557: "C",
-    8558: "D",
-    8559: "M",
-    8560: "i",
-    8564: "v",
-    8569: "x",
-    8572: "I",
-    8573: "c",
-    8574: "d",
-    8722: "-",
-    8725: "/",
-    8726: "\\",
-    8727: "*",
-    8739: "I",
-    8744: "v",
-    8746: "U",
-    8758: ":",
-    8764: "~",
-    8868: "T",
-    8897: "v",
-    8899: "U",
-    8959: "E",
-    9075: "i",
-    9076: "p",
-    9082: "a",
-    9213: "I",
-    9585: "/",
-    9587: "X",
-    10088: "(",
-    10089: ")",
-    10094: "<",
-    10095: ">",
-    10098: "(",
-    10099: ")",
-    10100: "{",
-    10101: "}",
-    10133: "+",
-    10134: "-",
-    10187: "/",
-    10189: "\\",
-    10201: "T",
-    10539: "x",
-    10540: "x",
-    10741: "\\",
-    10744: "/",
-    10745: "\\",
-    10799: "x",
-    11397: "r",
-    11406: "H",
-    11410: "I",
-    11412: "K",
-    11416: "M",
-    11418: "N",
-    11422: "O",
-    11423: "o",
-    11426: "P",
-    11427: "p",
-    11428: "C",
-    11429: "c",
-    11430: "T",
-    11432: "Y",
-    11436: "X",
-    11450: "-",
-    11462: "/",
-    11466: "9",
-    11468: "3",
-    11472: "L",
-    11474: "6",
-    11576: "V",
-    11577: "E",
-    11599: "I",
-    11601: "!",
-    11604: "O",
-    11605: "Q",
-    11613: "X",
-    11840: "=",
-    12034: "\\",
-    12035: "/",
-    12295: "O",
-    12308: "(",
-    12309: ")",
-    12339: "/",
-    12448: "=",
-    12494: "/",
-    12755: "/",
-    12756: "\\",
-    20022: "\\",
-    20031: "/",
-    42192: "B",
-    42193: "P",
-    42194: "d",
-    42195: "D",
-    42196: "T",
-    42198: "G",
-    42199: "K",
-    42201: "J",
-    42202: "C",
-    42204: "Z",
-    42205: "F",
-    42207: "M",
-    42208: "N",
-    42209: "L",
-    42210: "S",
-    42211: "R",
-    42214: "V",
-    42215: "H",
-    42218: "W",
-    42219: "X",
-    42220: "Y",
-    42222: "A",
-    42224: "E",
-    42226: "I",
-    42227: "O",
-    42228: "U",
-    42232: ".",
-    42233: ",",
-    42237: ":",
-    42239: "=",
-    42510: ".",
-    42564: "2",
-    42567: "i",
-    42719: "V",
-    42731: "?",
-    42735: "2",
-    42801: "s",
-    42842: "2",
-    42858: "3",
-    42862: "9",
-    42872: "&",
-    42889: ":",
-    42892: "`",
-    42904: "F",
-    42905: "f",
-    42911: "u",
-    42923: "3",
-    42930: "J",
-    42931: "X",
-    42932: "B",
-    43826: "e",
-    43829: "f",
-    43837: "o",
-    43847: "r",
-    43848: "r",
-    43854: "u",
-    43858: "u",
-    43866: "y",
-    43893: "i",
-    43905: "r",
-    43907: "w",
-    43923: "z",
-    43945: "v",
-    43946: "s",
-    43951: "c",
-    64422: "o",
-    64423: "o",
-    64424: "o",
-    64425: "o",
-    64426: "o",
-    64427: "o",
-    64428: "o",
-    64429: "o",
-    64830: "(",
-    64831: ")",
-    65072: ":",
-    65101: "",
-    65102: "",
-    65103: "",
-    65112: "-",
-    65128: "\\",
-    65165: "l",
-    65166: "l",
-    65257: "o",
-    65258: "o",
-    65259: "o",
-    65260: "o",
-    65281: "!",
-    65282: '"',
-    65283: "#",
-    65284: "$",
-    65285: "%",
-    65286: "&",
-    65287: "`",
-    65288: "(",
-    65289: ")",
-    65290: "*",
-    65291: "+",
-    65292: ",",
-    65293: "-",
-    65294: ".",
-    65295: "/",
-    65296: "0",
-    65297: "1",
-    65298: "2",
-    65299: "3",
-    65300: "4",
-    65301: "5",
-    65302: "6",
-    65303: "7",
-    65304: "8",
-    65305: "9",
-    65306: ":",
-    65307: ";",
-    65308: "<",
-    65309: "=",
-    65310: ">",
-    65311: "?",
-    65312: "@",
-    65313: "A",
-    65314: "B",
-    65315: "C",
-    65316: "D",
-    65317: "E",
-    65318: "F",
-    65319: "G",
-    65320: "H",
-    65321: "I",
-    65322: "J",
-    65323: "K",
-    65324: "L",
-    65325: "M",
-    65326: "N",
-    65327: "O",
-    65328: "P",
-    65329: "Q",
-    65330: "R",
-    65331: "S",
-    65332: "T",
-    65333: "U",
-    65334: "V",
-    65335: "W",
-    65336: "X",
-    65337: "Y",
-    65338: "Z",
-    65339: "[",
-    65340: "\\",
-    65341: "]",
-    65342: "^",
-    65343: "",
-    65344: "`",
-    65345: "a",
-    65346: "b",
-    65347: "c",
-    65348: "d",
-    65349: "e",
-    65350: "f",
-    65351: "g",
-    65352: "h",
-    65353: "i",
-    65354: "j",
-    65355: "k",
-    65356: "l",
-    65357: "m",
-    65358: "n",
-    65359: "o",
-    65360: "p",
-    65361: "q",
-    65362: "r",
-    65363: "s",
-    65364: "t",
-    65365: "u",
-    65366: "v",
-    65367: "w",
-    65368: "x",
-    65369: "y",
-    65370: "z",
-    65371: "{",
-    65372: "|",
-    65373: "}",
-    65374: "~",
-    65512: "I",
-    66178: "B",
-    66182: "E",
-    66183: "F",
-    66186: "|",
-    66192: "X",
-    66194: "O",
-    66197: "P",
-    66198: "S",
-    66199: "T",
-    66203: "+",
-    66208: "A",
-    66209: "B",
-    66210: "C",
-    66213: "F",
-    66219: "O",
-    66224: "M",
-    66225: "T",
-    66226: "Y",
-    66228: "X",
-    66255: "H",
-    66293: "Z",
-    66305: "B",
-    66306: "C",
-    66313: "|",
-    66321: "M",
-    66325: "T",
-    66327: "X",
-    66330: "8",
-    66335: "*",
-    66336: "l",
-    66338: "X",
-    66564: "O",
-    66581: "C",
-    66587: "L",
-    66592: "S",
-    66604: "o",
-    66621: "c",
-    66632: "s",
-    66740: "R",
-    66754: "O",
-    66766: "U",
-    66770: "7",
-    66794: "o",
-    66806: "u",
-    66835: "N",
-    66838: "O",
-    66840: "K",
-    66844: "C",
-    66845: "V",
-    66853: "F",
-    66854: "L",
-    66855: "X",
-    68176: ".",
-    70864: "O",
-    71430: "v",
-    71434: "w",
-    71438: "w",
-    71439: "w",
-    71840: "V",
-    71842: "F",
-    71843: "L",
-    71844: "Y",
-    71846: "E",
-    71849: "Z",
-    71852: "9",
-    71854: "E",
-    71855: "4",
-    71858: "L",
-    71861: "O",
-    71864: "U",
-    71867: "5",
-    71868: "T",
-    71872: "v",
-    71873: "s",
-    71874: "F",
-    71875: "i",
-    71876: "z",
-    71878: "7",
-    71880: "o",
-    71882: "3",
-    71884: "9",
-    71893: "6",
-    71894: "9",
-    71895: "o",
-    71896: "u",
-    71900: "y",
-    71904: "O",
-    71909: "Z",
-    71910: "W",
-    71913: "C",
-    71916: "X",
-    71919: "W",
-    71922: "C",
-    93960: "V",
-    93962: "T",
-    93974: "L",
-    93992: "I",
-    94005: "R",
-    94010: "S",
-    94011: "3",
-    94015: ">",
-    94016: "A",
-    94018: "U",
-    94019: "Y",
-    94033: "`",
-    94034: "`",
-    119060: "{",
-    119149: ".",
-    119302: "3",
-    119309: "V",
-    119311: "\\",
-    119314: "7",
-    119315: "F",
-    119318: "R",
-    119338: "L",
-    119350: "<",
-    119351: ">",
-    119354: "/",
-    119355: "\\",
-    119808: "A",
-    119809: "B",
-    119810: "C",
-    119811: "D",
-    119812: "E",
-    119813: "F",
-    119814: "G",
-    119815: "H",
-    119816: "I",
-    119817: "J",
-    119818: "K",
-    119819: "L",
-    119820: "M",
-    119821: "N",
-    119822: "O",
-    119823: "P",
-    119824: "Q",
-    119825: "R",
-    119826: "S",
-    119827: "T",
-    119828: "U",
-    119829: "V",
-    119830: "W",
-    119831: "X",
-    119832: "Y",
-    119833: "Z",
-    119834: "a",
-    119835: "b",
-    119836: "c",
-    119837: "d",
-    119838: "e",
-    119839: "f",
-    119840: "g",
-    119841: "h",
-    119842: "i",
-    119843: "j",
-    119844: "k",
-    119845: "l",
-    119846: "m",
-    119847: "n",
-    119848: "o",
-    119849: "p",
-    119850: "q",
-    119851: "r",
-    119852: "s",
-    119853: "t",
-    119854: "u",
-    119855: "v",
-    119856: "w",
-    119857: "x",
-    119858: "y",
-    119859: "z",
-    119860: "A",
-    119861: "B",
-    119862: "C",
-    119863: "D",
-    119864: "E",
-    119865: "F",
-    119866: "G",
-    119867: "H",
-    119868: "I",
-    119869: "J",
-    119870: "K",
-    119871: "L",
-    119872: "M",
-    119873: "N",
-    119874: "O",
-    119875: "P",
-    119876: "Q",
-    119877: "R",
-    119878: "S",
-    119879: "T",
-    119880: "U",
-    119881: "V",
-    119882: "W",
-    119883: "X",
-    119884: "Y",
-    119885: "Z",
-    119886: "a",
-    119887: "b",
-    119888: "c",
-    119889: "d",
-    119890: "e",
-    119891: "f",
-    119892: "g",
-    119894: "i",
-    119895: "j",
-    119896: "k",
-    119897: "l",
-    119899: "n",
-    119900: "o",
-    119901: "p",
-    119902: "q",
-    119903: "r",
-    119904: "s",
-    119905: "t",
-    119906: "u",
-    119907: "v",
-    119908: "w",
-    119909: "x",
-    119910: "y",
-    119911: "z",
-    119912: "A",
-    119913: "B",
-    119914: "C",
-    119915: "D",
-    119916: "E",
-    119917: "F",
-    119918: "G",
-    119919: "H",
-    119920: "I",
-    119921: "J",
-    119922: "K",
-    119923: "L",
-    119924: "M",
-    119925: "N",
-    119926: "O",
-    119927: "P",
-    119928: "Q",
-    119929: "R",
-    119930: "S",
-    119931: "T",
-    119932: "U",
-    119933: "V",
-    119934: "W",
-    119935: "X",
-    119936: "Y",
-    119937: "Z",
-    119938: "a",
-    119939: "b",
-    119940: "c",
-    119941: "d",
-    119942: "e",
-    119943: "f",
-    119944: "g",
-    119945: "h",
-    119946: "i",
-    119947: "j",
-    119948: "k",
-    119949: "l",
-    119951: "n",
-    119952: "o",
-    119953: "p",
-    119954: "q",
-    119955: "r",
-    119956: "s",
-    119957: "t",
-    119958: "u",
-    119959: "v",
-    119960: "w",
-    119961: "x",
-    119962: "y",
-    119963: "z",
-    119964: "A",
-    119966: "C",
-    119967: "D",
-    119970: "G",
-    119973: "J",
-    119974: "K",
-    119977: "N",
-    119978: "O",
-    119979: "P",
-    119980: "Q",
-    119982: "S",
-    119983: "T",
-    119984: "U",
-    119985: "V",
-    119986: "W",
-    119987: "X",
-    119988: "Y",
-    119989: "Z",
-    119990: "a",
-    119991: "b",
-    119992: "c",
-    119993: "d",
-    119995: "f",
-    119997: "h",
-    119998: "i",
-    119999: "j",
-    120000: "k",
-    120001: "l",
-    120003: "n",
-    120005: "p",
-    120006: "q",
-    120007: "r",
-    120008: "s",
-    120009: "t",
-    120010: "u",
-    120011: "v",
-    120012: "w",
-    120013: "x",
-    120014: "y",
-    120015: "z",
-    120016: "A",
-    120017: "B",
-    120018: "C",
-    120019: "D",
-    120020: "E",
-    120021: "F",
-    120022: "G",
-    120023: "H",
-    120024: "I",
-    120025: "J",
-    120026: "K",
-    120027: "L",
-    120028: "M",
-    120029: "N",
-    120030: "O",
-    120031: "P",
-    120032: "Q",
-    120033: "R",
-    120034: "S",
-    120035: "T",
-    120036: "U",
-    120037: "V",
-    120038: "W",
-    120039: "X",
-    120040: "Y",
-    120041: "Z",
-    120042: "a",
-    120043: "b",
-    120044: "c",
-    120045: "d",
-    120046: "e",
-    120047: "f",
-    120048: "g",
-    120049: "h",
-    120050: "i",
-    120051: "j",
-    120052: "k",
-    120053: "l",
-    120055: "n",
-    120056: "o",
-    120057: "p",
-    120058: "q",
-    120059: "r",
-    120060: "s",
-    120061: "t",
-    120062: "u",
-    120063: "v",
-    120064: "w",
-    120065: "x",
-    120066: "y",
-    120067: "z",
-    120068: "A",
-    120069: "B",
-    120071: "D",
-    120072: "E",
-    120073: "F",
-    120074: "G",
-    120077: "J",
-    120078: "K",
-    120079: "L",
-    120080: "M",
-    120081: "N",
-    120082: "O",
-    120083: "P",
-    120084: "Q",
-    120086: "S",
-    120087: "T",
-    120088: "U",
-    120089: "V",
-    120090: "W",
-    120091: "X",
-    120092: "Y",
-    120094: "a",
-    120095: "b",
-    120096: "c",
-    120097: "d",
-    120098: "e",
-    120099: "f",
-    120100: "g",
-    120101: "h",
-    120102: "i",
-    120103: "j",
-    120104: "k",
-    120105: "I",
-    120107: "n",
-    120108: "o",
-    120109: "p",
-    120110: "q",
-    120111: "r",
-    120112: "s",
-    120113: "t",
-    120114: "u",
-    120115: "v",
-    120116: "w",
-    120117: "x",
-    120118: "y",
-    120119: "z",
-    120120: "A",
-    120121: "B",
-    120123: "D",
-    120124: "E",
-    120125: "F",
-    120126: "G",
-    120128: "I",
-    120129: "J",
-    120130: "K",
-    120131: "L",
-    120132: "M",
-    120134: "O",
-    120138: "S",
-    120139: "T",
-    120140: "U",
-    120141: "V",
-    120142: "W",
-    120143: "X",
-    120144: "Y",
-    120146: "a",
-    120147: "b",
-    120148: "c",
-    120149: "d",
-    120150: "e",
-    120151: "f",
-    120152: "g",
-    120153: "h",
-    120154: "i",
-    120155: "j",
-    120156: "k",
-    120157: "I",
-    120159: "n",
-    120160: "o",
-    120161: "p",
-    120162: "q",
-    120163: "r",
-    120164: "s",
-    120165: "t",
-    120166: "u",
-    120167: "v",
-    120168: "w",
-    120169: "x",
-    120170: "y",
-    120171: "z",
-    120172: "A",
-    120173: "B",
-    120174: "C",
-    120175: "D",
-    120176: "E",
-    120177: "F",
-    120178: "G",
-    120179: "H",
-    120180: "I",
-    120181: "J",
-    120182: "K",
-    120183: "L",
-    120184: "M",
-    120185: "N",
-    120186: "O",
-    120187: "P",
-    120188: "Q",
-    120189: "R",
-    120190: "S",
-    120191: "T",
-    120192: "U",
-    120193: "V",
-    120194: "W",
-    120195: "X",
-    120196: "Y",
-    120197: "Z",
-    120198: "a",
-    120199: "b",
-    120200: "c",
-    120201: "d",
-    120202: "e",
-    120203: "f",
-    120204: "g",
-    120205: "h",
-    120206: "i",
-    120207: "j",
-    120208: "k",
-    120209: "I",
-    120211: "n",
-    120212: "o",
-    120213: "p",
-    120214: "q",
-    120215: "r",
-    120216: "s",
-    120217: "t",
-    120218: "u",
-    120219: "v",
-    120220: "w",
-    120221: "x",
-    120222: "y",
-    120223: "z",
-    120224: "A",
-    120225: "B",
-    120226: "C",
-    120227: "D",
-    120228: "E",
-    120229: "F",
-    120230: "G",
-    120231: "H",
-    120232: "I",
-    120233: "J",
-    120234: "K",
-    120235: "L",
-    120236: "M",
-    120237: "N",
-    120238: "O",
-    120239: "P",
-    120240: "Q",
-    120241: "R",
-    120242: "S",
-    120243: "T",
-    120244: "U",
-    120245: "V",
-    120246: "W",
-    120247: "X",
-    120248: "Y",
-    120249: "Z",
-    120250: "a",
-    120251: "b",
-    120252: "c",
-    120253: "d",
-    120254: "e",
-    120255: "f",
-    120256: "g",
-    120257: "h",
-    120258: "i",
-    120259: "j",
-    120260: "k",
-    120261: "I",
-    120263: "n",
-    120264: "o",
-    120265: "p",
-    120266: "q",
-    120267: "r",
-    120268: "s",
-    120269: "t",
-    120270: "u",
-    120271: "v",
-    120272: "w",
-    120273: "x",
-    120274: "y",
-    120275: "z",
-    120276: "A",
-    120277: "B",
-    120278: "C",
-    120279: "D",
-    120280: "E",
-    120281: "F",
-    120282: "G",
-    120283: "H",
-    120284: "I",
-    120285: "J",
-    120286: "K",
-    120287: "L",
-    120288: "M",
-    120289: "N",
-    120290: "O",
-    120291: "P",
-    120292: "Q",
-    120293: "R",
-    120294: "S",
-    120295: "T",
-    120296: "U",
-    120297: "V",
-    120298: "W",
-    120299: "X",
-    120300: "Y",
-    120301: "Z",
-    120302: "a",
-    120303: "b",
-    120304: "c",
-    120305: "d",
-    120306: "e",
-    120307: "f",
-    120308: "g",
-    120309: "h",
-    120310: "i",
-    120311: "j",
-    120312: "k",
-    120313: "I",
-    120315: "n",
-    120316: "o",
-    120317: "p",
-    120318: "q",
-    120319: "r",
-    120320: "s",
-    120321: "t",
-    120322: "u",
-    120323: "v",
-    120324: "w",
-    120325: "x",
-    120326: "y",
-    120327: "z",
-    120328: "A",
-    120329: "B",
-    120330: "C",
-    120331: "D",
-    120332: "E",
-    120333: "F",
-    120334: "G",
-    120335: "H",
-    120336: "I",
-    120337: "J",
-    120338: "K",
-    120339: "L",
-    120340: "M",
-    120341: "N",
-    120342: "O",
-    120343: "P",
-    120344: "Q",
-    120345: "R",
-    120346: "S",
-    120347: "T",
-    120348: "U",
-    120349: "V",
-    120350: "W",
-    120351: "X",
-    120352: "Y",
-    120353: "Z",
-    120354: "a",
-    120355: "b",
-    120356: "c",
-    120357: "d",
-    120358: "e",
-    120359: "f",
-    120360: "g",
-    120361: "h",
-    120362: "i",
-    120363: "j",
-    120364: "k",
-    120365: "I",
-    120367: "n",
-    120368: "o",
-    120369: "p",
-    120370: "q",
-    120371: "r",
-    120372: "s",
-    120373: "t",
-    120374: "u",
-    120375: "v",
-    120376: "w",
-    120377: "x",
-    120378: "y",
-    120379: "z",
-    120380: "A",
-    120381: "B",
-    120382: "C",
-    120383: "D",
-    120384: "E",
-    120385: "F",
-    120386: "G",
-    120387: "H",
-    120388: "I",
-    120389: "J",
-    120390: "K",
-    120391: "L",
-    120392: "M",
-    120393: "N",
-    120394: "O",
-    120395: "P",
-    120396: "Q",
-    120397: "R",
-    120398: "S",
-    120399: "T",
-    120400: "U",
-    120401: "V",
-    120402: "W",
-    120403: "X",
-    120404: "Y",
-    120405: "Z",
-    120406: "a",
-    120407: "b",
-    120408: "c",
-    120409: "d",
-    120410: "e",
-    120411: "f",
-    120412: "g",
-    120413: "h",
-    120414: "i",
-    120415: "j",
-    120416: "k",
-    120417: "I",
-    120419: "n",
-    120420: "o",
-    120421: "p",
-    120422: "q",
-    120423: "r",
-    120424: "s",
-    120425: "t",
-    120426: "u",
-    120427: "v",
-    120428: "w",
-    120429: "x",
-    120430: "y",
-    120431: "z",
-    120432: "A",
-    120433: "B",
-    120434: "C",
-    120435: "D",
-    120436: "E",
-    120437: "F",
-    120438: "G",
-    120439: "H",
-    120440: "I",
-    120441: "J",
-    120442: "K",
-    120443: "L",
-    120444: "M",
-    120445: "N",
-    120446: "O",
-    120447: "P",
-    120448: "Q",
-    120449: "R",
-    120450: "S",
-    120451: "T",
-    120452: "U",
-    120453: "V",
-    120454: "W",
-    120455: "X",
-    120456: "Y",
-    120457: "Z",
-    120458: "a",
-    120459: "b",
-    120460: "c",
-    120461: "d",
-    120462: "e",
-    120463: "f",
-    120464: "g",
-    120465: "h",
-    120466: "i",
-    120467: "j",
-    120468: "k",
-    120469: "I",
-    120471: "n",
-    120472: "o",
-    120473: "p",
-    120474: "q",
-    120475: "r",
-    120476: "s",
-    120477: "t",
-    120478: "u",
-    120479: "v",
-    120480: "w",
-    120481: "x",
-    120482: "y",
-    120483: "z",
-    120484: "i",
-    120488: "A",
-    120489: "B",
-    120492: "E",
-    120493: "Z",
-    120494: "H",
-    120496: "I",
-    120497: "K",
-    120499: "M",
-    120500: "N",
-    120502: "O",
-    120504: "P",
-    120507: "T",
-    120508: "Y",
-    120510: "X",
-    120514: "a",
-    120516: "y",
-    120522: "i",
-    120526: "v",
-    120528: "o",
-    120530: "p",
-    120532: "o",
-    120534: "u",
-    120544: "p",
-    120546: "A",
-    120547: "B",
-    120550: "E",
-    120551: "Z",
-    120552: "H",
-    120554: "I",
-    120555: "K",
-    120557: "M",
-    120558: "N",
-    120560: "O",
-    120562: "P",
-    120565: "T",
-    120566: "Y",
-    120568: "X",
-    120572: "a",
-    120574: "y",
-    120580: "i",
-    120584: "v",
-    120586: "o",
-    120588: "p",
-    120590: "o",
-    120592: "u",
-    120602: "p",
-    120604: "A",
-    120605: "B",
-    120608: "E",
-    120609: "Z",
-    120610: "H",
-    120612: "I",
-    120613: "K",
-    120615: "M",
-    120616: "N",
-    120618: "O",
-    120620: "P",
-    120623: "T",
-    120624: "Y",
-    120626: "X",
-    120630: "a",
-    120632: "y",
-    120638: "i",
-    120642: "v",
-    120644: "o",
-    120646: "p",
-    120648: "o",
-    120650: "u",
-    120660: "p",
-    120662: "A",
-    120663: "B",
-    120666: "E",
-    120667: "Z",
-    120668: "H",
-    120670: "I",
-    120671: "K",
-    120673: "M",
-    120674: "N",
-    120676: "O",
-    120678: "P",
-    120681: "T",
-    120682: "Y",
-    120684: "X",
-    120688: "a",
-    120690: "y",
-    120696: "i",
-    120700: "v",
-    120702: "o",
-    120704: "p",
-    120706: "o",
-    120708: "u",
-    120718: "p",
-    120720: "A",
-    120721: "B",
-    120724: "E",
-    120725: "Z",
-    120726: "H",
-    120728: "I",
-    120729: "K",
-    120731: "M",
-    120732: "N",
-    120734: "O",
-    120736: "P",
-    120739: "T",
-    120740: "Y",
-    120742: "X",
-    120746: "a",
-    120748: "y",
-    120754: "i",
-    120758: "v",
-    120760: "o",
-    120762: "p",
-    120764: "o",
-    120766: "u",
-    120776: "p",
-    120778: "F",
-    120782: "O",
-    120783: "I",
-    120784: "2",
-    120785: "3",
-    120786: "4",
-    120787: "5",
-    120788: "6",
-    120789: "7",
-    120790: "8",
-    120791: "9",
-    120792: "O",
-    120793: "I",
-    120794: "2",
-    120795: "3",
-    120796: "4",
-    120797: "5",
-    120798: "6",
-    120799: "7",
-    120800: "8",
-    120801: "9",
-    120802: "O",
-    120803: "I",
-    120804: "2",
-    120805: "3",
-    120806: "4",
-    120807: "5",
-    120808: "6",
-    120809: "7",
-    120810: "8",
-    120811: "9",
-    120812: "O",
-    120813: "I",
-    120814: "2",
-    120815: "3",
-    120816: "4",
-    120817: "5",
-    120818: "6",
-    120819: "7",
-    120820: "8",
-    120821: "9",
-    120822: "O",
-    120823: "I",
-    120824: "2",
-    120825: "3",
-    120826: "4",
-    120827: "5",
-    120828: "6",
-    120829: "7",
-    120830: "8",
-    120831: "9",
-    125127: "l",
-    125131: "8",
-    126464: "l",
-    126500: "o",
-    126564: "o",
-    126592: "l",
-    126596: "o",
-    128844: "C",
-    128872: "T",
-    130032: "O",
-    130033: "I",
-    130034: "2",
-    130035: "3",
-    130036: "4",
-    130037: "5",
-    130038: "6",
-    130039: "7",
-    130040: "8",
-    130041: "9",
-    0x212B: "Å",
-    0x2126: "Ω",
-    0x00B5: "μ",
-    8212: "-",
-    8220: '"',
-    8221: '"',
-    8222: '"',
-    8223: '"',
-    8230: ".",
-    0xC0: "A",
-    0xC1: "A",
-    0xC2: "A",
-    0xC3: "A",
-    0xC4: "A",
-    0xC5: "A",
-    0xC7: "C",
-    0xC8: "E",
-    0xC9: "E",
-    0xCA: "E",
-    0xCB: "E",
-    0xCC: "I",
-    0xCD: "I",
-    0xCE: "I",
-    0xCF: "I",
-    0xD1: "N",
-    0xD2: "O",
-    0xD3: "O",
-    0xD4: "O",
-    0xD5: "O",
-    0xD6: "O",
-    0xD8: "O",
-    0xD9: "U",
-    0xDA: "U",
-    0xDB: "U",
-    0xDC: "U",
-    0xDD: "Y",
-    0xE0: "a",
-    0xE1: "a",
-    0xE2: "a",
-    0xE3: "a",
-    0xE4: "a",
-    0xE5: "a",
-    0xE7: "c",
-    0xE8: "e",
-    0xE9: "e",
-    0xEA: "e",
-    0xEB: "e",
-    0xEC: "i",
-    0xED: "i",
-    0xEE: "i",
-    0xEF: "i",
-    0xF1: "n",
-    0xF2: "o",
-    0xF3: "o",
-    0xF4: "o",
-    0xF5: "o",
-    0xF6: "o",
-    0xF8: "o",
-    0xF9: "u",
-    0xFA: "u",
-    0xFB: "u",
-    0xFC: "u",
-    0xFD: "y",
-    0xFF: "y",
-}
+if TYPE_CHECKING:
+    AMBIGUOUS: "GlyphMap"
+
+
+class GlyphMap(Mapping[int, str]):
+    """
+    Read-only mapping of code points to their replacement, stored as runs of consecutive code points.
+
+    Runs are found by binary search over their first code points, and each code point holds the index of its replacement in a
+    table of the distinct replacements, so the whole map takes a few flat arrays instead of an object per entry. Being a
+    mapping raising `KeyError` on misses, it can be handed to `str.translate` as is, though `translation_table` is faster
+    for translating many strings.
+
+    Attributes:
+        starts (array): First code point of each run, in increasing order.
+        offsets (array): Index in indexes of the first code point of each run, followed by the number of code points.
+        indexes (array): Index in replacements of the replacement of each code point, run after run.
+        replacements (tuple[str, ...]): Distinct replacements.
+
+    """
+
+    def __init__(self, runs: Iterable[tuple[int, Iterable[str]]]) -> None:
+        """
+        Initialize GlyphMap from runs of consecutive code points.
+
+        Args:
+            runs (Iterable[tuple[int, Iterable[str]]]): First code point of each run, in increasing order, and the replacement
+                of each code point of the run.
+
+        Raises:
+            ValueError: If runs aren't in increasing order or overlap.
+
+        """
+        self.starts: array = array("I")
+        self.offsets: array = array("I", (0,))
+        self.indexes: array = array("B")
+        interned: dict[str, int] = {}
+        for start, replacements in runs:
+            if self.starts and start < self.starts[-1] + self.offsets[-1] - self.offsets[-2]:
+                raise ValueError("Runs must be in increasing order without overlapping.")
+
+            self.starts.append(start)
+            self.indexes.extend(interned.setdefault(replacement, len(interned)) for replacement in replacements)
+            self.offsets.append(len(self.indexes))
+        self.replacements: tuple[str, ...] = tuple(interned)
+
+    def __getitem__(self, code: int) -> str:
+        """
+        Return the replacement of a code point.
+
+        Args:
+            code (int): Code point to replace.
+
+        Raises:
+            KeyError: If the code point has no replacement.
+
+        Returns:
+            str: Replacement of the code point.
+
+        """
+        run: int = bisect_right(self.starts, code) - 1
+        if run >= 0:
+            index: int = self.offsets[run] + code - self.starts[run]
+            if index < self.offsets[run + 1]:
+                return self.replacements[self.indexes[index]]
+
+        raise KeyError(code)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the code points having a replacement.
+
+        Returns:
+            Iterator[int]: Code points, in increasing order.
+
+        """
+        for run, start in enumerate(self.starts):
+            yield from range(start, start + self.offsets[run + 1] - self.offsets[run])
+
+    def __len__(self) -> int:
+        """
+        Return the number of code points having a replacement.
+
+        Returns:
+            int: Number of code points.
+
+        """
+        return len(self.indexes)
+
+    def translation_table(self) -> dict[int, str]:
+        """
+        Return the map as a dict, the fastest table for `str.translate`.
+
+        Returns:
+            dict[int, str]: Replacement of every code point.
+
+        """
+        return dict(zip(self, map(self.replacements.__getitem__, self.indexes), strict=True))
+
+
+def __getattr__(name: str) -> GlyphMap:
+    if name != "AMBIGUOUS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    table: GlyphMap = import_module("pyjarowinkler._glyphs").AMBIGUOUS
+    globals()[name] = table
+    return table
@@ -0,0 +1,159 @@
+"""Strings packed as contiguous code points, read back through memoryview slices instead of one object per string."""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Final
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+__UTF32__: Final[str] = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+# Arrays when built in memory, memoryviews when read from a buffer such as a memory-mapped file.
+_Buffer = array | memoryview
+
+
+class PackedStrings:
+    """
+    Sequence of strings whose code points are stored back to back in a single array.
+
+    Code points are one byte each (`array("B")`) while every string is ASCII, the array is widened to four bytes each
+    (`array("I")`) when the first other string is appended. Strings read from existing buffers with `from_buffers` are
+    read-only.
+
+    Attributes:
+        codes (array | memoryview): Code points of every string, back to back.
+        offsets (array | memoryview): Index in codes of the first code point of each string.
+        lengths (array | memoryview): Number of code points of each string.
+
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        """
+        Initialize PackedStrings, appending every word.
+
+        Args:
+            words (Iterable[str], optional): Strings to pack, defaults to none.
+
+        """
+        self.codes: _Buffer = array("B")
+        self.offsets: _Buffer = array("Q")
+        self.lengths: _Buffer = array("I")
+        self._view: memoryview | None = None
+        for word in words:
+            self.append(word)
+
+    @classmethod
+    def from_buffers(cls, codes: _Buffer, offsets: _Buffer, lengths: _Buffer) -> "PackedStrings":
+        """
+        Return read-only PackedStrings over existing code points, offsets and lengths, without copying them.
+
+        Args:
+            codes (array | memoryview): Code points of every string, one or four bytes each.
+            offsets (array | memoryview): Index in codes of the first code point of each string.
+            lengths (array | memoryview): Number of code points of each string.
+
+        Returns:
+            PackedStrings: Strings over the buffers.
+
+        """
+        packed: PackedStrings = cls()
+        packed.codes, packed.offsets, packed.lengths = codes, offsets, lengths
+        return packed
+
+    def __len__(self) -> int:
+        """
+        Return the number of strings.
+
+        Returns:
+            int: Number of strings.
+
+        """
+        return len(self.lengths)
+
+    def __getitem__(self, position: int) -> str:
+        """
+        Return a string, decoded from its code points.
+
+        Args:
+            position (int): Position of the string.
+
+        Raises:
+            IndexError: If position is out of range.
+
+        Returns:
+            str: String at position.
+
+        """
+        view: memoryview = self.view(position)
+        if self.codes.itemsize == 1:
+            return view.tobytes().decode("ascii")
+
+        return view.tobytes().decode(__UTF32__, "surrogatepass")
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the strings, decoding each one.
+
+        Returns:
+            Iterator[str]: Every string, in order.
+
+        """
+        return (self[position] for position in range(len(self)))
+
+    def append(self, word: str) -> None:
+        """
+        Pack a string after the others.
+
+        Slices returned by `view` stay valid: while any is alive, the code points are copied to a new buffer instead of
+        being resized in place.
+
+        Args:
+            word (str): String to append.
+
+        Raises:
+            TypeError: If the strings were read from existing buffers.
+
+        """
+        if not isinstance(self.codes, array) or not isinstance(self.offsets, array) or not isinstance(self.lengths, array):
+            raise TypeError("Packed strings read from buffers are read-only.")
+
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+        if self.codes.typecode == "B" and not word.isascii():
+            self.codes = array("I", self.codes)
+
+        offset: int = len(self.codes)
+        encoded: bytes = word.encode("ascii") if self.codes.typecode == "B" else word.encode(__UTF32__, "surrogatepass")
+        try:
+            self.codes.frombytes(encoded)
+
+        except BufferError:
+            # Slices returned by `view` still hold the buffer, which cannot be resized. They keep the old copy.
+            self.codes = array(self.codes.typecode, self.codes)
+            self.codes.frombytes(encoded)
+
+        self.offsets.append(offset)
+        self.lengths.append(len(word))
+
+    def view(self, position: int) -> memoryview:
+        """
+        Return the code points of a string without copying them.
+
+        Args:
+            position (int): Position of the string.
+
+        Raises:
+            IndexError: If position is out of range.
+
+        Returns:
+            memoryview: Code points of the string, as integers.
+
+        """
+        if self._view is None:
+            self._view = memoryview(self.codes)
+
+        start: int = self.offsets[position]
+        return self._view[start : start + self.lengths[position]]
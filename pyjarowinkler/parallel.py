@@ -0,0 +1,89 @@
+"""Split batch comparisons into chunks and spread them over a pool of worker processes or threads."""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from importlib import import_module
+from itertools import islice, repeat
+from math import ceil
+from typing import TYPE_CHECKING, Final, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+# Executors are looked up in `concurrent.futures` once a pool is needed, the process pool importing all of multiprocessing.
+__BACKENDS__: Final[dict[str, str]] = {"process": "ProcessPoolExecutor", "thread": "ThreadPoolExecutor"}
+__CHUNKS_PER_WORKER__: Final[int] = 4
+__MIN_CHUNK_COMPARISONS__: Final[int] = 2048
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+
+def _get_chunk_size(items: int, comparisons: int, workers: int) -> int:
+    # A few chunks per worker balance the uneven cost of strings, but each chunk must run enough comparisons for the kernel to
+    # outweigh pickling the chunk and its results.
+    return max(1, ceil(items / (workers * __CHUNKS_PER_WORKER__)), ceil(__MIN_CHUNK_COMPARISONS__ / max(1, comparisons)))
+
+
+def _chunks(items: Iterable[_Item], size: int) -> Iterator[list[_Item]]:
+    # Items are only read a chunk at a time, so iterators of any length are split in bounded memory.
+    if size < 1:
+        raise ValueError("Provided chunk size is invalid.")
+
+    iterator: Iterator[_Item] = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _split(items: Sequence[_Item], comparisons: int, workers: int) -> list[Sequence[_Item]]:
+    # Items stay whole when there isn't enough work to share between the workers.
+    size: int = _get_chunk_size(len(items), comparisons, workers)
+    if workers == 1 or len(items) <= size:
+        return [items]
+
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _map_chunks(
+    function: Callable[..., _Result],
+    items: Sequence[_Item],
+    comparisons: int,
+    workers: int,
+    *arguments: object,
+    backend: str = "process",
+) -> list[_Result]:
+    """
+    Apply a function to consecutive chunks of items, in a pool of workers when there is enough work to share.
+
+    Worker processes receive pickled copies of the chunks and arguments. Worker threads share them with the caller, which only
+    runs in parallel on free-threaded interpreters but costs no pickling.
+
+    Args:
+        function (Callable): Module level function called as `function(chunk, *arguments)`, picklable by reference.
+        items (Sequence): Items to split in chunks, each chunk a slice of them.
+        comparisons (int): Comparisons performed for each item.
+        workers (int): Maximum number of workers, `1` runs every item in the calling thread.
+        *arguments (object): Arguments passed along every chunk, picklable for the process backend.
+        backend (str, optional): Either `process` or `thread`, defaults to `process`.
+
+    Raises:
+        ValueError: If workers is lower than 1 or if the backend is unknown.
+
+    Returns:
+        list: Result of each chunk, in item order.
+
+    """
+    if workers < 1:
+        raise ValueError("Provided number of workers is invalid.")
+
+    if backend not in __BACKENDS__:
+        raise ValueError("Provided backend is invalid.")
+
+    chunks: list[Sequence[_Item]] = _split(items, comparisons, workers)
+    if len(chunks) == 1:
+        return [function(items, *arguments)]
+
+    pool: Callable[..., Executor] = getattr(import_module("concurrent.futures"), __BACKENDS__[backend])
+    with pool(max_workers=min(workers, len(chunks))) as executor:
+        return list(executor.map(function, chunks, *map(repeat, arguments)))
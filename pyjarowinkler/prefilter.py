@@ -0,0 +1,223 @@
+"""Cheap upper bounds on the matching characters of two strings, used to reject pairs before running the Jaro kernel."""
+
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import Final, Generic, TypeVar
+
+from pyjarowinkler.distance import _get_required_matches
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+_Query = TypeVar("_Query")
+_Signature = TypeVar("_Signature")
+
+
+class Prefilter(ABC, Generic[_Query, _Signature]):
+    """
+    Bound the matches of a query against strings from signatures computed once per string.
+
+    Subclasses must define the `signature` of a string, the state `prepare` computes once per query and `max_matches`, an
+    upper bound on the matches of a query and a string which must never be lower than what the Jaro kernel would find. A
+    subclass missing any of them cannot be instantiated.
+
+    """
+
+    @abstractmethod
+    def signature(self, word: str) -> _Signature:
+        """
+        Return the signature of a sanitized string.
+
+        Args:
+            word (str): Sanitized string.
+
+        Returns:
+            _Signature: Signature of the string.
+
+        """
+
+    def signatures(self, words: Iterable[str]) -> Sequence[_Signature]:
+        """
+        Return the signature of every sanitized string.
+
+        Args:
+            words (Iterable[str]): Sanitized strings.
+
+        Returns:
+            Sequence[_Signature]: Signature of each string, in order.
+
+        """
+        return [self.signature(word) for word in words]
+
+    @abstractmethod
+    def prepare(self, query: str) -> _Query:
+        """
+        Return the state of a sanitized query compared against many signatures.
+
+        Args:
+            query (str): Sanitized query.
+
+        Returns:
+            _Query: State of the query.
+
+        """
+
+    @abstractmethod
+    def max_matches(self, query: _Query, signature: _Signature) -> int:
+        """
+        Return an upper bound on the matches of a query and a string.
+
+        Args:
+            query (_Query): State of the query.
+            signature (_Signature): Signature of the string.
+
+        Returns:
+            int: Most matching characters the two could share.
+
+        """
+
+    def rejects(self, query: _Query, signature: _Signature, short: int, long: int, cutoff: float) -> bool:
+        """
+        Return whether the Jaro similarity of a query and a string is certainly below cutoff.
+
+        Args:
+            query (_Query): State of the query.
+            signature (_Signature): Signature of the string.
+            short (int): Length of the shortest of the two.
+            long (int): Length of the longest of the two.
+            cutoff (float): Jaro similarity to reach.
+
+        Returns:
+            bool: True if the pair cannot reach the cutoff, even without transpositions.
+
+        """
+        return cutoff > 0 and short > 0 and self.max_matches(query, signature) < _get_required_matches(short, long, cutoff)
+
+
+class MaskPrefilter(Prefilter[tuple[int, dict[int, int]], int]):
+    """
+    Prefilter keeping a single 64-bit mask per string, one bit per character class (code point modulo 64).
+
+    A query character can only match in a string holding its class, so the matches are bound by the count of query characters
+    whose class is set in the string's mask.
+
+    """
+
+    def signature(self, word: str) -> int:
+        """
+        Return the character-class mask of a sanitized string.
+
+        Args:
+            word (str): Sanitized string.
+
+        Returns:
+            int: Mask with the bit of each character class of the string set.
+
+        """
+        mask: int = 0
+        for character in word:
+            mask |= 1 << (ord(character) & 63)
+        return mask
+
+    def signatures(self, words: Iterable[str]) -> array:
+        """
+        Return the character-class mask of every sanitized string.
+
+        Args:
+            words (Iterable[str]): Sanitized strings.
+
+        Returns:
+            array: Unsigned 64-bit `array("Q")` of masks, in order.
+
+        """
+        return array("Q", map(self.signature, words))
+
+    def prepare(self, query: str) -> tuple[int, dict[int, int]]:
+        """
+        Return the character-class mask of a sanitized query and its count of characters per class bit.
+
+        Args:
+            query (str): Sanitized query.
+
+        Returns:
+            tuple[int, dict[int, int]]: Mask of the query and count of characters per class bit.
+
+        """
+        counts: dict[int, int] = {}
+        for character in query:
+            bit: int = 1 << (ord(character) & 63)
+            counts[bit] = counts.get(bit, 0) + 1
+        return self.signature(query), counts
+
+    def max_matches(self, query: tuple[int, dict[int, int]], signature: int) -> int:
+        """
+        Return the count of query characters whose class is set in the string's mask.
+
+        Args:
+            query (tuple[int, dict[int, int]]): Mask of the query and count of characters per class bit.
+            signature (int): Character-class mask of the string.
+
+        Returns:
+            int: Most matching characters the two could share.
+
+        """
+        mask, counts = query
+        shared: int = mask & signature
+        matches: int = 0
+        while shared:
+            matches += counts[shared & -shared]
+            shared &= shared - 1
+        return matches
+
+
+class CountPrefilter(Prefilter[Counter[str], Counter[str]]):
+    """
+    Prefilter keeping the multiset of characters of each string.
+
+    A character can match at most as many times as it appears in the string holding the fewest of it, so the matches are bound
+    by the size of the intersection of the two multisets. Tighter than MaskPrefilter, at the cost of a mapping per string.
+
+    """
+
+    def signature(self, word: str) -> Counter[str]:
+        """
+        Return the count of each character of a sanitized string.
+
+        Args:
+            word (str): Sanitized string.
+
+        Returns:
+            Counter[str]: Count of each character.
+
+        """
+        return Counter(word)
+
+    def prepare(self, query: str) -> Counter[str]:
+        """
+        Return the count of each character of a sanitized query.
+
+        Args:
+            query (str): Sanitized query.
+
+        Returns:
+            Counter[str]: Count of each character.
+
+        """
+        return Counter(query)
+
+    def max_matches(self, query: Counter[str], signature: Counter[str]) -> int:
+        """
+        Return the size of the intersection of the two multisets of characters.
+
+        Args:
+            query (Counter[str]): Count of each character of the query.
+            signature (Counter[str]): Count of each character of the string.
+
+        Returns:
+            int: Most matching characters the two could share.
+
+        """
+        if len(signature) < len(query):
+            query, signature = signature, query
+        return sum(min(count, signature[character]) for character, count in query.items())
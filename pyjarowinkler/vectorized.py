@@ -0,0 +1,100 @@
+"""Jaro Winkler similarity of many string pairs of the same lengths at once, with array operations when NumPy is installed."""
+
+from collections.abc import Sequence
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    import numpy as np
+
+else:
+    # NumPy takes longer to import than the whole package, it's only imported once pairs are first scored with it.
+    np = None
+
+__author__: Final[str] = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+# Unset on first use when NumPy is installed but fails to import, the pure Python kernel is used instead.
+__AVAILABLE__: bool = find_spec("numpy") is not None
+__MAX_PREFIX_LENGTH__: Final[int] = 4
+
+
+def _encode(words: Sequence[str], length: int) -> "np.ndarray":
+    # One row of code points per string, every string being `length` characters long.
+    return np.frombuffer("".join(words).encode("utf-32-le", "surrogatepass"), dtype="<u4").reshape(len(words), length)
+
+
+def is_available() -> bool:
+    """
+    Return whether pairs can be scored with NumPy, importing it on the first call.
+
+    Returns:
+        bool: `True` if NumPy is installed and imports, `False` otherwise.
+
+    """
+    global np, __AVAILABLE__  # noqa: PLW0603
+    if __AVAILABLE__ and np is None:
+        try:
+            np = import_module("numpy")
+
+        except ImportError:
+            __AVAILABLE__ = False
+
+    return __AVAILABLE__
+
+
+def get_jaro_winkler_similarities(shorts: Sequence[str], longs: Sequence[str], scaling: float) -> list[float]:
+    """
+    Return the Jaro Winkler similarity of many pairs, the shortest strings all having one length and the longest another.
+
+    Pairs are matched position by position of the shortest strings, each step comparing that character with the window of
+    every pair at once. Scores are the exact same floats as those of the pure Python kernel.
+
+    Args:
+        shorts (Sequence[str]): Shortest string of each pair, all of the same non-zero length.
+        longs (Sequence[str]): Longest string of each pair, all of the same length, at least that of the shortest.
+        scaling (float): Scaling factor of the prefix, `0.0` yields plain Jaro scores.
+
+    Raises:
+        ImportError: If NumPy isn't installed or fails to import.
+
+    Returns:
+        list[float]: Jaro Winkler similarity of each pair, unrounded, in pair order.
+
+    """
+    if not is_available():
+        raise ImportError("NumPy is required for vectorized scoring.")
+
+    count: int = len(shorts)
+    short_length: int = len(shorts[0])
+    long_length: int = len(longs[0])
+    short: np.ndarray = _encode(shorts, short_length)
+    long: np.ndarray = _encode(longs, long_length)
+
+    # Each position of the shortest strings consumes the first unconsumed equal character within the window of the longest.
+    limit: int = max(0, long_length // 2 - 1)
+    consumed: np.ndarray = np.zeros((count, long_length), dtype=bool)
+    matched: np.ndarray = np.zeros((count, short_length), dtype=bool)
+    rows: np.ndarray = np.arange(count)
+    for position in range(short_length):
+        left: int = max(0, position - limit)
+        right: int = min(long_length, position + limit + 1)
+        candidates: np.ndarray = (long[:, left:right] == short[:, position, None]) & ~consumed[:, left:right]
+        found: np.ndarray = np.any(candidates, axis=1)
+        consumed[rows[found], candidates.argmax(axis=1)[found] + left] = True
+        matched[:, position] = found
+
+    # Matched characters of both strings, in order, are moved to the front with a stable sort and compared pairwise.
+    matches: np.ndarray = matched.sum(axis=1)
+    assigned_short: np.ndarray = np.take_along_axis(short, np.argsort(~matched, axis=1, kind="stable"), axis=1)
+    assigned_long: np.ndarray = np.take_along_axis(long, np.argsort(~consumed, axis=1, kind="stable")[:, :short_length], axis=1)
+    swapped: np.ndarray = (assigned_short != assigned_long) & (np.arange(short_length) < matches[:, None])
+    transpositions: np.ndarray = swapped.sum(axis=1) // 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        similarity: np.ndarray = (matches / short_length + matches / long_length + (matches - transpositions) / matches) / 3
+    similarity[matches == 0] = 0.0
+
+    prefix_length: int = min(__MAX_PREFIX_LENGTH__, short_length)
+    prefix: np.ndarray = np.cumprod(short[:, :prefix_length] == long[:, :prefix_length], axis=1).sum(axis=1)
+    return (similarity + (prefix * scaling * (1 - similarity))).tolist()
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyjarowinkler import JaroDistanceError, aio, distance
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestAio(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.candidates: list[str] = ["MARHTA", "DWAYNE", " martha ", "", "DIXON", "MARTHE", "DUANE", "MARHTA"]
+
+    async def test_get_jaro_similarity_many(self) -> None:
+        self.assertEqual(
+            await aio.get_jaro_similarity_many("MARTHA", self.candidates, chunk_size=3),
+            distance.get_jaro_similarity_many("MARTHA", self.candidates),
+        )
+
+    async def test_get_jaro_distance_many(self) -> None:
+        self.assertEqual(
+            await aio.get_jaro_distance_many("MARTHA", self.candidates, norm_case=True, chunk_size=3),
+            distance.get_jaro_distance_many("MARTHA", self.candidates, norm_case=True),
+        )
+
+    async def test_get_jaro_winkler_similarity_many(self) -> None:
+        self.assertEqual(
+            await aio.get_jaro_winkler_similarity_many("MARTHA", iter(self.candidates), chunk_size=3),
+            distance.get_jaro_winkler_similarity_many("MARTHA", self.candidates),
+        )
+
+    async def test_get_jaro_winkler_distance_many_executor(self) -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                await aio.get_jaro_winkler_distance_many("MARTHA", self.candidates, chunk_size=3, executor=executor),
+                distance.get_jaro_winkler_distance_many("MARTHA", self.candidates),
+            )
+
+    async def test_yields_between_chunks(self) -> None:
+        ticks: list[int] = []
+
+        async def tick() -> None:
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        ticker: asyncio.Task = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        before: int = len(ticks)
+        await aio.get_jaro_similarity_many("MARTHA", self.candidates, chunk_size=2)
+        ticker.cancel()
+        self.assertGreaterEqual(len(ticks) - before, 3)
+
+    async def test_empty(self) -> None:
+        self.assertEqual(await aio.get_jaro_similarity_many("MARTHA", []), [])
+
+    async def test_chunk_size_invalid(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            await aio.get_jaro_similarity_many("MARTHA", self.candidates, chunk_size=0)
+
+    async def test_non_string(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            await aio.get_jaro_winkler_similarity_many("MARTHA", ["MARHTA", None], chunk_size=1)  # type: ignore
+
+    async def test_scaling_too_high(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            await aio.get_jaro_winkler_similarity_many("MARTHA", self.candidates, scaling=0.3)
+
+    async def test_extract_best(self) -> None:
+        for k in (1, 2, 3, 10):
+            with self.subTest(k=k):
+                self.assertEqual(
+                    await aio.extract_best("MARTHA", self.candidates, k=k, norm_case=True, chunk_size=3),
+                    distance.extract_best("MARTHA", self.candidates, k=k, norm_case=True),
+                )
+
+    async def test_extract_best_ties_across_chunks(self) -> None:
+        matches: list[distance.Match] = await aio.extract_best("MARTHA", self.candidates, k=2, chunk_size=1)
+        self.assertEqual([match.position for match in matches], [0, 7])
+
+    async def test_extract_best_executor(self) -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                await aio.extract_best("MARTHA", self.candidates, k=3, min_score=0.5, chunk_size=2, executor=executor),
+                distance.extract_best("MARTHA", self.candidates, k=3, min_score=0.5),
+            )
+
+    async def test_extract_best_zero(self) -> None:
+        self.assertEqual(await aio.extract_best("MARTHA", self.candidates, k=0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import io
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from pyjarowinkler import cli
+from pyjarowinkler.corpus import Corpus
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.path: Path = Path(self.directory.name)
+        (self.path / "pairs.csv").write_text("first,second\nMARTHA,MARHTA\nDWAYNE,DUANE\nDIXON,DICKSONX\n")
+        (self.path / "queries.tsv").write_text("id\tname\n1\tmartha\n2\tduane\n")
+        (self.path / "references.jsonl").write_text('{"name": "MARHTA"}\n\n{"name": "DWAYNE"}\n{"name": "MARTHE"}\n')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _run(self, *argv: str) -> str:
+        with redirect_stdout(io.StringIO()) as stdout:
+            self.assertEqual(cli.main(argv), 0)
+        return stdout.getvalue()
+
+    def _fail(self, *argv: str) -> str:
+        with redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit) as exit:
+            cli.main(argv)
+        self.assertNotEqual(exit.exception.code, 0)
+        return stderr.getvalue()
+
+    def test_pairs(self) -> None:
+        self.assertEqual(
+            self._run("pairs", str(self.path / "pairs.csv")),
+            "first,second,score\nMARTHA,MARHTA,0.96\nDWAYNE,DUANE,0.84\nDIXON,DICKSONX,0.81\n",
+        )
+
+    def test_pairs_options(self) -> None:
+        self.assertEqual(
+            self._run("pairs", str(self.path / "pairs.csv"), "--columns", "second", "first", "--scaling", "0", "--decimals", "3"),
+            "first,second,score\nMARTHA,MARHTA,0.944\nDWAYNE,DUANE,0.822\nDIXON,DICKSONX,0.767\n",
+        )
+
+    def test_pairs_threshold(self) -> None:
+        self.assertEqual(
+            self._run("pairs", str(self.path / "pairs.csv"), "--threshold", "0.9"), "first,second,score\nMARTHA,MARHTA,0.96\n"
+        )
+
+    def test_pairs_stdin(self) -> None:
+        with mock.patch("sys.stdin", io.StringIO('{"a": "hello", "b": "HaLoA"}\n')):
+            self.assertEqual(
+                self._run("pairs", "--format", "jsonl", "--norm-case"), '{"a": "hello", "b": "HaLoA", "score": 0.76}\n'
+            )
+
+    def test_pairs_workers(self) -> None:
+        rows: str = "".join(f"MARTHA{n},MARHTA{n}\n" for n in range(3000))
+        (self.path / "many.csv").write_text("first,second\n" + rows)
+        self.assertEqual(
+            self._run("pairs", str(self.path / "many.csv"), "--workers", "2"), self._run("pairs", str(self.path / "many.csv"))
+        )
+
+    def test_match(self) -> None:
+        self.assertEqual(
+            self._run(
+                "match",
+                str(self.path / "queries.tsv"),
+                str(self.path / "references.jsonl"),
+                "--column",
+                "name",
+                "--norm-case",
+                "--limit",
+                "2",
+            ),
+            "id\tname\treference\treference_position\tscore\n"
+            "1\tmartha\tMARHTA\t0\t0.96\n"
+            "1\tmartha\tMARTHE\t2\t0.93\n"
+            "2\tduane\tDWAYNE\t1\t0.84\n"
+            "2\tduane\tMARTHE\t2\t0.58\n",
+        )
+
+    def test_match_every_match_above_threshold(self) -> None:
+        self.assertEqual(
+            self._run(
+                "match",
+                str(self.path / "queries.tsv"),
+                str(self.path / "references.jsonl"),
+                "--column",
+                "name",
+                "--norm-case",
+                "--limit",
+                "0",
+                "--threshold",
+                "0.9",
+            ),
+            "id\tname\treference\treference_position\tscore\n1\tmartha\tMARHTA\t0\t0.96\n1\tmartha\tMARTHE\t2\t0.93\n",
+        )
+
+    def test_match_mixed_formats(self) -> None:
+        (self.path / "references.csv").write_text("name\nMARHTA\nDWAYNE\n")
+        (self.path / "references.txt").write_text("name\nMARHTA\nDWAYNE\n")
+        (self.path / "queries.txt").write_text('{"name": "martha"}\n')
+        argv: tuple[str, ...] = ("--column", "name", "--norm-case", "--limit", "1")
+        expected: str = '{"name": "martha", "reference": "MARHTA", "reference_position": 0, "score": 0.96}\n'
+        self.assertEqual(
+            self._run("match", str(self.path / "queries.txt"), str(self.path / "references.csv"), "--format", "jsonl", *argv),
+            expected,
+        )
+        self.assertEqual(
+            self._run(
+                "match",
+                str(self.path / "queries.txt"),
+                str(self.path / "references.txt"),
+                "--format",
+                "jsonl",
+                "--reference-format",
+                "csv",
+                "--output-format",
+                "tsv",
+                *argv,
+            ),
+            "name\treference\treference_position\tscore\nmartha\tMARHTA\t0\t0.96\n",
+        )
+
+    def test_match_workers(self) -> None:
+        rows: str = "".join(f"{n}\tMARTHA{n}\n" for n in range(3000))
+        (self.path / "many.tsv").write_text("id\tname\n" + rows)
+        argv: tuple[str, ...] = ("match", str(self.path / "many.tsv"), str(self.path / "references.jsonl"), "--column", "name")
+        self.assertEqual(self._run(*argv, "--workers", "2"), self._run(*argv))
+
+    def test_load_corpus(self) -> None:
+        Corpus(["MARHTA", "DWAYNE"], norm_case=True).save(self.path / "references.idx")
+        cli._load_corpus(str(self.path / "references.idx"))
+        self.assertEqual(cli._match_queries(["martha", "duane"], 1, 0.0)[0][0].choice, "MARHTA")
+        self.assertIsInstance(cli._corpus, Corpus)
+        self.assertIsInstance(cli._corpus.sanitized.codes, memoryview)
+
+    def test_import_leaves_multiprocessing_unloaded(self) -> None:
+        check: str = "import sys, pyjarowinkler.cli; print('multiprocessing' in sys.modules)"
+        output: str = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_missing_field(self) -> None:
+        self.assertIn(
+            "Field 'nom' is missing.",
+            self._fail("match", str(self.path / "queries.tsv"), str(self.path / "references.jsonl"), "--column", "nom"),
+        )
+
+    def test_missing_reference_field(self) -> None:
+        self.assertIn(
+            "Field 'nom' is missing.",
+            self._fail("match", str(self.path / "queries.tsv"), str(self.path / "references.jsonl"), "--reference-column", "nom"),
+        )
+
+    def test_missing_file(self) -> None:
+        self.assertIn("error", self._fail("pairs", str(self.path / "missing.csv")))
+
+    def test_invalid_jsonl(self) -> None:
+        with mock.patch("sys.stdin", io.StringIO('["a", "b"]\n')):
+            self.assertIn("JSONL lines must hold objects.", self._fail("pairs", "--format", "jsonl"))
+
+    def test_invalid_scaling(self) -> None:
+        self.assertIn("--scaling", self._fail("pairs", "--scaling", "0.3"))
+
+    def test_invalid_workers(self) -> None:
+        self.assertIn("--workers", self._fail("pairs", "--workers", "0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,21 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from unicodedata import normalize
 
-from pyjarowinkler.comparative import Comparative
+from pyjarowinkler.comparative import CacheInfo, Comparative, FoldingTable, SanitizeCache
+from pyjarowinkler.glyph import AMBIGUOUS
 
 __author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
 
 
+def _separate_passes(word: str, norm_case: bool, norm_utf8: bool, norm_ambiguous: bool) -> str:
+    # Reference sanitizer, each normalization in its own pass.
+    word = normalize("NFC", word) if norm_utf8 else word
+    word = word.translate(AMBIGUOUS) if norm_ambiguous else word
+    return word.casefold() if norm_case else word
+
+
 class TestComparative(unittest.TestCase):
     def setUp(self) -> None:
         self.comparative = Comparative("dummy_string_1", "dummy_string_2")
@@ -42,6 +53,23 @@ class TestComparative(unittest.TestCase):
         self.assertEqual(self.comparative._sanitize("\t", norm_ambiguous=True), "")
         self.assertEqual(self.comparative._sanitize("\n", norm_ambiguous=True), "")
 
+    def test_ambiguous_glyphs_above_ascii(self) -> None:
+        self.assertGreaterEqual(min(AMBIGUOUS), Comparative.__ASCII_MAX__)
+
+    def test_ascii_same_as_unicode_path(self) -> None:
+        words = [chr(code) for code in range(Comparative.__ASCII_MAX__)] + [" Martha O'Neil\t", "DWAYNE-42", "\x7f"]
+        for word, (norm_case, norm_utf8, norm_ambiguous) in product(words, product((False, True), repeat=3)):
+            expected = _separate_passes(word.strip(), norm_case, norm_utf8, norm_ambiguous)
+            with self.subTest(word=word, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous):
+                self.assertEqual(Comparative._sanitize(word, norm_case, norm_utf8, norm_ambiguous), expected)
+
+    def test_unicode_same_as_separate_passes(self) -> None:
+        words = ["Ĳsselmeer Straße", "ΣΊΣΥΦΟΣ", "cafe\u0301 ﬁn", "p\u0430ypal", "\u00a0Müller\u200b", "\uff21\uff22\uff23", "Ⅻ"]
+        for word, (norm_case, norm_utf8, norm_ambiguous) in product(words, product((False, True), repeat=3)):
+            expected = _separate_passes(word.strip(), norm_case, norm_utf8, norm_ambiguous)
+            with self.subTest(word=word, norm_case=norm_case, norm_utf8=norm_utf8, norm_ambiguous=norm_ambiguous):
+                self.assertEqual(Comparative._sanitize(word, norm_case, norm_utf8, norm_ambiguous), expected)
+
     def test_cyrillic_to_latin(self):
         test_cases = [
             ("А", "A"),  # Cyrillic A
@@ -240,3 +268,88 @@ class TestComparative(unittest.TestCase):
             with self.subTest(phishing=phishing, legitimate=legitimate):
                 normalized = self.comparative._sanitize(phishing, norm_ambiguous=True)
                 self.assertEqual(normalized, legitimate, f"Phishing attempt '{phishing}' should normalize to '{legitimate}'")
+
+
+class TestFoldingTable(unittest.TestCase):
+    def test_same_as_separate_passes(self) -> None:
+        codes = sorted(set(range(Comparative.__ASCII_MAX__, 0x3000)) | set(AMBIGUOUS))
+        for casefold in (False, True):
+            table = FoldingTable(casefold)
+            for code in codes:
+                self.assertEqual(chr(code).translate(table), _separate_passes(chr(code), casefold, False, True), hex(code))
+
+    def test_supplementary_planes(self) -> None:
+        table = FoldingTable(casefold=True)
+        for word in ("\U00010400", "\U0001e900", "\U0001d400", "\U00020000"):
+            self.assertEqual(word.translate(table), _separate_passes(word, True, False, True), word)
+
+    def test_only_changed_code_points(self) -> None:
+        for casefold in (False, True):
+            table = FoldingTable(casefold)
+            size = len(table)
+            self.assertEqual("\u4e00\uac00\U00020000".translate(table), "\u4e00\uac00\U00020000")
+            self.assertEqual(len(table), size)
+            self.assertTrue(all(chr(code) != replacement for code, replacement in table.items()))
+            self.assertLess(size, 5000)
+
+    def test_shared_tables(self) -> None:
+        for norm_case in (False, True):
+            Comparative._transform("p\u0430ypal", norm_case, False, True)
+            self.assertEqual(Comparative.tables[norm_case].casefold, norm_case)
+
+
+class TestSanitizeCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache: SanitizeCache = Comparative.enable_cache(maxsize=2)
+
+    def tearDown(self) -> None:
+        Comparative.disable_cache()
+
+    def test_enable_cache(self) -> None:
+        self.assertIs(Comparative.cache, self.cache)
+
+    def test_disable_cache(self) -> None:
+        Comparative.disable_cache()
+        self.assertIsNone(Comparative.cache)
+        self.assertEqual(Comparative._sanitize(" a "), "a")
+
+    def test_invalid_size(self) -> None:
+        with self.assertRaises(ValueError):
+            SanitizeCache(maxsize=0)
+
+    def test_hit_and_miss(self) -> None:
+        self.assertEqual(Comparative._sanitize(" HÉllo ", norm_case=True), "héllo")
+        self.assertEqual(Comparative._sanitize(" HÉllo ", norm_case=True), "héllo")
+        self.assertEqual(self.cache.info(), CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1))
+
+    def test_key_includes_flags(self) -> None:
+        self.assertEqual(Comparative._sanitize("Аpple", norm_ambiguous=True), "Apple")
+        self.assertEqual(Comparative._sanitize("Аpple", norm_ambiguous=False), "Аpple")
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_evicts_least_recently_used(self) -> None:
+        Comparative("first", "second")
+        Comparative._sanitize("first")
+        Comparative._sanitize("third")
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertIsNotNone(self.cache.get(("first", False, False, False)))
+        self.assertIsNone(self.cache.get(("second", False, False, False)))
+
+    def test_clear(self) -> None:
+        Comparative._sanitize("first")
+        self.cache.clear()
+        self.assertEqual(self.cache.info(), CacheInfo(0, 0, 0, 2, 0))
+
+    def test_shared_between_threads(self) -> None:
+        words: list[str] = [f" Word{n % 7} " for n in range(1000)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sanitized: list[str] = list(executor.map(Comparative._sanitize, words))
+        self.assertEqual(sanitized, [word.strip() for word in words])
+        info: CacheInfo = self.cache.info()
+        self.assertEqual(info.hits + info.misses, len(words))
+        self.assertLessEqual(info.currsize, info.maxsize)
+
+    def test_non_string_not_cached(self) -> None:
+        with self.assertRaises(ValueError):
+            Comparative._sanitize(None)  # type: ignore
+        self.assertEqual(len(self.cache), 0)
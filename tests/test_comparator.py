@@ -0,0 +1,56 @@
+import unittest
+
+from pyjarowinkler import JaroDistanceError, distance
+from pyjarowinkler.comparator import Comparator
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestComparator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.comparator = Comparator()
+
+    def test_similarity_martha(self) -> None:
+        self.assertEqual(self.comparator.similarity("MARTHA", "MARHTA"), 0.96)
+
+    def test_distance_dwayne(self) -> None:
+        self.assertEqual(self.comparator.distance("DWAYNE", "DUANE"), 0.16)
+
+    def test_similarity_empty(self) -> None:
+        self.assertEqual(self.comparator.similarity("", ""), 1.0)
+
+    def test_similarity_matches_function(self) -> None:
+        comparator: Comparator = Comparator(scaling=0.2, decimals=5, norm_case=True, norm_utf8=True, norm_ambiguous=True)
+        pairs: list[tuple[str, str]] = [("hello", "HaLoA"), ("pаypal", "Paypal"), ("café", "café"), ("dixon", "dicksonx")]
+        for first, second in pairs:
+            with self.subTest(first=first, second=second):
+                self.assertEqual(
+                    comparator.similarity(first, second),
+                    distance.get_jaro_winkler_similarity(
+                        first, second, scaling=0.2, decimals=5, norm_case=True, norm_utf8=True, norm_ambiguous=True
+                    ),
+                )
+
+    def test_zero_scaling_is_jaro(self) -> None:
+        self.assertEqual(Comparator(scaling=0.0).similarity("faremviel", "farmville"), 0.88)
+        self.assertEqual(Comparator(scaling=0.0).distance("faremviel", "farmville"), 0.12)
+
+    def test_scaling_too_high(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            Comparator(scaling=0.3)
+
+    def test_scaling_negative(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            Comparator(scaling=-0.1)
+
+    def test_similarity_non_string(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            self.comparator.similarity(123, "abc")  # type: ignore
+
+    def test_distance_non_string(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            self.comparator.distance("abc", None)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+import mmap
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyjarowinkler import JaroDistanceError, distance
+from pyjarowinkler.corpus import Corpus
+from pyjarowinkler.prefilter import CountPrefilter, MaskPrefilter
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self) -> None:
+        self.references: list[str] = ["MARHTA", "DWAYNE", "MARTHA", "", "DIXON", "MARTHE", "DUANE", "PENNCISYLVNIA"]
+        self.corpus: Corpus = Corpus(self.references)
+
+    def test_len(self) -> None:
+        self.assertEqual(len(self.corpus), 8)
+
+    def test_sanitized_metadata(self) -> None:
+        corpus: Corpus = Corpus(["  Hello ", "Wörld"], norm_case=True)
+        self.assertEqual(list(corpus.sanitized), ["hello", "wörld"])
+        self.assertEqual(list(corpus.references), ["  Hello ", "Wörld"])
+        self.assertEqual(list(corpus.lengths), [5, 5])
+        self.assertEqual(list(corpus.signatures), [MaskPrefilter().signature("hello"), MaskPrefilter().signature("wörld")])
+
+    def test_references_shared_when_unchanged(self) -> None:
+        self.assertIs(self.corpus.references, self.corpus.sanitized)
+        self.assertEqual(self.corpus.sanitized.codes.typecode, "B")
+
+    def test_references_packed_from_first_change(self) -> None:
+        corpus: Corpus = Corpus(["MARTHA", "DWAYNE", " DIXON"])
+        self.assertIsNot(corpus.references, corpus.sanitized)
+        self.assertEqual(list(corpus.references), ["MARTHA", "DWAYNE", " DIXON"])
+        self.assertEqual(corpus.top_k("DIXON", k=1), [distance.Match(" DIXON", 1.0, 2)])
+
+    def test_trie(self) -> None:
+        self.assertEqual(
+            {length: list(positions) for length, positions in self.corpus.trie.buckets.items()},
+            {
+                6: [0, 1, 2, 5],
+                0: [3],
+                5: [4, 6],
+                13: [7],
+            },
+        )
+        self.assertEqual(sorted(self.corpus.trie.children), ["D", "M", "P"])
+        self.assertEqual(list(self.corpus.trie.children["D"].buckets[5]), [4, 6])
+        node = self.corpus.trie.children["M"].children["A"].children["R"]
+        self.assertEqual(list(node.buckets[6]), [0, 2, 5])
+        self.assertEqual(list(node.children["T"].buckets[6]), [2, 5])
+        self.assertEqual(node.children["T"].children, {})
+
+    def _skip_first(self, corpus: Corpus) -> None:
+        view = corpus.sanitized.view
+
+        def guarded(position: int) -> memoryview:
+            self.assertNotEqual(position, 0)
+            return view(position)
+
+        corpus.sanitized.view = guarded  # type: ignore[method-assign]
+
+    def test_search_skips_unreachable_buckets(self) -> None:
+        corpus: Corpus = Corpus(["a" * 40, "MARTHA"])
+        self._skip_first(corpus)
+        self.assertEqual(corpus.search("MARTHA", 0.9), [distance.Match("MARTHA", 1.0, 1)])
+
+    def test_search_skips_unreachable_prefixes(self) -> None:
+        corpus: Corpus = Corpus(["XBCDEFGHI", "ABCDEFGHI"])
+        self._skip_first(corpus)
+        self.assertEqual(corpus.search("ABCDEF", 0.9), [distance.Match("ABCDEFGHI", 0.93, 1)])
+
+    def test_search_wide_code_points(self) -> None:
+        corpus: Corpus = Corpus(["MARTHA", "MÄRTHA", "M\U0001f600RTHA"])
+        self.assertEqual(corpus.sanitized.codes.typecode, "I")
+        self.assertEqual(
+            corpus.search("MÄRTHA", 0.5),
+            [
+                distance.Match(choice, score, position)
+                for choice, score, position in [("MÄRTHA", 1.0, 1), ("MARTHA", 0.9, 0), ("M\U0001f600RTHA", 0.9, 2)]
+            ],
+        )
+
+    def test_search_same_as_extract_best(self) -> None:
+        references: list[str] = ["MARHTA", "MARTHE", "MAR", "MA", "M", "ARTHA", "MARTHAS", "MRTHA", "MARMALADE", ""]
+        threshold: float = 0.8
+        for scaling in (0.0, 0.1, 0.25):
+            corpus: Corpus = Corpus(references, scaling=scaling, decimals=12)
+            best: list[distance.Match] = distance.extract_best("MARTHA", references, k=10, scaling=scaling, decimals=12)
+            with self.subTest(scaling=scaling):
+                self.assertEqual(corpus.top_k("MARTHA", k=3), best[:3])
+                self.assertEqual(corpus.search("MARTHA", threshold), [match for match in best if match.score >= threshold])
+
+    def test_top_k_ties_keep_corpus_order(self) -> None:
+        corpus: Corpus = Corpus(["abcd", "abc", "abce", "abc"])
+        self.assertEqual([m.position for m in corpus.top_k("abc", k=2)], [1, 3])
+
+    def test_count_prefilter(self) -> None:
+        corpus: Corpus = Corpus(self.references, prefilter=CountPrefilter())
+        self.assertEqual(corpus.top_k("DWAYNE", k=3), self.corpus.top_k("DWAYNE", k=3))
+        self.assertEqual(corpus.search("MARTHA", 0.9), self.corpus.search("MARTHA", 0.9))
+
+    def test_search(self) -> None:
+        self.assertEqual(
+            self.corpus.search("MARTHA", 0.9),
+            [distance.Match("MARTHA", 1.0, 2), distance.Match("MARHTA", 0.96, 0), distance.Match("MARTHE", 0.93, 5)],
+        )
+
+    def test_search_same_as_many(self) -> None:
+        scores: list[float] = distance.get_jaro_winkler_similarity_many("DWAYNE", self.references)
+        self.assertEqual(
+            [(m.position, m.score) for m in self.corpus.search("DWAYNE", 0.0)],
+            sorted(enumerate(scores), key=lambda x: -x[1]),
+        )
+
+    def test_search_empty_query(self) -> None:
+        self.assertEqual(self.corpus.search("", 0.5), [distance.Match("", 1.0, 3)])
+
+    def test_top_k(self) -> None:
+        self.assertEqual(self.corpus.top_k("DWAYNE", k=2), distance.extract_best("DWAYNE", self.references, k=2))
+
+    def test_top_k_min_score(self) -> None:
+        self.assertEqual(self.corpus.top_k("PENNSYLVANIA", min_score=0.85), [distance.Match("PENNCISYLVNIA", 0.9, 7)])
+
+    def test_top_k_zero(self) -> None:
+        self.assertEqual(self.corpus.top_k("DWAYNE", k=0), [])
+
+    def test_normalization(self) -> None:
+        corpus: Corpus = Corpus(["paypal", "apple"], norm_case=True, norm_ambiguous=True)
+        self.assertEqual(corpus.top_k("PаYPAL", k=1), [distance.Match("paypal", 1.0, 0)])
+
+    def test_scaling(self) -> None:
+        corpus: Corpus = Corpus(["farmville"], scaling=0.0, decimals=3)
+        self.assertEqual(corpus.top_k("faremviel")[0].score, distance.get_jaro_similarity("faremviel", "farmville", decimals=3))
+
+    def test_scaling_too_high(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            Corpus(["foo"], scaling=0.3)
+
+    def test_non_string_reference(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            Corpus(["foo", 1])  # type: ignore
+
+    def test_non_string_query(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            self.corpus.search(None, 0.5)  # type: ignore
+
+
+class TestCorpusIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.path: Path = Path(self.directory.name) / "corpus.idx"
+        self.references: list[str] = ["MARHTA", " Dwayne", "MARTHA", "", "DIXON", "MÄRTHE", "DUANE", "PENNCISYLVNIA"]
+        self.corpus: Corpus = Corpus(self.references, scaling=0.2, decimals=4, norm_case=True)
+        self.corpus.save(self.path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_load(self) -> None:
+        for mapped in (True, False):
+            with self.subTest(mmap=mapped):
+                corpus: Corpus = Corpus.load(self.path, mmap=mapped)
+                self.assertEqual((corpus.scaling, corpus.decimals, corpus.norm_case), (0.2, 4, True))
+                self.assertEqual(list(corpus.references), self.references)
+                self.assertEqual(list(corpus.sanitized), list(self.corpus.sanitized))
+                self.assertEqual(list(corpus.signatures), list(self.corpus.signatures))
+                for query in ("martha", "duane", "pennsylvania", ""):
+                    self.assertEqual(corpus.top_k(query, k=3), self.corpus.top_k(query, k=3))
+                    self.assertEqual(corpus.search(query, 0.5), self.corpus.search(query, 0.5))
+
+    def test_load_mapped(self) -> None:
+        corpus: Corpus = Corpus.load(self.path)
+        self.assertIsInstance(corpus.sanitized.codes, memoryview)
+        self.assertIsInstance(corpus.sanitized.codes.obj, mmap.mmap)
+
+    def test_load_trie(self) -> None:
+        node = Corpus.load(self.path).trie.children["m"].children["a"]
+        self.assertEqual(list(node.buckets[6]), [0, 2])
+        self.assertEqual(sorted(node.children), ["r"])
+
+    def test_load_shared_references(self) -> None:
+        Corpus(["MARTHA", "DIXON"]).save(self.path)
+        corpus: Corpus = Corpus.load(self.path)
+        self.assertIs(corpus.references, corpus.sanitized)
+        self.assertEqual(corpus.top_k("DIXON", k=1), [distance.Match("DIXON", 1.0, 1)])
+
+    def test_load_other_prefilter(self) -> None:
+        corpus: Corpus = Corpus.load(self.path, prefilter=CountPrefilter())
+        self.assertEqual(list(corpus.signatures), [CountPrefilter().signature(word) for word in self.corpus.sanitized])
+        self.assertEqual(corpus.top_k("martha", k=3), self.corpus.top_k("martha", k=3))
+
+    def test_save_loaded(self) -> None:
+        copy: Path = Path(self.directory.name) / "copy.idx"
+        Corpus.load(self.path).save(copy)
+        self.assertEqual(copy.read_bytes(), self.path.read_bytes())
+
+    def test_load_empty_corpus(self) -> None:
+        Corpus([]).save(self.path)
+        corpus: Corpus = Corpus.load(self.path)
+        self.assertEqual(len(corpus), 0)
+        self.assertEqual(corpus.top_k("martha"), [])
+
+    def test_load_read_only(self) -> None:
+        corpus: Corpus = Corpus.load(self.path)
+        with self.assertRaises(TypeError):
+            corpus.sanitized.append("MARTHA")
+
+    def test_load_invalid(self) -> None:
+        self.path.write_bytes(b"MARTHA,DWAYNE\n")
+        with self.assertRaises(JaroDistanceError):
+            Corpus.load(self.path)
+
+    def test_load_truncated(self) -> None:
+        self.path.write_bytes(self.path.read_bytes()[:-8])
+        with self.assertRaises(JaroDistanceError):
+            Corpus.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
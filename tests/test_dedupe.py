@@ -0,0 +1,104 @@
+import random
+import unittest
+from collections import OrderedDict
+from collections.abc import Iterator
+
+from pyjarowinkler import JaroDistanceError, distance
+from pyjarowinkler.dedupe import Assignment, dedupe
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestDedupe(unittest.TestCase):
+    def test_dedupe(self) -> None:
+        self.assertEqual(
+            list(dedupe(["MARTHA", "DWAYNE", "MARHTA", "DUANE", "MARTHA"], threshold=0.85)),
+            [
+                Assignment("MARTHA", 0, 0, 1.0),
+                Assignment("DWAYNE", 1, 1, 1.0),
+                Assignment("MARHTA", 2, 0, 0.96),
+                Assignment("DUANE", 3, 3, 1.0),
+                Assignment("MARTHA", 4, 0, 1.0),
+            ],
+        )
+
+    def test_dedupe_most_similar_cluster(self) -> None:
+        assignments: list[Assignment] = list(dedupe(["MARTHE", "MARTHA", "MARTHA"], threshold=0.9))
+        self.assertEqual([assignment.cluster for assignment in assignments], [0, 0, 0])
+        assignments = list(dedupe(["MARTHE", "MARTHA", "MARTHA"], threshold=0.95))
+        self.assertEqual([assignment.cluster for assignment in assignments], [0, 1, 1])
+
+    def test_dedupe_matches_unpruned_scan(self) -> None:
+        # Score every representative in the window, as the scan did before it was pruned by length and signature.
+        def unpruned(records: list[str], threshold: float, window: int) -> Iterator[Assignment]:
+            representatives: OrderedDict[int, str] = OrderedDict()
+            for position, word in enumerate(records):
+                scores: list[tuple[float, int]] = []
+                for cluster, representative in representatives.items():
+                    short, long = distance._order(word, representative)
+                    boost: float = distance._get_prefix(short, long) * 0.1
+                    similarity: float = distance._similarity(short, long, bytearray(), 0.0)
+                    scores.append((similarity + (boost * (1 - similarity)), -cluster))
+                score, cluster = max(scores, default=(0.0, 0))
+                if scores and score >= threshold:
+                    representatives.move_to_end(-cluster)
+                    yield Assignment(word, position, -cluster, round(score, 2))
+                    continue
+
+                representatives[position] = word
+                if len(representatives) > window:
+                    representatives.popitem(last=False)
+                yield Assignment(word, position, position, 1.0)
+
+        generator: random.Random = random.Random(7)
+        records: list[str] = ["".join(generator.choices("ABCDE\u00e9", k=generator.randint(0, 9))) for _ in range(300)]
+        for threshold in (0.0, 0.5, 0.8, 0.9, 1.0):
+            for window in (1, 8, 1000):
+                with self.subTest(threshold=threshold, window=window):
+                    self.assertEqual(
+                        list(dedupe(records, threshold=threshold, window=window)),
+                        list(unpruned(records, threshold, window)),
+                    )
+
+    def test_dedupe_key(self) -> None:
+        records: list[dict[str, str]] = [{"name": "Martha"}, {"name": " MARTHA "}]
+        assignments: list[Assignment] = list(dedupe(records, key=lambda record: record["name"], norm_case=True))
+        self.assertIs(assignments[1].record, records[1])
+        self.assertEqual(assignments[1].cluster, 0)
+
+    def test_dedupe_is_lazy(self) -> None:
+        def records() -> Iterator[str]:
+            yield "MARTHA"
+            yield "MARHTA"
+            raise AssertionError("consumed too far")
+
+        assignments: Iterator[Assignment] = dedupe(records())
+        self.assertEqual(next(assignments).cluster, 0)
+        self.assertEqual(next(assignments).cluster, 0)
+
+    def test_dedupe_window(self) -> None:
+        assignments: list[Assignment] = list(dedupe(["MARTHA", "DWAYNE", "DIXON", "MARTHA", "DIXON"], window=2))
+        self.assertEqual([assignment.cluster for assignment in assignments], [0, 1, 2, 3, 2])
+
+    def test_dedupe_window_keeps_recently_used(self) -> None:
+        assignments: list[Assignment] = list(dedupe(["MARTHA", "DWAYNE", "MARTHA", "DIXON", "MARTHA"], window=2))
+        self.assertEqual([assignment.cluster for assignment in assignments], [0, 1, 0, 3, 0])
+
+    def test_dedupe_empty(self) -> None:
+        self.assertEqual(list(dedupe([])), [])
+
+    def test_dedupe_non_string(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            list(dedupe(["MARTHA", None]))  # type: ignore
+
+    def test_dedupe_window_invalid(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            dedupe(["MARTHA"], window=0)
+
+    def test_dedupe_scaling_too_high(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            dedupe(["MARTHA"], scaling=0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
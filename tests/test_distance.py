@@ -36,16 +36,83 @@ class TestDistance(unittest.TestCase):
     def test_get_limit_six_elements(self) -> None:
         self.assertEqual(distance._get_limit(["a", "b", "c", "d", "e", "f"]), 2)
 
-    def test_clean(self) -> None:
-        test: list[str] = ["", "cd", "", "", "ab"]
-        distance._clean(test)
-        self.assertEqual(test, ["cd", "ab"])
-
-    def test_get_transpositions_once(self) -> None:
-        self.assertEqual(distance._get_transpositions(["a", "b", "c"], ["a", "c", "b"]), 1)
-
-    def test_get_transpositions_none(self) -> None:
-        self.assertEqual(distance._get_transpositions(["2", "7", "0", "0"], ["2", "7", "0", "0"]), 0)
+    def test_get_matches_and_transpositions_once(self) -> None:
+        self.assertEqual(distance._get_matches_and_transpositions("abcd", "acbd"), (4, 1))
+
+    def test_get_matches_and_transpositions_none(self) -> None:
+        self.assertEqual(distance._get_matches_and_transpositions("2700", "2700"), (4, 0))
+
+    def test_get_matches_and_transpositions_repeated(self) -> None:
+        self.assertEqual(distance._get_matches_and_transpositions("aaab", "baaaa"), (3, 0))
+
+    def test_get_matches_and_transpositions_reuses_flags(self) -> None:
+        flags: bytearray = bytearray(2)
+        self.assertEqual(distance._get_matches_and_transpositions("MARTHA", "MARHTA", flags), (6, 1))
+        self.assertEqual(len(flags), 12)
+        self.assertFalse(any(flags))
+        self.assertEqual(distance._get_matches_and_transpositions("DIXON", "DICKSONX", flags), (4, 0))
+        self.assertFalse(any(flags))
+
+    def test_get_required_matches(self) -> None:
+        self.assertEqual(distance._get_required_matches(6, 6, 0.85), 5)
+
+    def test_get_required_matches_no_cutoff(self) -> None:
+        self.assertLessEqual(distance._get_required_matches(6, 6, 0.0), 0)
+
+    def test_get_cutoff(self) -> None:
+        self.assertAlmostEqual(distance._get_cutoff(0.9, 0.2), 0.875)
+
+    def test_get_cutoff_full_boost(self) -> None:
+        self.assertEqual(distance._get_cutoff(0.9, 1.0), 0.0)
+
+    def test_get_upper_bound(self) -> None:
+        self.assertAlmostEqual(distance._get_upper_bound(3, 6, 0.0), 5 / 6)
+        self.assertAlmostEqual(distance._get_upper_bound(3, 6, 0.3), 5 / 6 + 0.3 / 6)
+
+    def test_get_upper_bound_empty(self) -> None:
+        self.assertEqual(distance._get_upper_bound(0, 0, 0.1), 1.0)
+        self.assertEqual(distance._get_upper_bound(0, 3, 0.1), 0.0)
+
+    def test_get_upper_bound_reached(self) -> None:
+        self.assertAlmostEqual(
+            distance.get_jaro_winkler_similarity("abc", "abcxyz", decimals=12), distance._get_upper_bound(3, 6, 0.3)
+        )
+
+    def test_get_matches_and_transpositions_required_unreachable(self) -> None:
+        flags: bytearray = bytearray()
+        self.assertEqual(distance._get_matches_and_transpositions("abcdefgh" * 9, "abcdefgz" * 9, flags, required=72), (0, 0))
+        self.assertFalse(any(flags))
+
+    def test_get_matches_and_transpositions_bitparallel_required_unreachable(self) -> None:
+        self.assertEqual(distance._get_matches_and_transpositions_bitparallel("MARTHA", "MARHTX", required=6), (0, 0))
+
+    def test_get_matches_and_transpositions_bitparallel_required_reached(self) -> None:
+        self.assertEqual(distance._get_matches_and_transpositions_bitparallel("MARTHA", "MARHTA", required=6), (6, 1))
+
+    def test_get_matches_and_transpositions_bitparallel_martha(self) -> None:
+        self.assertEqual(distance._get_matches_and_transpositions_bitparallel("MARTHA", "MARHTA"), (6, 1))
+
+    def test_get_matches_and_transpositions_bitparallel_no_match(self) -> None:
+        self.assertEqual(distance._get_matches_and_transpositions_bitparallel("abc", "xyz"), (0, 0))
+
+    def test_get_matches_and_transpositions_bitparallel_same_as_list(self) -> None:
+        pairs: list[tuple[str, str]] = [
+            ("PENNSYLVANIA", "PENNCISYLVNIA"),
+            ("DIXON", "DICKSONX"),
+            ("aaaab", "baaaaaaa"),
+            ("abcabc", "cbacbacba"),
+            ("a" * 30, "ab" * 32),
+        ]
+        for short, long in pairs:
+            with self.subTest(short=short, long=long):
+                self.assertEqual(
+                    distance._get_matches_and_transpositions_bitparallel(short, long),
+                    distance._get_matches_and_transpositions(short, long),
+                )
+
+    def test_get_jaro_winkler_similarity_beyond_bitparallel(self) -> None:
+        long: str = "abcdefghij" * 7
+        self.assertEqual(distance.get_jaro_winkler_similarity(long, long[:-1] + "z", decimals=4), 0.9943)
 
     def test_get_jaro_winkler_similarity_empty(self) -> None:
         self.assertEqual(distance.get_jaro_winkler_similarity("", ""), 1.0)
@@ -172,6 +239,179 @@ class TestDistance(unittest.TestCase):
         with self.assertRaises(JaroDistanceError):
             distance.get_jaro_winkler_distance("foo", "bar", scaling=-0.1)
 
+    def test_get_jaro_winkler_similarity_many(self) -> None:
+        candidates: list[str] = ["MARHTA", "MARTHA", "", "DWAYNE", "MARTHANE"]
+        self.assertEqual(
+            distance.get_jaro_winkler_similarity_many("MARTHA", candidates),
+            [distance.get_jaro_winkler_similarity("MARTHA", candidate) for candidate in candidates],
+        )
+
+    def test_get_jaro_winkler_distance_many(self) -> None:
+        candidates: list[str] = ["DUANE", "dwayne", "DWAYNE"]
+        self.assertEqual(
+            distance.get_jaro_winkler_distance_many("DWAYNE", candidates, scaling=0.2, decimals=4, norm_case=True),
+            [distance.get_jaro_winkler_distance("DWAYNE", c, scaling=0.2, decimals=4, norm_case=True) for c in candidates],
+        )
+
+    def test_get_jaro_similarity_many(self) -> None:
+        self.assertEqual(distance.get_jaro_similarity_many("faremviel", ["farmville", "faremviel", "x"]), [0.88, 1.0, 0.0])
+
+    def test_get_jaro_distance_many(self) -> None:
+        self.assertEqual(distance.get_jaro_distance_many("pаypal", iter(["paypal"]), norm_ambiguous=True), [0.0])
+
+    def test_get_jaro_similarity_many_empty(self) -> None:
+        self.assertEqual(distance.get_jaro_similarity_many("foo", []), [])
+
+    def test_get_jaro_winkler_similarity_many_non_string(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.get_jaro_winkler_similarity_many("foo", ["bar", 123])  # type: ignore
+
+    def test_get_jaro_winkler_similarity_many_scaling_too_high(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.get_jaro_winkler_similarity_many("foo", ["bar"], scaling=0.3)
+
+    def test_get_jaro_winkler_similarity_many_workers(self) -> None:
+        candidates: list[str] = [f"MARTHA{n}" for n in range(5000)]
+        self.assertEqual(
+            distance.get_jaro_winkler_similarity_many("MARHTA", candidates, decimals=12, workers=2),
+            distance.get_jaro_winkler_similarity_many("MARHTA", candidates, decimals=12),
+        )
+
+    def test_get_jaro_winkler_distance_many_threads(self) -> None:
+        candidates: list[str] = [f"MARTHA{n}" for n in range(5000)]
+        self.assertEqual(
+            distance.get_jaro_winkler_distance_many("MARHTA", candidates, decimals=12, workers=2, backend="thread"),
+            distance.get_jaro_winkler_distance_many("MARHTA", candidates, decimals=12),
+        )
+
+    def test_get_jaro_similarity_many_backend_invalid(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.get_jaro_similarity_many("foo", ["bar"], workers=2, backend="fiber")
+
+    def test_get_jaro_similarity_many_workers_invalid(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.get_jaro_similarity_many("foo", ["bar"], workers=0)
+
+    def test_cdist(self) -> None:
+        left: list[str] = ["MARTHA", "DWAYNE", ""]
+        right: list[str] = ["MARHTA", "DUANE"]
+        self.assertEqual(
+            list(distance.cdist(left, right)),
+            [distance.get_jaro_winkler_similarity(row, column) for row in left for column in right],
+        )
+
+    def test_cdist_typecode(self) -> None:
+        self.assertEqual(distance.cdist(["a"], ["a"]).typecode, "d")
+
+    def test_cdist_jaro_distance(self) -> None:
+        self.assertEqual(list(distance.cdist(["faremviel"], ["farmville", "faremviel"], metric="jaro_distance")), [0.12, 0.0])
+
+    def test_cdist_jaro_winkler_distance_norm_case(self) -> None:
+        self.assertEqual(
+            list(distance.cdist(["hello"], ["HaLoA"], metric="jaro_winkler_distance", norm_case=True)),
+            [distance.get_jaro_winkler_distance("hello", "HaLoA", norm_case=True)],
+        )
+
+    def test_cdist_jaro_ignores_scaling(self) -> None:
+        self.assertEqual(list(distance.cdist(["jake"], ["joe"], metric="jaro", scaling=1.0)), [0.72])
+
+    def test_cdist_empty(self) -> None:
+        self.assertEqual(len(distance.cdist([], ["abc"])), 0)
+
+    def test_cdist_workers(self) -> None:
+        left: list[str] = [f"DWAYNE{n}" for n in range(60)]
+        right: list[str] = [f"DUANE{n}" for n in range(60)]
+        self.assertEqual(distance.cdist(left, right, decimals=12, workers=2), distance.cdist(left, right, decimals=12))
+
+    def test_cdist_threads(self) -> None:
+        left: list[str] = [f"DWAYNE{n}" for n in range(60)]
+        right: list[str] = [f"DUANE{n}" for n in range(60)]
+        self.assertEqual(
+            distance.cdist(left, right, metric="jaro", workers=3, backend="thread"), distance.cdist(left, right, metric="jaro")
+        )
+
+    def test_cdist_invalid_metric(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.cdist(["foo"], ["bar"], metric="levenshtein")
+
+    def test_cdist_scaling_too_high(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.cdist(["foo"], ["bar"], scaling=0.3)
+
+    def test_cdist_non_string(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.cdist(["foo"], [None])  # type: ignore
+
+    def test_get_jaro_similarity_min_similarity_rejected(self) -> None:
+        self.assertIsNone(distance.get_jaro_similarity("jake", "joe", min_similarity=0.8))
+
+    def test_get_jaro_similarity_min_similarity_accepted(self) -> None:
+        self.assertEqual(distance.get_jaro_similarity("amy", "mary", min_similarity=0.8), 0.81)
+
+    def test_get_jaro_similarity_min_similarity_length_bound(self) -> None:
+        self.assertIsNone(distance.get_jaro_similarity("a", "abcdefghij", min_similarity=0.75))
+
+    def test_get_jaro_distance_max_distance(self) -> None:
+        self.assertEqual(distance.get_jaro_distance("faremviel", "farmville", max_distance=0.2), 0.12)
+        self.assertIsNone(distance.get_jaro_distance("faremviel", "farmville", max_distance=0.1))
+
+    def test_get_jaro_winkler_similarity_min_similarity(self) -> None:
+        self.assertEqual(distance.get_jaro_winkler_similarity("MARTHA", "MARHTA", min_similarity=0.85), 0.96)
+        self.assertIsNone(distance.get_jaro_winkler_similarity("DWAYNE", "DUANE", min_similarity=0.85))
+
+    def test_get_jaro_winkler_similarity_min_similarity_uses_prefix(self) -> None:
+        self.assertEqual(distance.get_jaro_winkler_similarity("PENNSYLVANIA", "PENNCISYLVNIA", min_similarity=0.85), 0.9)
+
+    def test_get_jaro_winkler_similarity_min_similarity_zero(self) -> None:
+        self.assertEqual(distance.get_jaro_winkler_similarity("fly", "ant", min_similarity=0.0), 0.0)
+
+    def test_get_jaro_winkler_distance_max_distance(self) -> None:
+        self.assertEqual(distance.get_jaro_winkler_distance("DIXON", "DICKSONX", max_distance=0.2), 0.19)
+        self.assertIsNone(distance.get_jaro_winkler_distance("DIXON", "DICKSONX", max_distance=0.15))
+
+    def test_get_jaro_winkler_distance_max_distance_long(self) -> None:
+        long: str = "abcdefghij" * 7
+        self.assertIsNone(distance.get_jaro_winkler_distance(long, long[::-1], max_distance=0.1))
+
+    def test_extract_best(self) -> None:
+        self.assertEqual(
+            distance.extract_best("MARTHA", ["MARHTA", "MARTHA", "DWAYNE", "MARTHE"], k=2),
+            [distance.Match("MARTHA", 1.0, 1), distance.Match("MARHTA", 0.96, 0)],
+        )
+
+    def test_extract_best_same_as_sorted(self) -> None:
+        choices: list[str] = ["DUANE", "DWAYNE", "DIXON", "DICKSONX", "dwayne", "DWAYN", "WAYNE", "", "DWAYNE"]
+        scores: list[float] = distance.get_jaro_winkler_similarity_many("DWAYNE", choices, decimals=6)
+        expected: list[tuple[float, int]] = sorted(((score, index) for index, score in enumerate(scores)), key=lambda x: -x[0])
+        self.assertEqual([(m.score, m.position) for m in distance.extract_best("DWAYNE", choices, k=4, decimals=6)], expected[:4])
+
+    def test_extract_best_ties_keep_choice_order(self) -> None:
+        self.assertEqual([m.position for m in distance.extract_best("abc", ["xyz", "abc", "abc", "abc"], k=2)], [1, 2])
+
+    def test_extract_best_min_score(self) -> None:
+        self.assertEqual(
+            distance.extract_best("MARTHA", ["MARHTA", "DWAYNE", "MART"], min_score=0.95), [distance.Match("MARHTA", 0.96, 0)]
+        )
+
+    def test_extract_best_fewer_than_k(self) -> None:
+        self.assertEqual(len(distance.extract_best("foo", iter(["foo", "bar"]), k=5)), 2)
+
+    def test_extract_best_zero_k(self) -> None:
+        self.assertEqual(distance.extract_best("foo", ["foo"], k=0), [])
+
+    def test_extract_best_norm_case(self) -> None:
+        self.assertEqual(
+            distance.extract_best("hello", ["HELLO", "help"], k=1, norm_case=True), [distance.Match("HELLO", 1.0, 0)]
+        )
+
+    def test_extract_best_scaling_too_high(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.extract_best("foo", ["bar"], scaling=0.3)
+
+    def test_extract_best_non_string(self) -> None:
+        with self.assertRaises(JaroDistanceError):
+            distance.extract_best("foo", ["bar", 1])  # type: ignore
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,106 @@
+import subprocess
+import sys
+import unittest
+
+from pyjarowinkler import glyph
+from pyjarowinkler._glyphs import AMBIGUOUS
+from pyjarowinkler.glyph import GlyphMap
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestGlyph(unittest.TestCase):
+    def _loaded_modules(self, statement: str, *modules: str) -> list[bool]:
+        # A fresh interpreter, modules imported by earlier tests would otherwise already be loaded.
+        check: str = f"{statement}; import sys; print(*(name in sys.modules for name in {modules!r}))"
+        output: str = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True).stdout
+        return [loaded == "True" for loaded in output.split()]
+
+    def test_ambiguous(self) -> None:
+        self.assertIs(glyph.AMBIGUOUS, AMBIGUOUS)
+        self.assertEqual(glyph.AMBIGUOUS[0x430], "a")
+
+    def test_unknown_attribute(self) -> None:
+        with self.assertRaises(AttributeError):
+            glyph.UNKNOWN  # noqa: B018
+
+    def test_import_leaves_table_unloaded(self) -> None:
+        self.assertEqual(
+            self._loaded_modules(
+                "from pyjarowinkler import distance; distance.get_jaro_winkler_similarity('Martha', 'MARHTA', norm_case=True)",
+                "pyjarowinkler._glyphs",
+                "numpy",
+                "concurrent.futures.process",
+            ),
+            [False, False, False],
+        )
+
+    def test_imports_leave_optional_modules_unloaded(self) -> None:
+        # Importing any public module must not load what only some calls need, short-lived processes would pay for it.
+        for module in (
+            "pyjarowinkler",
+            "pyjarowinkler.distance",
+            "pyjarowinkler.corpus",
+            "pyjarowinkler.aio",
+            "pyjarowinkler.cli",
+        ):
+            with self.subTest(module=module):
+                self.assertEqual(
+                    self._loaded_modules(
+                        f"import {module}", "pyjarowinkler._glyphs", "numpy", "concurrent.futures.process", "multiprocessing"
+                    ),
+                    [False, False, False, False],
+                )
+
+    def test_table_loaded_on_first_use(self) -> None:
+        self.assertEqual(
+            self._loaded_modules(
+                "from pyjarowinkler import distance; distance.get_jaro_similarity('p\\u0430ypal', 'paypal', norm_ambiguous=True)",
+                "pyjarowinkler._glyphs",
+            ),
+            [True],
+        )
+
+
+class TestGlyphMap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.glyphs: GlyphMap = GlyphMap([(0xC0, "AAB"), (0xC3, ("", "C")), (0xD0, "D")])
+        self.expected: dict[int, str] = {0xC0: "A", 0xC1: "A", 0xC2: "B", 0xC3: "", 0xC4: "C", 0xD0: "D"}
+
+    def test_mapping(self) -> None:
+        self.assertEqual(dict(self.glyphs.items()), self.expected)
+        self.assertEqual(list(self.glyphs), sorted(self.expected))
+        self.assertEqual(len(self.glyphs), 6)
+
+    def test_compact(self) -> None:
+        self.assertEqual(list(self.glyphs.starts), [0xC0, 0xC3, 0xD0])
+        self.assertEqual(list(self.glyphs.offsets), [0, 3, 5, 6])
+        self.assertEqual(self.glyphs.replacements, ("A", "B", "", "C", "D"))
+        self.assertEqual(list(self.glyphs.indexes), [0, 0, 1, 2, 3, 4])
+
+    def test_missing(self) -> None:
+        for code in (0x41, 0xBF, 0xC5, 0xCF, 0xD1):
+            with self.subTest(code=hex(code)), self.assertRaises(KeyError):
+                self.glyphs[code]
+        self.assertEqual(self.glyphs.get(0xC5, "?"), "?")
+
+    def test_translate(self) -> None:
+        word: str = "".join(map(chr, range(0xBE, 0xD2)))
+        self.assertEqual(word.translate(self.glyphs), word.translate(self.expected))
+        self.assertEqual(self.glyphs.translation_table(), self.expected)
+
+    def test_runs_out_of_order(self) -> None:
+        for runs in ([(0xD0, "D"), (0xC0, "A")], [(0xC0, "AB"), (0xC1, "B")]):
+            with self.subTest(runs=runs), self.assertRaises(ValueError):
+                GlyphMap(runs)
+
+    def test_ambiguous_table(self) -> None:
+        self.assertEqual(len(AMBIGUOUS), 1646)
+        self.assertEqual(len(AMBIGUOUS.replacements), 97)
+        self.assertEqual(AMBIGUOUS[0xFF21], "A")
+        self.assertEqual(AMBIGUOUS[0xFE4D], "")
+        self.assertEqual(AMBIGUOUS.translation_table(), dict(AMBIGUOUS.items()))
+
+
+if __name__ == "__main__":
+    unittest.main()
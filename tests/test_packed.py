@@ -0,0 +1,64 @@
+import unittest
+
+from pyjarowinkler.packed import PackedStrings
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestPackedStrings(unittest.TestCase):
+    def test_ascii(self) -> None:
+        packed: PackedStrings = PackedStrings(["hello", "", "world"])
+        self.assertEqual(packed.codes.typecode, "B")
+        self.assertEqual(packed.codes.tobytes(), b"helloworld")
+        self.assertEqual(list(packed.offsets), [0, 5, 5])
+        self.assertEqual(list(packed.lengths), [5, 0, 5])
+        self.assertEqual(len(packed), 3)
+        self.assertEqual(list(packed), ["hello", "", "world"])
+
+    def test_widened(self) -> None:
+        packed: PackedStrings = PackedStrings(["hello", "wörld", "\U0001f600\ud800"])
+        self.assertEqual(packed.codes.typecode, "I")
+        self.assertEqual(list(packed.codes[5:10]), [ord(character) for character in "wörld"])
+        self.assertEqual(list(packed), ["hello", "wörld", "\U0001f600\ud800"])
+
+    def test_view(self) -> None:
+        packed: PackedStrings = PackedStrings(["hello", "wörld"])
+        view: memoryview = packed.view(1)
+        self.assertEqual(list(view), [ord(character) for character in "wörld"])
+        self.assertIs(view.obj, packed.codes)
+
+    def test_append_after_view(self) -> None:
+        packed: PackedStrings = PackedStrings(["hello"])
+        packed.view(0)
+        packed.append("wörld")
+        self.assertEqual(packed[1], "wörld")
+        self.assertEqual(list(packed.view(0)), [ord(character) for character in "hello"])
+
+    def test_append_while_viewed(self) -> None:
+        packed: PackedStrings = PackedStrings(["hello"])
+        view: memoryview = packed.view(0)
+        codes: object = packed.codes
+        packed.append("world")
+        packed.append("w\u00f6rld")
+        self.assertEqual(list(view), [ord(character) for character in "hello"])
+        self.assertIsNot(packed.codes, codes)
+        self.assertEqual(list(packed), ["hello", "world", "w\u00f6rld"])
+        self.assertEqual(list(packed.view(1)), [ord(character) for character in "world"])
+
+    def test_from_buffers(self) -> None:
+        built: PackedStrings = PackedStrings(["hello", "wörld"])
+        packed: PackedStrings = PackedStrings.from_buffers(
+            memoryview(built.codes.tobytes()).cast("I"), memoryview(built.offsets), memoryview(built.lengths)
+        )
+        self.assertEqual(list(packed), ["hello", "wörld"])
+        self.assertEqual(list(packed.view(1)), [ord(character) for character in "wörld"])
+        with self.assertRaises(TypeError):
+            packed.append("again")
+
+    def test_out_of_range(self) -> None:
+        with self.assertRaises(IndexError):
+            PackedStrings(["hello"])[1]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from collections.abc import Sequence
+
+from pyjarowinkler import parallel
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+def _join(chunk: Sequence[str], separator: str) -> str:
+    return separator.join(chunk)
+
+
+class TestParallel(unittest.TestCase):
+    def test_get_chunk_size_spreads_over_workers(self) -> None:
+        self.assertEqual(parallel._get_chunk_size(100, 1000, 5), 5)
+
+    def test_get_chunk_size_minimum_comparisons(self) -> None:
+        self.assertEqual(parallel._get_chunk_size(100, 1, 5), parallel.__MIN_CHUNK_COMPARISONS__)
+
+    def test_get_chunk_size_no_comparison(self) -> None:
+        self.assertEqual(parallel._get_chunk_size(0, 0, 1), parallel.__MIN_CHUNK_COMPARISONS__)
+
+    def test_map_chunks_serial(self) -> None:
+        self.assertEqual(parallel._map_chunks(_join, "abc", 1, 1, "-"), ["a-b-c"])
+
+    def test_map_chunks_small(self) -> None:
+        self.assertEqual(parallel._map_chunks(_join, "abc", 1, 4, "-"), ["a-b-c"])
+
+    def test_map_chunks_keeps_order(self) -> None:
+        items: list[str] = [str(n % 10) for n in range(5000)]
+        chunks: list[str] = parallel._map_chunks(_join, items, 1, 2, "")
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual("".join(chunks), "".join(items))
+
+    def test_map_chunks_threads_keep_order(self) -> None:
+        items: list[str] = [str(n % 10) for n in range(5000)]
+        chunks: list[str] = parallel._map_chunks(_join, items, 1, 2, "", backend="thread")
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual("".join(chunks), "".join(items))
+
+    def test_map_chunks_backend_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            parallel._map_chunks(_join, "abc", 1, 1, "-", backend="fiber")
+
+    def test_map_chunks_workers_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            parallel._map_chunks(_join, "abc", 1, 0, "-")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from collections import Counter
+
+from pyjarowinkler import distance
+from pyjarowinkler.corpus import Corpus
+from pyjarowinkler.prefilter import CountPrefilter, MaskPrefilter, Prefilter
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+class TestMaskPrefilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.prefilter = MaskPrefilter()
+
+    def test_signature(self) -> None:
+        self.assertEqual(self.prefilter.signature("aa"), 1 << (ord("a") & 63))
+
+    def test_signature_empty(self) -> None:
+        self.assertEqual(self.prefilter.signature(""), 0)
+
+    def test_signatures(self) -> None:
+        signatures = self.prefilter.signatures(["ab", ""])
+        self.assertEqual(signatures.typecode, "Q")
+        self.assertEqual(list(signatures), [self.prefilter.signature("ab"), 0])
+
+    def test_max_matches(self) -> None:
+        self.assertEqual(self.prefilter.max_matches(self.prefilter.prepare("aab"), self.prefilter.signature("ax")), 2)
+
+    def test_max_matches_disjoint(self) -> None:
+        self.assertEqual(self.prefilter.max_matches(self.prefilter.prepare("abc"), self.prefilter.signature("xyz")), 0)
+
+    def test_max_matches_same_class(self) -> None:
+        self.assertEqual(self.prefilter.max_matches(self.prefilter.prepare("a"), self.prefilter.signature("!")), 1)
+
+    def test_rejects(self) -> None:
+        query = self.prefilter.prepare("abcdef")
+        self.assertTrue(self.prefilter.rejects(query, self.prefilter.signature("abcxyz"), 6, 6, 0.9))
+        self.assertFalse(self.prefilter.rejects(query, self.prefilter.signature("abcdfe"), 6, 6, 0.9))
+
+    def test_rejects_without_cutoff(self) -> None:
+        self.assertFalse(self.prefilter.rejects(self.prefilter.prepare("abc"), self.prefilter.signature("xyz"), 3, 3, 0.0))
+
+    def test_rejects_empty(self) -> None:
+        self.assertFalse(self.prefilter.rejects(self.prefilter.prepare(""), self.prefilter.signature(""), 0, 0, 0.9))
+
+
+class TestCountPrefilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.prefilter = CountPrefilter()
+
+    def test_signature(self) -> None:
+        self.assertEqual(self.prefilter.signature("aab"), Counter({"a": 2, "b": 1}))
+
+    def test_max_matches(self) -> None:
+        self.assertEqual(self.prefilter.max_matches(self.prefilter.prepare("aab"), self.prefilter.signature("ax")), 1)
+
+    def test_max_matches_is_bound(self) -> None:
+        pairs: list[tuple[str, str]] = [("MARTHA", "MARHTA"), ("DIXON", "DICKSONX"), ("aaab", "baaaa"), ("abc", "cba")]
+        for short, long in pairs:
+            with self.subTest(short=short, long=long):
+                matches, _ = distance._get_matches_and_transpositions(short, long)
+                self.assertGreaterEqual(
+                    self.prefilter.max_matches(self.prefilter.prepare(short), self.prefilter.signature(long)), matches
+                )
+                self.assertGreaterEqual(
+                    MaskPrefilter().max_matches(MaskPrefilter().prepare(short), MaskPrefilter().signature(long)), matches
+                )
+
+    def test_rejects(self) -> None:
+        self.assertTrue(self.prefilter.rejects(self.prefilter.prepare("aaaaaa"), self.prefilter.signature("abbbbb"), 6, 6, 0.8))
+
+
+class TestPrefilter(unittest.TestCase):
+    def test_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            Prefilter()  # type: ignore[abstract]
+
+    def test_incomplete_subclass(self) -> None:
+        class SignatureOnly(Prefilter[str, str]):
+            def signature(self, word: str) -> str:
+                return word
+
+        with self.assertRaises(TypeError):
+            Corpus(["MARTHA"], prefilter=SignatureOnly())  # type: ignore[abstract]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest import mock
+
+from pyjarowinkler import distance, vectorized
+
+__author__ = "Jean-Bernard Ratte - jean.bernard.ratte@unary.ca"
+
+
+@unittest.skipUnless(vectorized.__AVAILABLE__, "NumPy isn't installed")
+class TestVectorized(unittest.TestCase):
+    def _expected(self, short: str, long: str, scaling: float) -> float:
+        similarity: float = distance._similarity(short, long)
+        return similarity + (distance._get_prefix(short, long) * scaling * (1 - similarity))
+
+    def test_get_jaro_winkler_similarities(self) -> None:
+        shorts: list[str] = ["MARTHA", "DWAYNE", "ABCDEF", "AAAAAA", "FEDCBA", "PEN\U0001f58aLS"]
+        longs: list[str] = ["MARHTA", "DUANEX", "ABCDEF", "BBBBBB", "ABCDEF", "PENCIL"]
+        for scaling in (0.0, 0.1, 0.25):
+            with self.subTest(scaling=scaling):
+                self.assertEqual(
+                    vectorized.get_jaro_winkler_similarities(shorts, longs, scaling),
+                    [self._expected(short, long, scaling) for short, long in zip(shorts, longs, strict=True)],
+                )
+
+    def test_get_jaro_winkler_similarities_different_lengths(self) -> None:
+        shorts: list[str] = ["aaab", "abcd", "dixo", "\ud800abc"]
+        longs: list[str] = ["baaaaaaa", "dcbaabcd", "dicksonx", "\ud800abcxxxx"]
+        self.assertEqual(
+            vectorized.get_jaro_winkler_similarities(shorts, longs, 0.1),
+            [self._expected(short, long, 0.1) for short, long in zip(shorts, longs, strict=True)],
+        )
+
+    def test_batch_same_as_pure_python(self) -> None:
+        words: list[str] = [f"{first}{n % 7}" for n in range(40) for first in ("MARTHA", "MARHTA", "DWAYNE", "DUANE", "")]
+        vectorized_scores = distance.cdist(words, words, metric="jaro_winkler_distance", decimals=15)
+        with mock.patch.object(vectorized, "__AVAILABLE__", False):
+            self.assertEqual(distance.cdist(words, words, metric="jaro_winkler_distance", decimals=15), vectorized_scores)
+
+    def test_batch_many_same_as_pure_python(self) -> None:
+        candidates: list[str] = [f"MARTHA{n}" for n in range(100)]
+        vectorized_scores: list[float] = distance.get_jaro_similarity_many("MARHTA1", candidates, decimals=15)
+        with mock.patch.object(vectorized, "__AVAILABLE__", False):
+            self.assertEqual(distance.get_jaro_similarity_many("MARHTA1", candidates, decimals=15), vectorized_scores)
+
+
+class TestVectorizedMissing(unittest.TestCase):
+    def test_get_jaro_winkler_similarities_without_numpy(self) -> None:
+        with mock.patch.object(vectorized, "__AVAILABLE__", False), self.assertRaises(ImportError):
+            vectorized.get_jaro_winkler_similarities(["a"], ["a"], 0.1)
+
+    @unittest.skipUnless(vectorized.__AVAILABLE__, "NumPy isn't installed")
+    def test_numpy_imported_on_first_use(self) -> None:
+        with mock.patch.object(vectorized, "np", None):
+            self.assertEqual(vectorized.get_jaro_winkler_similarities(["a"], ["a"], 0.1), [1.0])
+            self.assertIsNotNone(vectorized.np)
+
+    def test_broken_numpy_falls_back_to_pure_python(self) -> None:
+        candidates: list[str] = [f"MARTHA{n}" for n in range(100)]
+        with mock.patch.object(vectorized, "__AVAILABLE__", False):
+            expected: list[float] = distance.get_jaro_similarity_many("MARHTA1", candidates, decimals=15)
+
+        with (
+            mock.patch.object(vectorized, "__AVAILABLE__", True),
+            mock.patch.object(vectorized, "np", None),
+            mock.patch.object(vectorized, "import_module", side_effect=ImportError("numpy is broken")),
+        ):
+            self.assertEqual(distance.get_jaro_similarity_many("MARHTA1", candidates, decimals=15), expected)
+            self.assertFalse(vectorized.is_available())
+            with self.assertRaises(ImportError):
+                vectorized.get_jaro_winkler_similarities(["a"], ["a"], 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()